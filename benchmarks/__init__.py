@@ -0,0 +1,3 @@
+"""
+Suite de benchmarks des algorithmes (python -m benchmarks)
+"""
@@ -0,0 +1,90 @@
+"""
+Benchmarks en ligne de commande
+
+Usage:
+    python -m benchmarks run --suite standard -o data/results/benchmarks.json \\
+        --baseline benchmarks/baseline.json
+    python -m benchmarks compare benchmarks/baseline.json data/results/benchmarks.json
+
+Le code de sortie vaut 1 si la comparaison à la référence signale des régressions.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.compare import (DEFAULT_TOLERANCE, QUALITY_TOLERANCE, compare,
+                                format_comparison)
+from benchmarks.suite import MAX_EVALUATIONS, SUITES, TIME_LIMIT, run_suite
+from src.registry import ALGORITHMS, PROBLEMS, to_jsonable
+
+
+def _load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save(report: dict, path: str):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(to_jsonable(report), f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _compare(baseline: dict, current: dict, args) -> int:
+    comparison = compare(baseline, current, args.tolerance, args.quality_tolerance)
+    print(format_comparison(comparison))
+    return 1 if comparison['regressions'] else 0
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description="Suite de benchmarks: débit, temps jusqu'à la cible, mémoire")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="exécute la suite")
+    run.add_argument('--suite', choices=sorted(SUITES), default='standard')
+    run.add_argument('-a', '--algorithm', action='append', choices=sorted(ALGORITHMS),
+                     help="algorithme à mesurer (répétable; défaut: tous)")
+    run.add_argument('-p', '--problem', action='append', choices=sorted(PROBLEMS),
+                     help="famille d'instances (répétable; défaut: toutes)")
+    run.add_argument('--repeats', type=int, default=3, help="graines par mesure")
+    run.add_argument('--max-evaluations', type=int, default=MAX_EVALUATIONS)
+    run.add_argument('--time-limit', type=float, default=TIME_LIMIT)
+    run.add_argument('--no-memory', action='store_true',
+                     help="sans mesure du pic mémoire (une exécution de moins)")
+    run.add_argument('-o', '--output', default='data/results/benchmarks.json')
+    run.add_argument('--baseline', help="rapport de référence à comparer")
+
+    diff = commands.add_parser('compare', help="compare deux rapports")
+    diff.add_argument('baseline')
+    diff.add_argument('current')
+
+    for command in (run, diff):
+        command.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                             help="écart relatif toléré sur les temps, débits et mémoire")
+        command.add_argument('--quality-tolerance', type=float, default=QUALITY_TOLERANCE,
+                             help="écart relatif toléré sur la meilleure valeur")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    if args.command == 'compare':
+        return _compare(_load(args.baseline), _load(args.current), args)
+
+    baseline = _load(args.baseline) if args.baseline else None
+    report = run_suite(args.suite, args.algorithm, args.problem, args.repeats,
+                       args.max_evaluations, args.time_limit, not args.no_memory)
+    _save(report, args.output)
+    print(f"résultats: {args.output}", file=sys.stderr)
+    if baseline is not None:
+        return _compare(baseline, report, args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
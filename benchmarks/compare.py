@@ -0,0 +1,121 @@
+"""
+Comparaison de deux rapports de la suite: régressions par rapport à une référence
+"""
+
+from typing import Dict, List, Tuple
+
+# Sens d'amélioration des mesures comparées
+DIRECTIONS = {
+    'evaluations_per_sec': 'higher',
+    'work_per_sec': 'higher',
+    'time_to_target': 'lower',
+    'evaluations_to_target': 'lower',
+    'peak_memory': 'lower',
+    'best_value': 'higher',
+}
+
+# Écart relatif toléré (bruit de mesure); la qualité est plus stricte
+DEFAULT_TOLERANCE = 0.10
+QUALITY_TOLERANCE = 0.01
+
+# En dessous de cette durée (s), les écarts de temps et de débit ne sont
+# que du bruit (Hill Climbing s'arrête souvent en quelques évaluations)
+TIME_FLOOR = 0.01
+
+
+def _key(record: dict) -> Tuple[str, str]:
+    return record['instance'], record['algorithm']
+
+
+def _change(metric: str, old: float, new: float) -> float:
+    """Écart relatif signé: positif = dégradation"""
+    scale = abs(old) or 1.0
+    if DIRECTIONS[metric] == 'higher':
+        return (old - new) / scale
+    return (new - old) / scale
+
+
+def compare(baseline: dict, current: dict, tolerance: float = DEFAULT_TOLERANCE,
+            quality_tolerance: float = QUALITY_TOLERANCE) -> Dict[str, list]:
+    """
+    Compare `current` à `baseline` (rapports de run_suite)
+    Retourne {'regressions', 'improvements', 'missing', 'warnings'}; chaque
+    écart est {'instance', 'algorithm', 'metric', 'baseline', 'current', 'change'}
+    """
+    warnings = []
+    for key in ('platform', 'processor', 'cpu_count', 'python', 'numpy'):
+        old, new = baseline['environment'].get(key), current['environment'].get(key)
+        if old != new:
+            warnings.append(f"{key} différent: {old} -> {new}")
+    for key in ('max_evaluations', 'time_limit', 'instance_seed', 'target_quality'):
+        old, new = baseline['config'].get(key), current['config'].get(key)
+        if old != new:
+            warnings.append(f"configuration différente ({key}): {old} -> {new}")
+
+    reference = {_key(record): record for record in baseline['results']}
+    regressions, improvements = [], []
+    seen = set()
+    for record in current['results']:
+        key = _key(record)
+        old_record = reference.get(key)
+        if old_record is None:
+            continue
+        seen.add(key)
+        same_target = old_record['target'] == record['target']
+
+        for metric in DIRECTIONS:
+            old, new = old_record.get(metric), record.get(metric)
+            if metric.endswith('_to_target') and not same_target:
+                continue
+            if old is None or new is None:
+                if metric.endswith('_to_target') and old is not None:
+                    # Cible atteinte par la référence, plus maintenant
+                    regressions.append({'instance': key[0], 'algorithm': key[1],
+                                        'metric': metric, 'baseline': old,
+                                        'current': None, 'change': None})
+                continue
+            if metric == 'time_to_target' and max(old, new) < TIME_FLOOR:
+                continue
+            if (metric in ('evaluations_per_sec', 'work_per_sec') and
+                    max(old_record['execution_time'], record['execution_time']) < TIME_FLOOR):
+                continue
+            change = _change(metric, old, new)
+            limit = quality_tolerance if metric == 'best_value' else tolerance
+            entry = {'instance': key[0], 'algorithm': key[1], 'metric': metric,
+                     'baseline': old, 'current': new, 'change': change}
+            if change > limit:
+                regressions.append(entry)
+            elif change < -limit:
+                improvements.append(entry)
+
+    missing = [f"{instance}/{algorithm}" for instance, algorithm in reference
+               if (instance, algorithm) not in seen]
+    return {'regressions': regressions, 'improvements': improvements,
+            'missing': missing, 'warnings': warnings}
+
+
+def _number(value) -> str:
+    return '-' if value is None else f"{value:.6g}"
+
+
+def _format_entry(entry: dict) -> str:
+    if entry['change'] is None:
+        change = 'cible non atteinte'
+    else:
+        # Variation de la mesure elle-même (signe de l'écart relatif)
+        sign = -1 if DIRECTIONS[entry['metric']] == 'higher' else 1
+        change = f"{sign * entry['change']:+.1%}"
+    return (f"  {entry['instance']:>14} {entry['algorithm']:<20} {entry['metric']:<22} "
+            f"{_number(entry['baseline']):>12} -> {_number(entry['current']):<12} ({change})")
+
+
+def format_comparison(comparison: dict) -> str:
+    """Rapport texte d'une comparaison"""
+    lines = [f"attention: {warning}" for warning in comparison['warnings']]
+    for title, key in (('Régressions', 'regressions'), ('Améliorations', 'improvements')):
+        entries: List[dict] = comparison[key]
+        lines.append(f"{title}: {len(entries)}")
+        lines.extend(_format_entry(entry) for entry in entries)
+    if comparison['missing']:
+        lines.append(f"Absents de la mesure: {', '.join(comparison['missing'])}")
+    return '\n'.join(lines)
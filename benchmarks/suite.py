@@ -0,0 +1,269 @@
+"""
+Suite de référence: instances fixes de taille croissante, mesurées pour
+chaque algorithme du registre
+
+Par couple (instance, algorithme), avec les graines 0..repeats-1:
+- débit: évaluations/s sous un budget fixe d'évaluations (et de temps), et
+  unités de travail/s (`work_per_sec`): évaluations pour les métaheuristiques,
+  nœuds pour Branch & Bound, cases de la table pour la programmation dynamique
+- temps jusqu'à la cible: arrêt dès `target` atteint (Termination.target);
+  les évaluations nécessaires sont déterministes à graine fixée
+- mémoire: pic des allocations Python et NumPy du solveur (tracemalloc),
+  mesuré dans une exécution à part pour ne pas fausser les temps
+Les durées retenues sont des médianes.
+"""
+
+import datetime
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.algorithms.termination import Termination
+from src.registry import ALGORITHMS, make_algorithm, make_problem
+
+# Tailles des instances de chaque suite
+SUITES = {
+    'quick': {'knapsack': (50, 200), 'tsp': (20, 100)},
+    'standard': {'knapsack': (50, 200, 1000, 5000), 'tsp': (20, 100, 500, 2000)},
+}
+
+# Graine des instances (générées par generate_random)
+INSTANCE_SEED = 2024
+
+# Options des problèmes (voisinages restreints pour le TSP)
+PROBLEM_OPTIONS = {
+    'knapsack': {},
+    'tsp': {'neighborhood': 'knn'},
+}
+
+# Algorithmes exacts, propres au sac à dos
+KNAPSACK_ONLY = ('branch_and_bound', 'dynamic_programming')
+
+# Sans budget d'évaluations: la programmation dynamique n'évalue aucune
+# solution et refuse ce critère
+NO_EVALUATION_BUDGET = ('dynamic_programming',)
+
+# Unité de travail des algorithmes exacts (champ du résultat); les autres
+# comptent les évaluations
+WORK_UNITS = {
+    'branch_and_bound': 'nodes_explored',
+    'dynamic_programming': 'cells',
+}
+
+# Plafonds internes levés: le budget de la suite décide de l'arrêt
+# (Hill Climbing s'arrête toujours au premier optimum local)
+UNBOUNDED = 10 ** 9
+ALGORITHM_PARAMS = {
+    'simulated_annealing': {'min_temp': 1e-12},
+    'tabu_search': {'max_iterations': UNBOUNDED},
+    'genetic_algorithm': {'generations': UNBOUNDED},
+    'vectorized_ga': {'generations': UNBOUNDED},
+    'island_ga': {'generations': UNBOUNDED},
+}
+
+# Cible du temps jusqu'à la cible, en fraction de la référence: optimum du
+# sac à dos (programmation dynamique), tour du plus proche voisin du TSP
+TARGET_QUALITY = {
+    'knapsack': 0.99,
+    'tsp': 1.0,
+}
+
+# Budget de chaque exécution
+MAX_EVALUATIONS = 50_000
+TIME_LIMIT = 5.0
+
+# Version du format des fichiers de résultats
+FORMAT_VERSION = 1
+
+
+def instances(suite: str = 'standard',
+              problems: Optional[Sequence[str]] = None) -> List[dict]:
+    """Instances de la suite: {'id', 'problem', 'size', 'spec'}"""
+    if suite not in SUITES:
+        raise ValueError(f"suite inconnue: {suite} (choix: {', '.join(SUITES)})")
+    selected = []
+    for kind, sizes in SUITES[suite].items():
+        if problems and kind not in problems:
+            continue
+        for n in sizes:
+            spec = {'type': kind, 'random': {'n': n, 'seed': INSTANCE_SEED},
+                    **PROBLEM_OPTIONS[kind]}
+            selected.append({'id': f"{kind}-{n}", 'problem': kind, 'size': n, 'spec': spec})
+    return selected
+
+
+def nearest_neighbor_tour(problem) -> List[int]:
+    """Tour glouton du plus proche voisin depuis la ville 0"""
+    unvisited = np.ones(problem.n, dtype=bool)
+    unvisited[0] = False
+    tour = [0]
+    for _ in range(problem.n - 1):
+        candidates = np.flatnonzero(unvisited)
+        distances = problem.distances.gather(np.full(len(candidates), tour[-1]), candidates)
+        city = int(candidates[np.argmin(distances)])
+        unvisited[city] = False
+        tour.append(city)
+    return tour
+
+
+def reference_value(kind: str, problem) -> float:
+    """Valeur de référence de l'instance (indépendante des métaheuristiques)"""
+    if kind == 'knapsack':
+        return make_algorithm('dynamic_programming', problem).run()['best_value']
+    return problem.evaluate(nearest_neighbor_tour(problem))
+
+
+def target_value(kind: str, reference: float) -> float:
+    """Cible à TARGET_QUALITY de la référence (valeurs maximisées, TSP négatif)"""
+    return reference - (1 - TARGET_QUALITY[kind]) * abs(reference)
+
+
+def _run(name: str, problem, seed: int, **budget) -> dict:
+    if name in NO_EVALUATION_BUDGET:
+        budget.pop('max_evaluations', None)
+    return make_algorithm(name, problem, ALGORITHM_PARAMS.get(name), seed,
+                          Termination(**budget)).run()
+
+
+def peak_memory(name: str, problem, seed: int = 0, **budget) -> int:
+    """Pic des allocations (octets) pendant une exécution, problème exclu"""
+    tracemalloc.start()
+    try:
+        _run(name, problem, seed, **budget)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def work_rate(name: str, result: dict) -> float:
+    """Unités de travail (WORK_UNITS) par seconde d'une exécution"""
+    if name not in WORK_UNITS:
+        return result['evaluations_per_sec']
+    elapsed = result['execution_time']
+    return result[WORK_UNITS[name]] / elapsed if elapsed > 0 else 0.0
+
+
+def measure(name: str, problem, target: float, repeats: int = 3,
+            max_evaluations: int = MAX_EVALUATIONS, time_limit: float = TIME_LIMIT,
+            memory: bool = True) -> dict:
+    """Mesures d'un algorithme sur une instance (médianes sur `repeats` graines)"""
+    budget = {'max_evaluations': max_evaluations, 'time_limit': time_limit}
+    runs = [_run(name, problem, seed, **budget) for seed in range(repeats)]
+    to_target = [_run(name, problem, seed, target=target, **budget)
+                 for seed in range(repeats)]
+    # Les algorithmes exacts ne consultent pas la cible: fin au-dessus = atteinte
+    reached = [r for r in to_target if r['best_value'] >= target]
+    all_reached = len(reached) == repeats
+
+    return {
+        'evaluations_per_sec': statistics.median(r['evaluations_per_sec'] for r in runs),
+        'work_unit': WORK_UNITS.get(name, 'evaluations'),
+        'work_per_sec': statistics.median(work_rate(name, r) for r in runs),
+        'execution_time': statistics.median(r['execution_time'] for r in runs),
+        'evaluations': statistics.median(r['evaluations'] for r in runs),
+        'best_value': statistics.median(r['best_value'] for r in runs),
+        'stop_reason': runs[0]['stop_reason'],
+        'target': target,
+        'target_reached': len(reached) / repeats,
+        # Non défini si une graine n'atteint pas la cible dans le budget
+        'time_to_target': (statistics.median(r['execution_time'] for r in reached)
+                           if all_reached else None),
+        'evaluations_to_target': (statistics.median(r['evaluations'] for r in reached)
+                                  if all_reached else None),
+        'peak_memory': peak_memory(name, problem, **budget) if memory else None,
+    }
+
+
+def scaling_curves(results: List[dict]) -> Dict[str, Dict[str, dict]]:
+    """
+    Courbes de passage à l'échelle: {problème: {algorithme: {'sizes', ...}}}
+    `exponent`: pente log-log du temps par unité de travail en fonction de n
+    """
+    curves: Dict[str, Dict[str, dict]] = {}
+    for record in sorted(results, key=lambda r: r['size']):
+        curve = curves.setdefault(record['problem'], {}).setdefault(
+            record['algorithm'], {'sizes': [], 'evaluations_per_sec': [], 'work_per_sec': [],
+                                  'execution_time': [], 'time_to_target': [],
+                                  'peak_memory': []})
+        curve['sizes'].append(record['size'])
+        for key in ('evaluations_per_sec', 'work_per_sec', 'execution_time',
+                    'time_to_target', 'peak_memory'):
+            curve[key].append(record[key])
+
+    for by_algorithm in curves.values():
+        for curve in by_algorithm.values():
+            points = [(math.log(n), -math.log(rate))
+                      for n, rate in zip(curve['sizes'], curve['work_per_sec'])
+                      if rate > 0]
+            curve['exponent'] = (float(np.polyfit(*zip(*points), 1)[0])
+                                 if len(points) >= 2 else None)
+    return curves
+
+
+def environment() -> dict:
+    """Machine et version du code (les mesures ne se comparent qu'à l'identique)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True, timeout=10,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit or None,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run_suite(suite: str = 'standard', algorithms: Optional[Sequence[str]] = None,
+              problems: Optional[Sequence[str]] = None, repeats: int = 3,
+              max_evaluations: int = MAX_EVALUATIONS, time_limit: float = TIME_LIMIT,
+              memory: bool = True, log: Optional[Callable[[str], None]] = None) -> dict:
+    """Exécute la suite et retourne le rapport (sérialisable en JSON)"""
+    algorithms = list(algorithms or ALGORITHMS)
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise ValueError(f"algorithme inconnu: {name} (choix: {', '.join(ALGORITHMS)})")
+    log = log or (lambda message: print(message, file=sys.stderr))
+
+    results = []
+    for instance in instances(suite, problems):
+        kind = instance['problem']
+        problem = make_problem(instance['spec'])
+        reference = reference_value(kind, problem)
+        target = target_value(kind, reference)
+        for name in algorithms:
+            if kind != 'knapsack' and name in KNAPSACK_ONLY:
+                continue
+            record = measure(name, problem, target, repeats, max_evaluations,
+                             time_limit, memory)
+            record.update({'instance': instance['id'], 'problem': kind,
+                           'size': instance['size'], 'algorithm': name,
+                           'reference': reference})
+            results.append(record)
+            ttt = record['time_to_target']
+            log(f"{instance['id']:>14} {name:<20} "
+                f"{record['work_per_sec']:>14,.0f} {record['work_unit'] + '/s':<17} "
+                f"cible {'-' if ttt is None else f'{ttt:.3f}s':>8}  "
+                f"mémoire {(record['peak_memory'] or 0) / 1024:>9,.0f} Kio")
+
+    return {
+        'version': FORMAT_VERSION,
+        'environment': environment(),
+        'config': {'suite': suite, 'repeats': repeats, 'max_evaluations': max_evaluations,
+                   'time_limit': time_limit, 'instance_seed': INSTANCE_SEED,
+                   'target_quality': TARGET_QUALITY},
+        'results': results,
+        'scaling': scaling_curves(results),
+    }
@@ -1,57 +1,58 @@
 """
 Comprehensive comparison across multiple instances
+
+The instance × algorithm grid runs through the experiment harness
+(src/experiments.py): cells are solved in parallel and stored one by one in
+data/results/experiments.db, so an interrupted run resumes where it stopped.
 """
 
+import os
+
 import pandas as pd
-from src.problems.knapsack import KnapsackProblem
-from src.algorithms.hill_climbing import HillClimbing
-from src.algorithms.simulated_annealing import SimulatedAnnealing
-from src.algorithms.tabu_search import TabuSearch
-from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.experiments import ResultStore, expand, run_experiment
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+RESULTS_DIR = 'data/results'
+DATABASE = os.path.join(RESULTS_DIR, 'experiments.db')
+
+
+def make_plan(num_instances=5, problem_size=20):
+    """Declarative grid: random instances, algorithms and their parameters"""
+    return {
+        'name': f'compare_all-{problem_size}',
+        'problems': [{'id': 'knapsack', 'type': 'knapsack',
+                      'random': {'n': problem_size, 'seed': 0},
+                      'instances': num_instances}],
+        'algorithms': [
+            {'label': 'Hill Climbing', 'algorithm': 'hill_climbing',
+             'params': {'max_iterations': 500}},
+            {'label': 'Simulated Annealing', 'algorithm': 'simulated_annealing'},
+            {'label': 'Tabu Search', 'algorithm': 'tabu_search',
+             'params': {'max_iterations': 300}},
+            {'label': 'Genetic Algorithm', 'algorithm': 'genetic_algorithm',
+             'params': {'generations': 100}},
+        ],
+        'seeds': 1,
+    }
 
-def run_experiments(num_instances=5, problem_size=20):
-    """Run experiments across multiple instances"""
-
-    results_data = []
-
-    for instance_id in range(num_instances):
-        print(f"\n{'=' * 60}")
-        print(f"Instance {instance_id + 1}/{num_instances}")
-        print('=' * 60)
 
-        # Generate an instance
-        problem = KnapsackProblem.generate_random(
-            n=problem_size,
-            seed=instance_id
-        )
-
-        # Algorithms to test
-        algorithms = [
-            ('Hill Climbing', HillClimbing(problem, max_iterations=500)),
-            ('Simulated Annealing', SimulatedAnnealing(problem)),
-            ('Tabu Search', TabuSearch(problem, max_iterations=300)),
-            ('Genetic Algorithm', GeneticAlgorithm(problem, generations=100)),
-        ]
-
-        # Run each algorithm
-        for algo_name, algo in algorithms:
-            print(f"  {algo_name}...", end=' ')
-            result = algo.run()
-
-            results_data.append({
-                'Instance': instance_id,
-                'Algorithm': algo_name,
-                'Value': result['best_value'],
-                'Time': result['execution_time'],
-                'Iterations': result['iterations']
-            })
+def run_experiments(num_instances=5, problem_size=20):
+    """Run (or resume) the experiments and load the stored results"""
+    plan = make_plan(num_instances, problem_size)
+    run_experiment(plan, DATABASE)
 
-            print(f"({result['best_value']:.1f})")
+    cells = {cell['cell_id'] for cell in expand(plan)}
+    with ResultStore(DATABASE) as store:
+        rows = store.rows(plan['name'], cells)
 
-    return pd.DataFrame(results_data)
+    return pd.DataFrame([{
+        'Instance': row['problem_id'],
+        'Algorithm': row['label'],
+        'Value': row['best_value'],
+        'Time': row['execution_time'],
+        'Iterations': row['iterations'],
+    } for row in rows if row['error'] is None])
 
 
 def analyze_results(df):
@@ -106,7 +107,7 @@ def analyze_results(df):
     axes[1, 1].set_title('Average Performance', fontweight='bold')
 
     plt.tight_layout()
-    plt.savefig('data/results/statistical_analysis.png', dpi=300)
+    plt.savefig(os.path.join(RESULTS_DIR, 'statistical_analysis.png'), dpi=300)
     plt.show()
 
 
@@ -118,15 +119,16 @@ def main():
     # Run experiments
     df = run_experiments(num_instances=10, problem_size=20)
 
-    # Save results
-    df.to_csv('data/results/all_results.csv', index=False)
-    print("\nResults saved: data/results/all_results.csv")
+    # Save results (the database keeps every run)
+    df.to_csv(os.path.join(RESULTS_DIR, 'all_results.csv'), index=False)
+    print(f"\nResults saved: {DATABASE}, {RESULTS_DIR}/all_results.csv")
 
     # Analyze
     analyze_results(df)
 
     print("\nAnalysis completed!")
     print("Generated files:")
+    print(f"   - {DATABASE}")
     print("   - data/results/all_results.csv")
     print("   - data/results/statistical_analysis.png")
 
@@ -0,0 +1,192 @@
+"""
+Résolution par lots: instances JSONL -> résultats JSONL
+
+Usage:
+    python -m src instances.jsonl -o results.jsonl -a simulated_annealing \\
+        --params '{"cooling_rate": 0.99}' --time-limit 1 -j 8 --resume
+
+Chaque ligne d'entrée est une tâche {'id', 'problem', 'algorithm', 'params',
+'seed', 'termination'} ou directement un problème {'id', 'type', ...} (voir
+src/registry.py). Les options de la ligne de commande servent de valeurs par
+défaut; sans 'id', le numéro de ligne sert d'identifiant.
+Les résultats sont écrits dans l'ordre où ils se terminent, une ligne par
+instance ({'id', ...résultat de run()} ou {'id', 'error'}). Avec --resume,
+les instances en erreur sont retentées.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                as_completed, wait)
+from itertools import islice
+from typing import Iterator, List, Set, Tuple
+
+from src.registry import ALGORITHMS, TERMINATION_KEYS, build_job, to_jsonable
+
+# Paquets envoyés en avance par processus (mémoire bornée)
+PENDING_PER_WORKER = 4
+
+
+def _jobs(lines, defaults: dict, done: Set[str]) -> Iterator[Tuple[str, object]]:
+    """(id, tâche ou message d'erreur) des lignes pas encore résolues"""
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            job_id = str(number)
+            if job_id not in done:
+                yield job_id, f"JSON invalide: {exc}"
+            continue
+        if not isinstance(record, dict):
+            if str(number) not in done:
+                yield str(number), "la ligne doit être un objet JSON"
+            continue
+
+        job_id = str(record.pop('id', number))
+        if job_id in done:
+            continue
+        job = dict(defaults)
+        if 'problem' in record:
+            if 'algorithm' in record:
+                job['params'] = {}  # Paramètres par défaut propres à l'algorithme par défaut
+            job.update(record)
+        else:
+            job['problem'] = record
+        yield job_id, job
+
+
+def _solve(chunk: List[Tuple[str, object]]) -> Tuple[List[str], int]:
+    """Résout un paquet de tâches: (lignes de sortie encodées, nombre d'erreurs)"""
+    lines, failed = [], 0
+    for job_id, job in chunk:
+        if isinstance(job, str):
+            output = {'id': job_id, 'error': job}
+        else:
+            try:
+                result = build_job(job).run()
+                output = {'id': job_id, **to_jsonable(result)}
+            except Exception as exc:
+                output = {'id': job_id, 'error': f"{type(exc).__name__}: {exc}"}
+        failed += 'error' in output
+        lines.append(json.dumps(output) + '\n')
+    return lines, failed
+
+
+def _done_ids(path: str) -> Set[str]:
+    """Identifiants déjà résolus (sans erreur) dans un fichier de sortie"""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    line = ''  # Fichier vide: première exécution interrompue
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Ligne tronquée par une interruption
+            if 'error' not in record:
+                done.add(str(record['id']))
+        truncated = line and not line.endswith('\n')
+    if truncated:
+        # Les résultats suivants commencent sur une nouvelle ligne
+        with open(path, 'a') as f:
+            f.write('\n')
+    return done
+
+
+def _chunks(jobs: Iterator, size: int) -> Iterator[list]:
+    while True:
+        chunk = list(islice(jobs, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description="Résout un flux d'instances JSONL et écrit les résultats en JSONL")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="fichier JSONL d'instances ('-' pour stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="fichier JSONL de résultats ('-' pour stdout)")
+    parser.add_argument('-a', '--algorithm', choices=sorted(ALGORITHMS),
+                        default='simulated_annealing')
+    parser.add_argument('--params', type=json.loads, default={},
+                        help="paramètres de l'algorithme (objet JSON)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--time-limit', type=float, default=None)
+    parser.add_argument('--max-evaluations', type=int, default=None)
+    parser.add_argument('--target', type=float, default=None)
+    parser.add_argument('--patience', type=int, default=None)
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help="processus de travail (0: dans le processus courant)")
+    parser.add_argument('--chunk-size', type=int, default=1,
+                        help="instances par envoi à un processus (petites instances)")
+    parser.add_argument('--resume', action='store_true',
+                        help="ignore les identifiants déjà présents dans la sortie")
+    args = parser.parse_args(argv)
+    if args.resume and args.output == '-':
+        parser.error("--resume exige un fichier de sortie (-o)")
+    return args
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    termination = {key: getattr(args, key) for key in TERMINATION_KEYS
+                   if getattr(args, key) is not None}
+    defaults = {'algorithm': args.algorithm, 'params': args.params,
+                'seed': args.seed, 'termination': termination}
+    done = _done_ids(args.output) if args.resume else set()
+
+    source = sys.stdin if args.input == '-' else open(args.input)
+    sink = sys.stdout if args.output == '-' else open(args.output, 'a' if args.resume else 'w')
+    chunks = _chunks(_jobs(source, defaults, done), max(1, args.chunk_size))
+    written = failed = 0
+    start_time = time.perf_counter()
+
+    def write(output: Tuple[List[str], int]):
+        nonlocal written, failed
+        lines, errors = output
+        sink.writelines(lines)
+        sink.flush()
+        written += len(lines)
+        failed += errors
+
+    try:
+        if args.workers == 0:
+            for chunk in chunks:
+                write(_solve(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                pending = set()
+                for chunk in chunks:
+                    pending.add(executor.submit(_solve, chunk))
+                    if len(pending) >= args.workers * PENDING_PER_WORKER:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            write(future.result())
+                for future in as_completed(pending):
+                    write(future.result())
+    except KeyboardInterrupt:
+        print("interrompu: relancer avec --resume pour continuer", file=sys.stderr)
+        return 130
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        elapsed = time.perf_counter() - start_time
+        print(f"{written} instances résolues ({failed} en erreur), "
+              f"{len(done)} déjà présentes, {elapsed:.1f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
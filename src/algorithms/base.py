@@ -3,44 +3,121 @@ Classe de base pour tous les algorithmes
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Tuple, List
+from typing import Any, Generator, List, Tuple
 import time
+
+import numpy as np
+
 from src.problems.base import OptimizationProblem
+from src.utils.rng import python_rng, seed_sequence, spawn_seeds
+from src.utils.logger import NULL_CHANNEL, Telemetry
+from src.utils.timer import NULL_PROFILER, Profiler
+from .stream import SolverStream
+from .termination import Termination
 
 
 class Algorithm(ABC):
     """Classe de base pour tous les algorithmes d'optimisation"""
 
-    def __init__(self, problem: OptimizationProblem, name: str):
+    def __init__(self, problem: OptimizationProblem, name: str, seed: int = None,
+                 termination: Termination = None):
         self.problem = problem
         self.name = name
+        # Flux aléatoires propres à l'algorithme (aucun état global partagé)
+        self.seed = seed
+        self.seed_sequence = seed_sequence(seed)
+        self.rng = python_rng(self.seed_sequence)
+        self.np_rng = np.random.default_rng(self.seed_sequence)
+        # Budget (temps, évaluations, cible, stagnation), vérifié par steps()
+        self.termination = termination if termination is not None else Termination()
+        # Instrumentation (compteurs, phases), active seulement via run(profile=True)
+        self.profiler = NULL_PROFILER
+        # Événements de progression, actifs seulement via run(telemetry=...)
+        self.progress = NULL_CHANNEL
         self.best_solution = None
         self.best_value = -float('inf')
         self.convergence_history = []
         self.execution_time = 0.0
 
     @abstractmethod
-    def solve(self) -> Tuple[Any, float]:
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
         """
-        Résout le problème
+        Générateur de l'algorithme: produit (valeur_courante, meilleure_valeur)
+        à chaque itération de la boucle principale qui ne s'arrête pas
         Returns: (meilleure_solution, meilleure_valeur)
         """
         pass
 
-    def run(self) -> dict:
-        """Exécute l'algorithme et retourne les résultats"""
-        start_time = time.time()
-        self.best_solution, self.best_value = self.solve()
-        self.execution_time = time.time() - start_time
+    def solve(self) -> Tuple[Any, float]:
+        """
+        Résout le problème (steps() jusqu'au bout)
+        Returns: (meilleure_solution, meilleure_valeur)
+        """
+        steps = self.steps()
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
 
-        return {
+    def spawn_seeds(self, n: int) -> List[int]:
+        """Graines de n flux enfants indépendants (travailleurs parallèles)"""
+        return spawn_seeds(self.seed_sequence, n)
+
+    def iterate(self, profile: bool = False, telemetry: Telemetry = None,
+                every: int = 1) -> SolverStream:
+        """
+        Exécution pas à pas: itérateur de Snapshot (SolverStream)
+        Le résultat de run() est dans `stream.result` à la fin de l'itération.
+        """
+        self.profiler = Profiler() if profile else NULL_PROFILER
+        self.progress = telemetry.channel(self.name) if telemetry is not None else NULL_CHANNEL
+        self.termination.start()
+        return SolverStream(self, self._execute(profile), every)
+
+    def run(self, profile: bool = False, telemetry: Telemetry = None) -> dict:
+        """
+        Exécute l'algorithme et retourne les résultats
+        profile: compte les appels au problème et chronomètre les phases
+        telemetry: puits recevant des événements de progression échantillonnés
+        """
+        return self.iterate(profile, telemetry).finish()
+
+    async def arun(self, profile: bool = False, telemetry: Telemetry = None,
+                   executor=None) -> dict:
+        """run() dans un executor (l'annulation de la tâche arrête l'algorithme)"""
+        return await self.iterate(profile, telemetry).afinish(executor)
+
+    def _execute(self, profile: bool) -> Generator[Tuple[float, float], None, dict]:
+        start_time = time.perf_counter()
+        with self.profiler.instrument(self.problem):
+            self.best_solution, self.best_value = yield from self.steps()
+        self.execution_time = time.perf_counter() - start_time
+
+        # Évaluations déclarées par l'algorithme (comptage exact dans 'profile')
+        evaluations = self.termination.evaluations
+        self.progress.close(self.best_value, evaluations,
+                            stop_reason=self.termination.stop_reason)
+        result = {
             'algorithm': self.name,
             'problem': str(self.problem),
             'best_value': self.best_value,
             'execution_time': self.execution_time,
             'iterations': len(self.convergence_history),
-            'solution': self.best_solution
+            'solution': self.best_solution,
+            'stop_reason': self.termination.stop_reason,
+            'evaluations': evaluations,
+            'evaluations_per_sec': (evaluations / self.execution_time
+                                    if self.execution_time > 0 else 0.0),
         }
+        result.update(self.result_fields())
+        if profile:
+            result['profile'] = self.profiler.report()
+        return result
+
+    def result_fields(self) -> dict:
+        """Champs propres à l'algorithme ajoutés au résultat de run()"""
+        return {}
 
     def __str__(self):
         return f"{self.name} on {self.problem}"
\ No newline at end of file
@@ -2,84 +2,154 @@
 Branch & Bound (méthode exacte pour petites instances)
 """
 
-from typing import Any, Tuple
+import heapq
+import math
+import time
+from bisect import bisect_right
+from itertools import count
+from typing import Any, Generator, Tuple
 from .base import Algorithm
+from .termination import Termination
 from src.problems.base import OptimizationProblem
+from src.problems.cache import unwrap
 from src.problems.knapsack import KnapsackProblem
 
+STRATEGIES = ('best-first', 'depth-first')
+
 
 class BranchAndBound(Algorithm):
     """
     Branch & Bound pour Knapsack
     Méthode exacte (lente pour grandes instances)
+    - Objets triés par ratio valeur/poids décroissant
+    - Borne fractionnaire (Dantzig) en O(log n) par sommes préfixes
+      et recherche dichotomique
+    - Exploration itérative: meilleur d'abord (file de priorité) ou
+      profondeur d'abord (pile), sans limite de récursion
+    - Nœuds compacts: (borne, niveau, poids, valeur, objets pris en bits)
     """
 
-    def __init__(self, problem: KnapsackProblem, max_nodes: int = 100000):
-        super().__init__(problem, "Branch & Bound")
+    def __init__(self, problem: KnapsackProblem, max_nodes: int = 100000,
+                 strategy: str = 'best-first', seed: int = None,
+                 termination: Termination = None):
+        super().__init__(problem, "Branch & Bound", seed, termination)
+        if strategy not in STRATEGIES:
+            raise ValueError(f"stratégie inconnue: {strategy} "
+                             f"(choix: {', '.join(STRATEGIES)})")
         self.max_nodes = max_nodes
+        self.strategy = strategy
         self.nodes_explored = 0
+        self.nodes_per_second = 0.0
+        self.upper_bound = float('inf')
+        self.gap = None  # Écart relatif à l'optimum prouvé (0 si optimal)
 
-    def solve(self) -> Tuple[Any, float]:
-        if not isinstance(self.problem, KnapsackProblem):
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
+        if not isinstance(unwrap(self.problem), KnapsackProblem):
             raise ValueError("B&B implémenté uniquement pour Knapsack")
 
-        n = self.problem.n
-        best_solution = [0] * n
-        best_value = 0
-
-        def bound(level, current_weight, current_value, items_remaining):
-            """Borne supérieure relaxée (fractionnaire)"""
-            if current_weight > self.problem.capacity:
-                return 0
-
-            bound_value = current_value
-            weight = current_weight
-
-            for i in items_remaining:
-                if weight + self.problem.weights[i] <= self.problem.capacity:
-                    weight += self.problem.weights[i]
-                    bound_value += self.problem.values[i]
-                else:
-                    # Fraction de l'objet
-                    fraction = (self.problem.capacity - weight) / self.problem.weights[i]
-                    bound_value += self.problem.values[i] * fraction
-                    break
-
-            return bound_value
-
-        def branch_and_bound_rec(level, current_solution, current_weight, current_value):
-            nonlocal best_solution, best_value
-
-            self.nodes_explored += 1
-            if self.nodes_explored > self.max_nodes:
-                return
+        problem = self.problem
+        n, capacity = problem.n, problem.capacity
+        start_time = time.perf_counter()
+
+        # Tri par ratio décroissant (poids nul = ratio infini)
+        order = sorted(range(n), key=lambda i: (
+            -problem.values[i] / problem.weights[i] if problem.weights[i]
+            else -float('inf')))
+        weights = [problem.weights[i] for i in order]
+        values = [problem.values[i] for i in order]
+
+        # Sommes préfixes: prefix_w[k] = poids des k premiers objets triés
+        prefix_w, prefix_v = [0], [0]
+        for w, v in zip(weights, values):
+            prefix_w.append(prefix_w[-1] + w)
+            prefix_v.append(prefix_v[-1] + v)
+        integral = all(isinstance(v, int) for v in values)
+
+        def bound(level, weight, value):
+            """
+            Borne fractionnaire et indice critique s: les objets level..s-1
+            tiennent entièrement dans la capacité restante
+            """
+            limit = prefix_w[level] + capacity - weight
+            s = bisect_right(prefix_w, limit, level) - 1
+            upper = value + prefix_v[s] - prefix_v[level]
+            if s < n:
+                upper += (limit - prefix_w[s]) * values[s] / weights[s]
+            if integral:
+                upper = math.floor(upper + 1e-9)
+            return upper, s
+
+        best_value, best_bits = 0, 0
+        self.convergence_history = [best_value]
+        self.nodes_explored = 0
 
-            # Solution complète
-            if level == n:
-                if current_value > best_value:
-                    best_solution = current_solution.copy()
-                    best_value = current_value
+        # Nœuds: (-borne, ordre, niveau, poids, valeur, bits)
+        best_first = self.strategy == 'best-first'
+        tie = count()
+        root_bound, _ = bound(0, 0, 0)
+        open_nodes = [(-root_bound, next(tie), 0, 0, 0, 0)]
+        push = heapq.heappush if best_first else list.append
+        pop = heapq.heappop if best_first else list.pop
+        stop, emit = self.termination.check, self.progress.emit
+
+        with self.profiler.phase('search'):
+            while open_nodes:
+                if self.nodes_explored >= self.max_nodes:
+                    break
+                emit(best_value, self.nodes_explored, open_nodes=len(open_nodes))
+                if stop(best_value, self.nodes_explored):
+                    break
+                yield best_value, best_value
+                neg_bound, _, level, weight, value, bits = pop(open_nodes)
+                if -neg_bound <= best_value:
+                    if best_first:
+                        open_nodes.clear()  # Toutes les bornes restantes sont inférieures
+                    continue
+                self.nodes_explored += 1
+
+                upper, s = bound(level, weight, value)
+                # Complétion gloutonne: les objets level..s-1 forment une solution
+                greedy_value = value + prefix_v[s] - prefix_v[level]
+                if greedy_value > best_value:
+                    best_value = greedy_value
+                    best_bits = bits | (((1 << s) - 1) ^ ((1 << level) - 1))
                     self.convergence_history.append(best_value)
-                return
-
-            # Items restants
-            remaining = list(range(level, n))
-
-            # Branche 1: Prendre l'objet
-            if current_weight + self.problem.weights[level] <= self.problem.capacity:
-                new_solution = current_solution + [1]
-                new_weight = current_weight + self.problem.weights[level]
-                new_value = current_value + self.problem.values[level]
-
-                # Élaguer si la borne est mauvaise
-                if bound(level + 1, new_weight, new_value, remaining[1:]) > best_value:
-                    branch_and_bound_rec(level + 1, new_solution, new_weight, new_value)
+                if s == n or upper <= best_value:
+                    continue  # Nœud résolu ou élagué
+
+                # Branche 1: ne pas prendre l'objet (poussée en premier: la pile
+                # explore d'abord la branche "prendre")
+                exclude_bound, _ = bound(level + 1, weight, value)
+                if exclude_bound > best_value:
+                    push(open_nodes, (-exclude_bound, next(tie), level + 1,
+                                      weight, value, bits))
+
+                # Branche 2: prendre l'objet
+                new_weight = weight + weights[level]
+                if new_weight <= capacity:
+                    new_value = value + values[level]
+                    include_bound, _ = bound(level + 1, new_weight, new_value)
+                    if include_bound > best_value:
+                        push(open_nodes, (-include_bound, next(tie), level + 1,
+                                          new_weight, new_value, bits | (1 << level)))
+
+        elapsed = time.perf_counter() - start_time
+        self.nodes_per_second = self.nodes_explored / elapsed if elapsed > 0 else 0.0
+        remaining = [-node[0] for node in open_nodes if -node[0] > best_value]
+        self.upper_bound = max(remaining, default=best_value)
+        self.gap = (self.upper_bound - best_value) / max(abs(best_value), 1)
 
-            # Branche 2: Ne pas prendre l'objet
-            new_solution = current_solution + [0]
-            if bound(level + 1, current_weight, current_value, remaining[1:]) > best_value:
-                branch_and_bound_rec(level + 1, new_solution, current_weight, current_value)
-
-        branch_and_bound_rec(0, [], 0, 0)
-
-        return best_solution, best_value
\ No newline at end of file
+        best_solution = [0] * n
+        for k in range(n):
+            if best_bits >> k & 1:
+                best_solution[order[k]] = 1
+        return best_solution, best_value
+
+    def result_fields(self) -> dict:
+        return {
+            'nodes_explored': self.nodes_explored,
+            'nodes_per_second': self.nodes_per_second,
+            'upper_bound': self.upper_bound,
+            'gap': self.gap,
+            'optimal': self.gap == 0,
+        }
@@ -0,0 +1,198 @@
+"""
+Programmation dynamique (méthode exacte pseudo-polynomiale pour Knapsack)
+"""
+
+from typing import Any, Generator, List, Tuple
+
+import numpy as np
+
+from .base import Algorithm
+from .termination import Termination
+from src.problems.cache import unwrap
+from src.problems.knapsack import KnapsackProblem
+
+RECONSTRUCTIONS = ('auto', 'bitset', 'divide')
+
+# Taille maximale par défaut de la table de décisions (octets)
+DEFAULT_TABLE_BUDGET = 1 << 28
+
+
+class _Interrupted(Exception):
+    """Budget de temps épuisé pendant le calcul"""
+
+
+class DynamicProgramming(Algorithm):
+    """
+    Programmation dynamique sur la capacité pour Knapsack
+    Méthode exacte en O(n * capacité), poids entiers uniquement
+    - Tableau 1-D glissant: chaque objet est traité par opérations NumPy
+      vectorisées sur toutes les capacités
+    - Reconstruction 'bitset': table des décisions compactée à 1 bit par
+      (objet, capacité)
+    - Reconstruction 'divide' (Hirschberg): découpe récursive des objets en
+      deux moitiés et de la capacité au point optimal, mémoire O(capacité)
+      hors feuilles; les feuilles qui tiennent dans le budget utilisent 'bitset'
+    - 'auto': 'bitset' si la table tient dans table_budget, sinon 'divide'
+    Critères d'arrêt: time_limit, stop_event et request_stop() sont vérifiés
+    à chaque objet (la solution gloutonne par ratio est alors rendue); target
+    arrête d'emblée si la solution gloutonne l'atteint. max_evaluations et
+    patience ne s'appliquent pas (aucune solution évaluée): ValueError.
+    Un pas par objet traité: (valeur de la passe en cours, valeur gloutonne).
+    """
+
+    def __init__(self, problem: KnapsackProblem, reconstruction: str = 'auto',
+                 table_budget: int = DEFAULT_TABLE_BUDGET, seed: int = None,
+                 termination: Termination = None):
+        super().__init__(problem, "Dynamic Programming", seed, termination)
+        unsupported = [name for name in ('max_evaluations', 'patience')
+                       if getattr(self.termination, name) is not None]
+        if unsupported:
+            raise ValueError(f"critères sans effet sur la programmation dynamique: "
+                             f"{', '.join(unsupported)} (pris en compte: time_limit, "
+                             f"target, stop_event, request_stop)")
+        if reconstruction not in RECONSTRUCTIONS:
+            raise ValueError(f"reconstruction inconnue: {reconstruction} "
+                             f"(choix: {', '.join(RECONSTRUCTIONS)})")
+        self.reconstruction = reconstruction
+        self.table_budget = table_budget
+        self.table_bytes = 0  # Plus grande table de décisions allouée
+        self.cells = 0  # Cases (objet, capacité) calculées, toutes passes comprises
+        self.greedy_value = 0
+
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
+        problem = self.problem
+        if not isinstance(unwrap(problem), KnapsackProblem):
+            raise ValueError("Programmation dynamique implémentée uniquement pour Knapsack")
+        weights, values = problem.weights_array, problem.values_array
+        if not all(float(w).is_integer() for w in problem.weights) or (weights < 0).any():
+            raise ValueError("la programmation dynamique exige des poids entiers positifs")
+
+        # Objets utiles: valeur positive et poids dans la capacité
+        items = np.nonzero((values > 0) & (weights <= problem.capacity))[0]
+        capacity = int(min(problem.capacity, weights[items].sum()))
+        if values.dtype.kind == 'f':
+            self.dtype = np.float64  # Valeurs non entières: table en flottants
+        else:
+            self.dtype = np.int32 if values[items].sum() < 2 ** 31 else np.int64
+        self.table_bytes = 0
+        self.cells = 0
+        # Solution de repli si le budget expire
+        greedy = self._greedy(items, capacity)
+        self.greedy_value = values[greedy].sum().item()
+
+        target = self.termination.target
+        if target is not None and self.greedy_value >= target:
+            # Cible atteinte sans table
+            self.termination.reason = 'target'
+            chosen = greedy
+        else:
+            try:
+                if self.reconstruction == 'divide' or (
+                        self.reconstruction == 'auto'
+                        and self._table_size(len(items), capacity) > self.table_budget):
+                    chosen = yield from self._divide(items, capacity)
+                else:
+                    chosen = yield from self._bitset(items, capacity)
+            except _Interrupted:
+                chosen = greedy
+
+        solution = [0] * problem.n
+        for i in chosen:
+            solution[i] = 1
+        best_value = problem.evaluate(solution)
+        self.convergence_history = [best_value]
+        return solution, best_value
+
+    @staticmethod
+    def _table_size(n_items: int, capacity: int) -> int:
+        """Octets de la table de décisions compactée"""
+        return n_items * ((capacity + 8) // 8)
+
+    def _forward(self, items: np.ndarray, capacity: int) -> Generator:
+        """best[c] = valeur maximale avec les objets `items` et un poids <= c"""
+        weights, values = self.problem.weights_array, self.problem.values_array
+        best = np.zeros(capacity + 1, dtype=self.dtype)
+        candidate = np.empty_like(best)
+        expired = self.termination.expired
+        with self.profiler.phase('forward'):
+            for i in items:
+                if expired():
+                    raise _Interrupted
+                w, v = int(weights[i]), values[i].item()
+                if w > capacity:
+                    continue
+                self.cells += capacity + 1 - w
+                # Toutes les capacités d'un coup (candidate est une copie: 0-1)
+                np.add(best[:capacity + 1 - w], v, out=candidate[:capacity + 1 - w])
+                np.maximum(best[w:], candidate[:capacity + 1 - w], out=best[w:])
+                yield best[-1].item(), self.greedy_value
+        return best
+
+    def _bitset(self, items: np.ndarray, capacity: int) -> Generator:
+        """Table des décisions à 1 bit par case puis remontée depuis `capacity`"""
+        weights, values = self.problem.weights_array, self.problem.values_array
+        best = np.zeros(capacity + 1, dtype=self.dtype)
+        candidate = np.empty_like(best)
+        take = np.zeros(capacity + 1, dtype=bool)
+        decisions = np.zeros((len(items), (capacity + 8) // 8), dtype=np.uint8)
+        self.table_bytes = max(self.table_bytes, decisions.nbytes)
+
+        expired = self.termination.expired
+        with self.profiler.phase('decisions'):
+            for k, i in enumerate(items):
+                if expired():
+                    raise _Interrupted
+                w, v = int(weights[i]), values[i].item()
+                if w > capacity:
+                    continue
+                self.cells += capacity + 1 - w
+                np.add(best[:capacity + 1 - w], v, out=candidate[:capacity + 1 - w])
+                take[:w] = False
+                np.greater(candidate[:capacity + 1 - w], best[w:], out=take[w:])
+                np.maximum(best[w:], candidate[:capacity + 1 - w], out=best[w:])
+                decisions[k] = np.packbits(take)
+                yield best[-1].item(), self.greedy_value
+
+        with self.profiler.phase('backtrack'):
+            chosen = []
+            c = capacity
+            for k in range(len(items) - 1, -1, -1):
+                if decisions[k, c >> 3] >> (7 - (c & 7)) & 1:
+                    chosen.append(int(items[k]))
+                    c -= int(weights[items[k]])
+        return chosen
+
+    def _divide(self, items: np.ndarray, capacity: int) -> Generator:
+        """
+        Hirschberg: la capacité est partagée entre les deux moitiés au point
+        qui maximise best_gauche[c] + best_droite[capacité - c]
+        """
+        if len(items) <= 1 or self._table_size(len(items), capacity) <= self.table_budget:
+            return (yield from self._bitset(items, capacity))
+        mid = len(items) // 2
+        left, right = items[:mid], items[mid:]
+        best_left = yield from self._forward(left, capacity)
+        best_right = yield from self._forward(right, capacity)
+        split = int(np.argmax(best_left + best_right[::-1]))
+        del best_left, best_right
+        chosen = yield from self._divide(left, split)
+        return chosen + (yield from self._divide(right, capacity - split))
+
+    def _greedy(self, items: np.ndarray, capacity: int) -> List[int]:
+        """Objets par ratio décroissant tant qu'ils tiennent"""
+        weights, values = self.problem.weights_array, self.problem.values_array
+        chosen, load = [], 0
+        for i in items[np.argsort(-values[items] / np.maximum(weights[items], 1e-12),
+                                  kind='stable')]:
+            if load + weights[i] <= capacity:
+                chosen.append(int(i))
+                load += int(weights[i])
+        return chosen
+
+    def result_fields(self) -> dict:
+        return {
+            'reconstruction': self.reconstruction,
+            'table_bytes': self.table_bytes,
+            'cells': self.cells,
+            'optimal': self.termination.reason is None,
+        }
@@ -2,9 +2,12 @@
 Algorithme Génétique
 """
 
-import random
-from typing import Any, Tuple, List
+from typing import Any, Generator, Tuple, List
+
+import numpy as np
+
 from .base import Algorithm
+from .termination import Termination
 from src.problems.base import OptimizationProblem
 
 
@@ -21,46 +24,60 @@ class GeneticAlgorithm(Algorithm):
                  generations: int = 100,
                  crossover_rate: float = 0.8,
                  mutation_rate: float = 0.1,
-                 elitism: int = 2):
-        super().__init__(problem, "Genetic Algorithm")
+                 elitism: int = 2,
+                 seed: int = None,
+                 termination: Termination = None):
+        super().__init__(problem, "Genetic Algorithm", seed, termination)
         self.population_size = population_size
         self.generations = generations
         self.crossover_rate = crossover_rate
         self.mutation_rate = mutation_rate
         self.elitism = elitism
 
-    def solve(self) -> Tuple[Any, float]:
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
         # Population initiale
-        population = [self.problem.random_solution()
-                      for _ in range(self.population_size)]
+        population = self._initial_population()
+        fitness = self.problem.evaluate_batch(population)
+        stop, emit = self.termination.check, self.progress.emit
+        evaluations = len(population)
+        n_children = max(0, self.population_size - self.elitism)
 
         for generation in range(self.generations):
-            # Évaluation
-            fitness = [self.problem.evaluate(ind) for ind in population]
-
             # Meilleur individu
-            best_idx = fitness.index(max(fitness))
-            best = population[best_idx]
-            best_value = fitness[best_idx]
-
-            self.convergence_history.append(best_value)
-
-            # Nouvelle population
-            new_population = []
+            self.convergence_history.append(float(fitness.max()))
+            population, fitness = self._next_generation(population, fitness)
+            evaluations += n_children
+            best_value = float(fitness.max())
+            emit(best_value, evaluations)
+            if stop(best_value, evaluations):
+                break
+            yield best_value, best_value
 
-            # Élitisme
-            sorted_pop = sorted(zip(population, fitness),
-                                key=lambda x: x[1], reverse=True)
-            new_population.extend([ind for ind, _ in sorted_pop[:self.elitism]])
-
-            # Génération de nouveaux individus
-            while len(new_population) < self.population_size:
+        # Retourner le meilleur
+        best_idx = int(np.argmax(fitness))
+        return population[best_idx], float(fitness[best_idx])
+
+    def _initial_population(self) -> List:
+        return [self.problem.random_solution(self.rng)
+                for _ in range(self.population_size)]
+
+    def _next_generation(self, population: List, fitness: np.ndarray):
+        """Une génération: élitisme, sélection, croisement, mutation"""
+        phase = self.profiler.phase
+        # Élitisme (leur fitness est conservée, pas réévaluée)
+        elite_idx = np.argsort(-fitness, kind='stable')[:self.elitism]
+        elites = [population[i] for i in elite_idx]
+
+        # Génération de nouveaux individus
+        children = []
+        with phase('breeding'):
+            while len(elites) + len(children) < self.population_size:
                 # Sélection par tournoi
                 parent1 = self._tournament_selection(population, fitness)
                 parent2 = self._tournament_selection(population, fitness)
 
                 # Croisement
-                if random.random() < self.crossover_rate:
+                if self.rng.random() < self.crossover_rate:
                     child1, child2 = self._crossover(parent1, parent2)
                 else:
                     child1, child2 = parent1, parent2
@@ -69,34 +86,38 @@ class GeneticAlgorithm(Algorithm):
                 child1 = self._mutate(child1)
                 child2 = self._mutate(child2)
 
-                new_population.extend([child1, child2])
+                children.extend([child1, child2])
 
-            population = new_population[:self.population_size]
-
-        # Retourner le meilleur
-        fitness = [self.problem.evaluate(ind) for ind in population]
-        best_idx = fitness.index(max(fitness))
-        return population[best_idx], fitness[best_idx]
+        children = children[:self.population_size - len(elites)]
+        # Évaluation groupée des seuls nouveaux individus
+        with phase('evaluation'):
+            fitness = np.concatenate([fitness[elite_idx],
+                                      self.problem.evaluate_batch(children)])
+        return elites + children, fitness
 
     def _tournament_selection(self, population: List, fitness: List, k: int = 3):
         """Sélection par tournoi"""
-        tournament = random.sample(list(zip(population, fitness)), k)
-        winner = max(tournament, key=lambda x: x[1])
-        return winner[0]
+        contenders = self.rng.sample(range(len(population)), k)
+        return population[max(contenders, key=fitness.__getitem__)]
 
     def _crossover(self, parent1, parent2):
         """Croisement uniforme"""
-        if isinstance(parent1, list):
-            child1 = [p1 if random.random() < 0.5 else p2
+        if hasattr(parent1, '__len__'):  # Liste, tableau ou bitset
+            coin = self.rng.random
+            child1 = [p1 if coin() < 0.5 else p2
                       for p1, p2 in zip(parent1, parent2)]
-            child2 = [p2 if random.random() < 0.5 else p1
+            child2 = [p2 if coin() < 0.5 else p1
                       for p1, p2 in zip(parent1, parent2)]
 
-            # Réparer si nécessaire
-            if not self.problem.is_feasible(child1):
-                child1 = self.problem.random_solution()
-            if not self.problem.is_feasible(child2):
-                child2 = self.problem.random_solution()
+            # Réparer si nécessaire, sinon revenir à la représentation du problème
+            if self.problem.is_feasible(child1):
+                child1 = self.problem.encode(child1)
+            else:
+                child1 = self.problem.random_solution(self.rng)
+            if self.problem.is_feasible(child2):
+                child2 = self.problem.encode(child2)
+            else:
+                child2 = self.problem.random_solution(self.rng)
 
             return child1, child2
         else:
@@ -104,6 +125,13 @@ class GeneticAlgorithm(Algorithm):
 
     def _mutate(self, individual):
         """Mutation"""
-        if random.random() < self.mutation_rate:
-            return self.problem.get_neighbor(individual)
+        if self.rng.random() < self.mutation_rate:
+            if self.problem.supports_moves():
+                move = self.problem.random_move(individual, self.rng)
+                # Mouvement infaisable: individu inchangé, comme get_neighbor
+                if self.problem.move_delta(individual, move) == -float('inf'):
+                    return individual
+                mutant = self.problem.copy_solution(individual)
+                return self.problem.apply_move(mutant, move)
+            return self.problem.get_neighbor(individual, self.rng)
         return individual
\ No newline at end of file
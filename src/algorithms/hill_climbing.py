@@ -2,8 +2,9 @@
 Algorithme Hill Climbing (Montée de colline)
 """
 
-from typing import Any, Tuple
+from typing import Any, Generator, Tuple
 from .base import Algorithm
+from .termination import Termination
 from src.problems.base import OptimizationProblem
 
 
@@ -16,34 +17,82 @@ class HillClimbing(Algorithm):
     - S'arrête quand aucun voisin n'améliore
     """
 
-    def __init__(self, problem: OptimizationProblem, max_iterations: int = 1000):
-        super().__init__(problem, "Hill Climbing")
+    def __init__(self, problem: OptimizationProblem, max_iterations: int = 1000,
+                 seed: int = None, termination: Termination = None):
+        super().__init__(problem, "Hill Climbing", seed, termination)
         self.max_iterations = max_iterations
 
-    def solve(self) -> Tuple[Any, float]:
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
         # Solution initiale
-        current = self.problem.random_solution()
+        current = self.problem.random_solution(self.rng)
         current_value = self.problem.evaluate(current)
 
         self.convergence_history = [current_value]
 
+        if self.problem.supports_moves():
+            return (yield from self._steps_with_moves(current, current_value))
+
+        stop, emit = self.termination.check, self.progress.emit
+        phase, count = self.profiler.phase, self.profiler.count
+        evaluations = 1
         for iteration in range(self.max_iterations):
             # Générer tous les voisins
             improved = False
 
-            for _ in range(10):  # Essayer plusieurs voisins
-                neighbor = self.problem.get_neighbor(current)
-                neighbor_value = self.problem.evaluate(neighbor)
+            with phase('neighbors'):
+                for _ in range(10):  # Essayer plusieurs voisins
+                    neighbor = self.problem.get_neighbor(current, self.rng)
+                    neighbor_value = self.problem.evaluate(neighbor)
+                    evaluations += 1
+
+                    if neighbor_value > current_value:
+                        count('moves_accepted')
+                        current = neighbor
+                        current_value = neighbor_value
+                        improved = True
+                        break
+
+            self.convergence_history.append(current_value)
+
+            emit(current_value, evaluations)
+            if stop(current_value, evaluations):
+                break
+            if not improved:
+                break  # Optimum local atteint
+            yield current_value, current_value
+
+        return current, current_value
+
+    def _steps_with_moves(self, current, current_value):
+        """Variante par mouvements: seuls les mouvements améliorants sont appliqués"""
+        problem, rng = self.problem, self.rng
+        stop, emit = self.termination.check, self.progress.emit
+        phase = self.profiler.phase
+        evaluations = 1
+
+        for iteration in range(self.max_iterations):
+            improved = False
+
+            with phase('neighbors'):
+                for _ in range(10):  # Essayer plusieurs voisins
+                    move = problem.random_move(current, rng)
+                    delta = problem.move_delta(current, move)
+                    evaluations += 1
 
-                if neighbor_value > current_value:
-                    current = neighbor
-                    current_value = neighbor_value
-                    improved = True
-                    break
+                    if delta > 0:
+                        # Compté comme accepté par le profileur (apply_move)
+                        problem.apply_move(current, move)
+                        current_value += delta
+                        improved = True
+                        break
 
             self.convergence_history.append(current_value)
 
+            emit(current_value, evaluations)
+            if stop(current_value, evaluations):
+                break
             if not improved:
                 break  # Optimum local atteint
+            yield current_value, current_value
 
-        return current, current_value
\ No newline at end of file
+        return current, self.problem.evaluate(current)
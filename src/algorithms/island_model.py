@@ -0,0 +1,182 @@
+"""
+Algorithme Génétique en îles (processus parallèles)
+"""
+
+import multiprocessing
+from typing import Any, Generator, List, Tuple
+
+import numpy as np
+
+from .base import Algorithm
+from .termination import Termination
+from .genetic_algorithm import GeneticAlgorithm
+from src.problems.base import OptimizationProblem
+
+TOPOLOGIES = ('ring', 'complete')
+
+
+def _island_worker(conn, problem: OptimizationProblem, ga_params: dict,
+                   seed: int, generations: int, migration_interval: int,
+                   migration_size: int, termination: Termination):
+    """
+    Fait évoluer une île dans son propre processus
+
+    Toutes les `migration_interval` générations, envoie au maître son
+    historique, ses meilleurs individus (émigrants) et son meilleur
+    individu, puis reçoit les immigrants qui remplacent ses pires individus.
+    Si son budget (temps, cible) expire, l'île envoie un historique écourté;
+    le maître répond alors None pour arrêter toutes les îles.
+    """
+    # Flux aléatoire propre à l'île
+    ga = GeneticAlgorithm(problem, generations=generations, seed=seed, **ga_params)
+    population = ga._initial_population()
+    fitness = problem.evaluate_batch(population)
+    termination.start()
+
+    done = 0
+    while done < generations:
+        history = []
+        for _ in range(min(migration_interval, generations - done)):
+            history.append(float(fitness.max()))
+            population, fitness = ga._next_generation(population, fitness)
+            if termination.check(float(fitness.max())):
+                break
+        done += len(history)
+
+        order = np.argsort(-fitness, kind='stable')
+        emigrants = [(population[i], float(fitness[i]))
+                     for i in order[:migration_size]]
+        conn.send((history, emigrants))
+
+        if done < generations:
+            immigrants = conn.recv()
+            if immigrants is None:
+                break  # Arrêt demandé par le maître
+            # Les immigrants remplacent les pires individus (hors élites)
+            slots = order[::-1][:min(len(immigrants),
+                                     len(population) - ga.elitism)]
+            for slot, (individual, value) in zip(slots, immigrants):
+                population[slot] = individual
+                fitness[slot] = value
+
+    best_idx = int(np.argmax(fitness))
+    conn.send((population[best_idx], float(fitness[best_idx])))
+    conn.close()
+
+
+class IslandGeneticAlgorithm(Algorithm):
+    """
+    Algorithme Génétique en îles
+    - Plusieurs sous-populations évoluent en parallèle (un processus par île)
+    - Migration périodique des meilleurs individus selon une topologie
+      ('ring': vers l'île suivante, 'complete': vers toutes les autres)
+    - Chaque île a son propre flux aléatoire (enfant de `seed`)
+    Les opérateurs sont ceux de GeneticAlgorithm.
+    """
+
+    def __init__(self, problem: OptimizationProblem,
+                 islands: int = 4,
+                 population_size: int = 50,
+                 generations: int = 100,
+                 migration_interval: int = 10,
+                 migration_size: int = 2,
+                 topology: str = 'ring',
+                 seed: int = None,
+                 termination: Termination = None,
+                 **ga_params):
+        super().__init__(problem, "Island Genetic Algorithm", seed, termination)
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"topologie inconnue: {topology} "
+                             f"(choix: {', '.join(TOPOLOGIES)})")
+        self.islands = islands
+        self.population_size = population_size
+        self.generations = generations
+        self.migration_interval = max(1, migration_interval)
+        self.migration_size = migration_size
+        self.topology = topology
+        self.ga_params = dict(ga_params, population_size=population_size)
+        self.island_histories = []
+
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
+        island_seeds = self.spawn_seeds(self.islands)
+        # Les îles ne reçoivent que l'échéance restante et la cible;
+        # évaluations, stagnation et arrêt externe sont vérifiés par le maître
+        island_termination = Termination(
+            time_limit=self.termination.remaining_time(),
+            target=self.termination.target)
+        evaluations_per_generation = self.islands * self.population_size
+
+        ctx = multiprocessing.get_context()
+        connections, processes = [], []
+        try:
+            for island_seed in island_seeds:
+                parent_conn, child_conn = ctx.Pipe()
+                process = ctx.Process(
+                    target=_island_worker,
+                    args=(child_conn, self.problem, self.ga_params, island_seed,
+                          self.generations, self.migration_interval,
+                          self.migration_size, island_termination),
+                    daemon=True)
+                process.start()
+                child_conn.close()
+                connections.append(parent_conn)
+                processes.append(process)
+
+            self.island_histories = [[] for _ in range(self.islands)]
+            done = 0
+            island_stopped = False
+            while done < self.generations:
+                messages = [conn.recv() for conn in connections]
+                for history, (chunk, _) in zip(self.island_histories, messages):
+                    history.extend(chunk)
+                epoch = min(self.migration_interval, self.generations - done)
+                island_stopped = any(len(chunk) < epoch for chunk, _ in messages)
+                stopped = island_stopped
+                for values in zip(*(chunk for chunk, _ in messages)):
+                    done += 1
+                    evaluations = done * evaluations_per_generation
+                    self.progress.emit(max(values), evaluations)
+                    if self.termination.check(max(values), evaluations):
+                        stopped = True
+                        break
+                    yield max(values), self.termination.best_value
+                if done < self.generations:
+                    if stopped:
+                        for conn in connections:
+                            conn.send(None)
+                        break
+                    for conn, immigrants in zip(connections,
+                                                self._migrate([m[1] for m in messages])):
+                        conn.send(immigrants)
+
+            finals = [conn.recv() for conn in connections]
+            for process in processes:
+                process.join()
+        finally:
+            for conn in connections:
+                conn.close()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        best = max(finals, key=lambda final: final[1])
+        if island_stopped and self.termination.reason is None:
+            # Une île s'est arrêtée seule: cible atteinte ou échéance
+            target = self.termination.target
+            reached = target is not None and best[1] >= target
+            self.termination.reason = 'target' if reached else 'deadline'
+
+        # Historique fusionné: meilleure valeur toutes îles confondues
+        self.convergence_history = [max(values) for values in
+                                    zip(*self.island_histories)]
+        return best
+
+    def _migrate(self, emigrants: List[List]) -> List[List]:
+        """Répartit les émigrants de chaque île selon la topologie"""
+        k = len(emigrants)
+        if k < 2:
+            return [[] for _ in range(k)]
+        if self.topology == 'ring':
+            return [emigrants[(i - 1) % k] for i in range(k)]
+        return [[migrant for j in range(k) if j != i for migrant in emigrants[j]]
+                for i in range(k)]
@@ -0,0 +1,198 @@
+"""
+Portefeuille d'algorithmes et multi-départs en parallèle
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Sequence, Tuple, Type
+
+from .base import Algorithm
+from .termination import COMPLETED, EVENT_POLL_INTERVAL, Termination
+from src.problems.base import OptimizationProblem
+
+# (classe d'algorithme, paramètres, graine)
+PortfolioEntry = Tuple[Type[Algorithm], dict, int]
+
+# État partagé d'un processus de travail (fixé par _init_worker)
+_worker = {}
+
+
+class SharedTermination(Termination):
+    """
+    Critères d'arrêt reliés à la meilleure valeur partagée du portefeuille
+    Chaque check() publie les améliorations du solveur et lit celles des
+    autres (au plus toutes les 10 ms): dès que la valeur partagée atteint
+    `shared_target`, tous les solveurs s'arrêtent avec la raison 'target'.
+    """
+
+    def __init__(self, incumbent, shared_target: Optional[float] = None, **params):
+        self.incumbent = incumbent
+        self.shared_target = shared_target
+        super().__init__(**params)
+
+    def start(self):
+        super().start()
+        self._next_sync = self.start_time
+
+    def check(self, best_value: float, evaluations: int = 0) -> bool:
+        stop = super().check(best_value, evaluations)
+        now = time.perf_counter()
+        if not stop and now < self._next_sync:
+            return False
+        self._next_sync = now + EVENT_POLL_INTERVAL
+        if self.publish(self.best_value):
+            # Arrêt dû à la cible commune, même vu d'abord par stop_event
+            if self.reason in (None, 'stopped'):
+                self.reason = 'target'
+            return True
+        return stop
+
+    def publish(self, best_value: float) -> bool:
+        """Met à jour la valeur partagée; True si la cible commune est atteinte"""
+        with self.incumbent.get_lock():
+            if best_value > self.incumbent.value:
+                self.incumbent.value = best_value
+            shared = self.incumbent.value
+        reached = self.shared_target is not None and shared >= self.shared_target
+        if reached and self.stop_event is not None:
+            self.stop_event.set()
+        return reached
+
+    def replace(self, **changes) -> 'SharedTermination':
+        params = dict(time_limit=self.time_limit,
+                      max_evaluations=self.max_evaluations,
+                      target=self.target,
+                      patience=self.patience,
+                      stop_event=self.stop_event)
+        params.update(changes)
+        return SharedTermination(self.incumbent, self.shared_target, **params)
+
+
+def _init_worker(problem: OptimizationProblem, incumbent, stop_event):
+    """Le problème n'est transmis qu'une fois par processus"""
+    _worker['problem'] = problem
+    _worker['incumbent'] = incumbent
+    _worker['stop'] = stop_event
+
+
+def _run_entry(index: int, algorithm_class: Type[Algorithm], params: dict,
+               seed: int, target_value: Optional[float],
+               deadline: Optional[float]) -> Optional[dict]:
+    if _worker['stop'].is_set():
+        return None  # Cible déjà atteinte: ne pas démarrer
+    if deadline is not None and time.time() >= deadline:
+        return None  # Échéance du portefeuille dépassée
+
+    # Les exécutions en cours s'arrêtent sur l'événement, l'échéance ou la cible
+    params = dict(params)
+    termination = params.pop('termination', None) or Termination()
+    settings = dict(time_limit=termination.time_limit,
+                    max_evaluations=termination.max_evaluations,
+                    target=termination.target,
+                    patience=termination.patience,
+                    stop_event=_worker['stop'])
+    if deadline is not None:
+        remaining = deadline - time.time()
+        settings['time_limit'] = (remaining if termination.time_limit is None
+                                  else min(termination.time_limit, remaining))
+    if target_value is not None and termination.target is None:
+        settings['target'] = target_value
+
+    shared = SharedTermination(_worker['incumbent'], target_value, **settings)
+    result = algorithm_class(_worker['problem'], seed=seed, termination=shared,
+                             **params).run()
+    result['entry'] = index
+    result['seed'] = seed
+
+    # Valeur finale (une exécution peut finir sans check() après sa dernière
+    # amélioration)
+    shared.publish(result['best_value'])
+    return result
+
+
+class PortfolioRunner:
+    """
+    Exécute un portefeuille de (algorithme, paramètres, graine) en parallèle
+    - Un pool de processus partage la meilleure valeur connue (incumbent),
+      publiée pendant les exécutions (SharedTermination)
+    - Optionnel: tout s'arrête dès qu'une valeur cible est atteinte
+      (les exécutions pas encore démarrées sont annulées, celles en cours
+      s'interrompent et rendent leur meilleure solution)
+    - Optionnel: échéance globale time_limit (secondes) pour tout le portefeuille
+    """
+
+    def __init__(self, problem: OptimizationProblem,
+                 entries: Sequence[PortfolioEntry],
+                 processes: int = None,
+                 target_value: float = None,
+                 time_limit: float = None):
+        self.problem = problem
+        self.entries = list(entries)
+        self.processes = processes
+        self.target_value = target_value
+        self.time_limit = time_limit
+        self.incumbent = -float('inf')
+        self.results = []
+
+    @classmethod
+    def multi_start(cls, problem: OptimizationProblem,
+                    algorithm_class: Type[Algorithm], params: dict,
+                    seeds: Sequence[int], **kwargs) -> 'PortfolioRunner':
+        """Redémarrages indépendants d'un même algorithme"""
+        return cls(problem, [(algorithm_class, params, seed) for seed in seeds],
+                   **kwargs)
+
+    def run(self) -> dict:
+        """Exécute le portefeuille et retourne le meilleur résultat et tous les autres"""
+        ctx = multiprocessing.get_context()
+        incumbent = ctx.Value('d', -float('inf'))
+        stop_event = ctx.Event()
+        start_time = time.time()
+        deadline = start_time + self.time_limit if self.time_limit is not None else None
+        results: List[dict] = []
+        cancelled = 0
+
+        with ProcessPoolExecutor(max_workers=self.processes, mp_context=ctx,
+                                 initializer=_init_worker,
+                                 initargs=(self.problem, incumbent, stop_event)
+                                 ) as executor:
+            futures = [executor.submit(_run_entry, index, algorithm_class,
+                                       params, seed, self.target_value, deadline)
+                       for index, (algorithm_class, params, seed)
+                       in enumerate(self.entries)]
+
+            for future in as_completed(futures):
+                if future.cancelled():
+                    cancelled += 1
+                    continue
+                result = future.result()
+                if result is None:
+                    cancelled += 1
+                    continue
+                results.append(result)
+                if stop_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+
+        results.sort(key=lambda r: r['entry'])
+        self.results = results
+        self.incumbent = incumbent.value
+        best = max(results, key=lambda r: r['best_value']) if results else None
+        if stop_event.is_set():
+            stop_reason = 'target'
+        elif deadline is not None and (cancelled or any(
+                r['stop_reason'] == 'deadline' for r in results)):
+            stop_reason = 'deadline'
+        else:
+            stop_reason = COMPLETED
+
+        return {
+            'best': best,
+            'results': results,
+            'best_value': self.incumbent,
+            'target_reached': stop_event.is_set(),
+            'cancelled': cancelled,
+            'stop_reason': stop_reason,
+            'execution_time': time.time() - start_time,
+        }
@@ -2,10 +2,12 @@
 Algorithme de Recuit Simulé
 """
 
-import random
-import math
-from typing import Any, Tuple
+from typing import Any, Generator, List, Tuple
+
+import numpy as np
+
 from .base import Algorithm
+from .termination import Termination
 from src.problems.base import OptimizationProblem
 
 
@@ -20,16 +22,18 @@ class SimulatedAnnealing(Algorithm):
                  initial_temp: float = 100.0,
                  cooling_rate: float = 0.95,
                  min_temp: float = 0.01,
-                 iterations_per_temp: int = 100):
-        super().__init__(problem, "Simulated Annealing")
+                 iterations_per_temp: int = 100,
+                 seed: int = None,
+                 termination: Termination = None):
+        super().__init__(problem, "Simulated Annealing", seed, termination)
         self.initial_temp = initial_temp
         self.cooling_rate = cooling_rate
         self.min_temp = min_temp
         self.iterations_per_temp = iterations_per_temp
 
-    def solve(self) -> Tuple[Any, float]:
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
         # Solution initiale
-        current = self.problem.random_solution()
+        current = self.problem.random_solution(self.rng)
         current_value = self.problem.evaluate(current)
 
         best = current
@@ -38,24 +42,93 @@ class SimulatedAnnealing(Algorithm):
         temperature = self.initial_temp
         self.convergence_history = [best_value]
 
+        if self.problem.supports_moves():
+            return (yield from self._steps_with_moves(current, current_value, temperature))
+
+        stop, emit = self.termination.check, self.progress.emit
+        phase, count = self.profiler.phase, self.profiler.count
+        evaluations = 1
         while temperature > self.min_temp:
-            for _ in range(self.iterations_per_temp):
-                # Générer un voisin
-                neighbor = self.problem.get_neighbor(current)
-                neighbor_value = self.problem.evaluate(neighbor)
+            with phase('thresholds'):
+                thresholds = self._thresholds(temperature)
+            with phase('moves'):
+                for threshold in thresholds:
+                    # Générer un voisin
+                    neighbor = self.problem.get_neighbor(current, self.rng)
+                    neighbor_value = self.problem.evaluate(neighbor)
 
-                # Critère de Metropolis
-                delta = neighbor_value - current_value
+                    # Critère de Metropolis
+                    delta = neighbor_value - current_value
 
-                if delta > 0 or random.random() < math.exp(delta / temperature):
-                    current = neighbor
-                    current_value = neighbor_value
+                    if delta >= threshold:
+                        count('moves_accepted')
+                        current = neighbor
+                        current_value = neighbor_value
 
-                    if current_value > best_value:
-                        best = current
-                        best_value = current_value
+                        if current_value > best_value:
+                            best = current
+                            best_value = current_value
 
+            evaluations += self.iterations_per_temp
+            emit(best_value, evaluations, temperature=temperature)
             temperature *= self.cooling_rate
             self.convergence_history.append(best_value)
+            if stop(best_value, evaluations):
+                break
+            yield current_value, best_value
 
         return best, best_value
+
+    def _thresholds(self, temperature: float) -> List[float]:
+        """
+        Seuils de Metropolis pré-générés pour un palier de température
+
+        random() < exp(delta / T)  <=>  delta >= T * log(1 - random()):
+        un seul tirage NumPy par palier, sans exp() dans la boucle.
+        """
+        uniforms = self.np_rng.random(self.iterations_per_temp)
+        return (temperature * np.log1p(-uniforms)).tolist()
+
+    def _steps_with_moves(self, current, current_value, temperature):
+        """Variante par mouvements: delta évalué avant toute copie"""
+        problem, rng = self.problem, self.rng
+        best = current
+        best_value = current_value
+        at_best = True  # `current` est la meilleure solution (pas encore copiée)
+        stop, emit = self.termination.check, self.progress.emit
+        phase = self.profiler.phase
+        evaluations = 1
+
+        while temperature > self.min_temp:
+            with phase('thresholds'):
+                thresholds = self._thresholds(temperature)
+            with phase('moves'):
+                for threshold in thresholds:
+                    move = problem.random_move(current, rng)
+                    delta = problem.move_delta(current, move)
+
+                    # Critère de Metropolis
+                    if delta >= threshold:
+                        new_value = current_value + delta
+                        if new_value > best_value:
+                            at_best = True
+                            best_value = new_value
+                        elif at_best:
+                            # On quitte la meilleure solution: la copier avant
+                            best = problem.copy_solution(current)
+                            at_best = False
+                        problem.apply_move(current, move)
+                        current_value = new_value
+
+            evaluations += self.iterations_per_temp
+            emit(best_value, evaluations, temperature=temperature)
+            temperature *= self.cooling_rate
+            self.convergence_history.append(best_value)
+            if stop(best_value, evaluations):
+                break
+            yield current_value, best_value
+
+        if at_best:
+            best = current
+        # Réévaluation exacte (les deltas cumulés dérivent en flottant)
+        return best, self.problem.evaluate(best)
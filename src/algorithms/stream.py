@@ -0,0 +1,117 @@
+"""
+Exécution pas à pas des algorithmes: itérateur d'états et variante asyncio
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Generator, Optional, Tuple
+
+
+class Snapshot:
+    """État léger d'une exécution après une itération de la boucle principale"""
+
+    __slots__ = ('algorithm', 'iteration', 'current_value', 'best_value',
+                 'evaluations', 'elapsed')
+
+    def __init__(self, algorithm: str, iteration: int, current_value: float,
+                 best_value: float, evaluations: int, elapsed: float):
+        self.algorithm = algorithm
+        self.iteration = iteration
+        self.current_value = current_value
+        self.best_value = best_value
+        self.evaluations = evaluations
+        self.elapsed = elapsed
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (f"Snapshot({self.algorithm!r}, iteration={self.iteration}, "
+                f"current={self.current_value}, best={self.best_value}, "
+                f"evaluations={self.evaluations}, elapsed={self.elapsed:.3f}s)")
+
+
+class SolverStream:
+    """
+    Itérateur de Snapshot d'une exécution (Algorithm.iterate())
+    - Une itération de boucle principale par pas; `every` n'en garde qu'une
+      sur `every` (les autres ne créent aucun Snapshot)
+    - cancel(): arrêt propre, l'algorithme rend sa meilleure solution au pas
+      suivant ('stopped'); utilisable depuis un autre thread
+    - finish(): termine l'exécution sans Snapshot et rend le dict de run()
+    - `async for` et afinish(): chaque pas s'exécute dans un executor, la
+      boucle asyncio n'est jamais bloquée
+    Un flux ne doit être avancé que par un seul thread à la fois. Avec
+    profile=True, le temps passé par l'appelant entre deux pas compte dans
+    la phase en cours.
+    """
+
+    def __init__(self, algorithm, steps: Generator[Tuple[float, float], None, dict],
+                 every: int = 1):
+        self.algorithm = algorithm
+        self.every = max(1, every)
+        self.result: Optional[dict] = None  # Dict de run() une fois terminé
+        self._steps = self._capture(steps)
+        self._iteration = 0
+        self._start_time = time.perf_counter()
+
+    def _capture(self, steps):
+        # yield from délègue en C: finish() ne paie aucun appel Python par pas
+        self.result = yield from steps
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Snapshot:
+        if self.result is not None:
+            raise StopIteration
+        steps = self._steps
+        for _ in range(self.every):
+            current_value, best_value = next(steps)  # StopIteration: fin
+            self._iteration += 1
+        algorithm = self.algorithm
+        return Snapshot(algorithm.name, self._iteration, current_value, best_value,
+                        algorithm.termination.evaluations,
+                        time.perf_counter() - self._start_time)
+
+    def cancel(self):
+        """Demande l'arrêt; la fin de l'itération (ou finish()) rend le résultat"""
+        self.algorithm.termination.request_stop()
+
+    def finish(self) -> dict:
+        """Exécute les pas restants et rend le résultat"""
+        if self.result is None:
+            deque(self._steps, maxlen=0)
+        return self.result
+
+    def close(self):
+        """Abandonne l'exécution sans résultat (libère processus et instrumentation)"""
+        self._steps.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Snapshot:
+        loop = asyncio.get_running_loop()
+        snapshot = await loop.run_in_executor(None, next, self, None)
+        if snapshot is None:
+            raise StopAsyncIteration
+        return snapshot
+
+    async def afinish(self, executor=None) -> dict:
+        """
+        finish() dans un executor; si la tâche est annulée, l'exécution est
+        arrêtée au pas suivant avant de propager l'annulation
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, self.finish)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
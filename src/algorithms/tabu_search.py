@@ -2,76 +2,181 @@
 Algorithme de Recherche Tabou
 """
 
-from typing import Any, Tuple, List
-import copy
+from typing import Any, Dict, Generator, Hashable, Iterable, Tuple
 from .base import Algorithm
+from .termination import Termination
 from src.problems.base import OptimizationProblem
 
 
 class TabuSearch(Algorithm):
     """
     Recherche Tabou (Tabu Search)
-    - Maintient une liste de mouvements interdits (tabous)
+    - Mémoire tabou par attributs (bit inversé, arête du tour...): un
+      mouvement est tabou s'il rétablit un attribut retiré récemment
+    - Expiration par numéro d'itération, test en O(1)
     - Critère d'aspiration pour accepter un mouvement tabou
+    - Mémoire de fréquence optionnelle pour la diversification
     """
 
     def __init__(self, problem: OptimizationProblem,
                  tabu_tenure: int = 10,
-                 max_iterations: int = 500):
-        super().__init__(problem, "Tabu Search")
+                 max_iterations: int = 500,
+                 frequency_penalty: float = 0.0,
+                 seed: int = None,
+                 termination: Termination = None):
+        """
+        frequency_penalty: pénalité par modification passée d'un attribut,
+                           appliquée aux mouvements non améliorants (0 = aucune)
+        """
+        super().__init__(problem, "Tabu Search", seed, termination)
         self.tabu_tenure = tabu_tenure
         self.max_iterations = max_iterations
-        self.tabu_list = []
+        self.frequency_penalty = frequency_penalty
+        self.tabu_until: Dict[Hashable, int] = {}  # attribut -> fin d'interdiction
+        self.frequency: Dict[Hashable, int] = {}   # attribut -> nb de modifications
+
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
+        # Mémoires remises à zéro à chaque exécution
+        self.tabu_until = {}
+        self.frequency = {}
 
-    def solve(self) -> Tuple[Any, float]:
         # Solution initiale
-        current = self.problem.random_solution()
+        current = self.problem.random_solution(self.rng)
         current_value = self.problem.evaluate(current)
 
-        best = copy.deepcopy(current)
-        best_value = current_value
+        self.convergence_history = [current_value]
 
-        self.convergence_history = [best_value]
+        if self.problem.supports_moves():
+            return (yield from self._steps_with_moves(current, current_value))
+
+        best = self.problem.copy_solution(current)
+        best_value = current_value
+        stop, emit = self.termination.check, self.progress.emit
+        phase = self.profiler.phase
+        evaluations = 1
 
         for iteration in range(self.max_iterations):
             # Générer plusieurs voisins
-            neighbors = [self.problem.get_neighbor(current) for _ in range(20)]
+            with phase('neighborhood'):
+                neighbors = [self.problem.get_neighbor(current, self.rng)
+                             for _ in range(20)]
 
             # Trouver le meilleur voisin non tabou
             best_neighbor = None
             best_neighbor_value = -float('inf')
-            best_move = None
+            best_key = None
 
-            for i, neighbor in enumerate(neighbors):
-                value = self.problem.evaluate(neighbor)
-                move = str(neighbor)  # Représentation simplifiée du mouvement
+            with phase('evaluation'):
+                values = self.problem.evaluate_batch(neighbors)
+            evaluations += len(neighbors)
+
+            for neighbor, value in zip(neighbors, values.tolist()):
+                # Sans API de mouvements, l'attribut est la solution elle-même
+                key = self.problem.solution_key(neighbor)
 
                 # Critère d'aspiration
-                is_tabu = move in self.tabu_list
+                is_tabu = self.tabu_until.get(key, -1) > iteration
                 aspiration = value > best_value
 
                 if (not is_tabu or aspiration) and value > best_neighbor_value:
                     best_neighbor = neighbor
                     best_neighbor_value = value
-                    best_move = move
+                    best_key = key
 
             if best_neighbor is None:
                 break
 
             # Mettre à jour
+            self.profiler.count('moves_accepted')
             current = best_neighbor
             current_value = best_neighbor_value
-
-            # Ajouter à la liste taboue
-            self.tabu_list.append(best_move)
-            if len(self.tabu_list) > self.tabu_tenure:
-                self.tabu_list.pop(0)
+            self.tabu_until[best_key] = iteration + self.tabu_tenure
 
             # Mettre à jour le meilleur
             if current_value > best_value:
-                best = copy.deepcopy(current)
+                best = self.problem.copy_solution(current)
                 best_value = current_value
 
             self.convergence_history.append(best_value)
+            emit(best_value, evaluations)
+            if stop(best_value, evaluations):
+                break
+            yield current_value, best_value
 
         return best, best_value
+
+    def _steps_with_moves(self, current, current_value):
+        """Variante par mouvements: les voisins ne sont jamais matérialisés"""
+        problem, rng = self.problem, self.rng
+        tabu_until, frequency = self.tabu_until, self.frequency
+        penalty = self.frequency_penalty
+        best = current
+        best_value = current_value
+        at_best = True  # `current` est la meilleure solution (pas encore copiée)
+        stop, emit = self.termination.check, self.progress.emit
+        phase = self.profiler.phase
+        evaluations = 1
+
+        for iteration in range(self.max_iterations):
+            # Trouver le meilleur mouvement non tabou parmi plusieurs
+            best_move = None
+            best_delta = -float('inf')
+            best_score = -float('inf')
+
+            with phase('neighborhood'):
+                for _ in range(20):
+                    move = problem.random_move(current, rng)
+                    delta = problem.move_delta(current, move)
+                    added, _ = problem.move_attributes(current, move)
+
+                    # Critère d'aspiration
+                    is_tabu = any(tabu_until.get(a, -1) > iteration for a in added)
+                    aspiration = current_value + delta > best_value
+                    if is_tabu and not aspiration:
+                        continue
+
+                    score = delta
+                    if penalty and delta <= 0:
+                        # Diversification: pénaliser les attributs souvent modifiés
+                        score -= penalty * self._frequency(added)
+
+                    if score > best_score:
+                        best_move, best_delta, best_score = move, delta, score
+
+            evaluations += 20
+            if best_move is None:
+                break
+
+            # Les attributs retirés ne peuvent pas revenir pendant tabu_tenure
+            added, removed = problem.move_attributes(current, best_move)
+            expiry = iteration + self.tabu_tenure
+            for attribute in removed:
+                tabu_until[attribute] = expiry
+            if penalty:
+                for attribute in added:
+                    frequency[attribute] = frequency.get(attribute, 0) + 1
+
+            # Mettre à jour (la meilleure n'est copiée que si on la quitte)
+            new_value = current_value + best_delta
+            if new_value > best_value:
+                at_best = True
+                best_value = new_value
+            elif at_best:
+                best = problem.copy_solution(current)
+                at_best = False
+            problem.apply_move(current, best_move)
+            current_value = new_value
+
+            self.convergence_history.append(best_value)
+            emit(best_value, evaluations)
+            if stop(best_value, evaluations):
+                break
+            yield current_value, best_value
+
+        if at_best:
+            best = current
+        return best, self.problem.evaluate(best)
+
+    def _frequency(self, attributes: Iterable[Hashable]) -> int:
+        frequency = self.frequency
+        return sum(frequency.get(a, 0) for a in attributes)
@@ -0,0 +1,122 @@
+"""
+Critères d'arrêt communs à tous les algorithmes
+"""
+
+import time
+from typing import Optional
+
+# Intervalle minimal entre deux consultations de l'événement d'arrêt (s)
+EVENT_POLL_INTERVAL = 0.01
+
+# Raison d'arrêt quand aucun critère ne s'est déclenché
+COMPLETED = 'completed'
+
+
+class Termination:
+    """
+    Budget d'exécution d'un algorithme
+    - time_limit: durée maximale en secondes (horloge murale)
+    - max_evaluations: nombre maximal d'évaluations de solutions
+    - target: valeur cible, arrêt dès qu'elle est atteinte
+    - patience: nombre maximal d'itérations sans amélioration
+    - stop_event: arrêt externe (threading.Event ou multiprocessing.Event)
+    - request_stop(): arrêt demandé par l'appelant (SolverStream.cancel())
+
+    Les algorithmes appellent check() une fois par itération de leur boucle
+    principale (palier de température, génération, nœud...), puis rendent
+    leur meilleure solution. Le budget d'évaluations peut donc être dépassé
+    d'au plus une itération. Le critère déclenché est gardé dans `reason`.
+    """
+
+    def __init__(self, time_limit: Optional[float] = None,
+                 max_evaluations: Optional[int] = None,
+                 target: Optional[float] = None,
+                 patience: Optional[int] = None,
+                 stop_event=None):
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.target = target
+        self.patience = patience
+        self.stop_event = stop_event
+        self.start()
+
+    def start(self):
+        """(Re)démarre le chronomètre et les compteurs"""
+        self.start_time = time.perf_counter()
+        self.deadline = (self.start_time + self.time_limit
+                         if self.time_limit is not None else float('inf'))
+        self.iterations = 0
+        self.evaluations = 0
+        self.best_value = -float('inf')
+        self.last_improvement = 0
+        self.reason = None
+        self.stop_requested = False
+        self._next_poll = self.start_time
+
+    def check(self, best_value: float, evaluations: int = 0) -> bool:
+        """
+        Enregistre une itération et indique si l'algorithme doit s'arrêter
+        evaluations: nombre cumulé d'évaluations depuis le début
+        """
+        self.iterations += 1
+        self.evaluations = evaluations
+        if best_value > self.best_value:
+            self.best_value = best_value
+            self.last_improvement = self.iterations
+
+        if self.target is not None and best_value >= self.target:
+            self.reason = 'target'
+        elif self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            self.reason = 'evaluations'
+        elif (self.patience is not None
+              and self.iterations - self.last_improvement >= self.patience):
+            self.reason = 'stagnation'
+        else:
+            return self.expired()
+        return True
+
+    def expired(self) -> bool:
+        """Échéance dépassée ou arrêt demandé (sans compter d'itération)"""
+        now = time.perf_counter()
+        if now >= self.deadline:
+            self.reason = 'stopped' if self.stop_requested else 'deadline'
+            return True
+        # L'événement peut coûter un verrou: consulté au plus toutes les 10 ms
+        if self.stop_event is not None and now >= self._next_poll:
+            self._next_poll = now + EVENT_POLL_INTERVAL
+            if self.stop_event.is_set():
+                self.reason = 'stopped'
+                return True
+        return False
+
+    def request_stop(self):
+        """Arrêt au prochain check() ou expired() (sûr depuis un autre thread)"""
+        # Échéance avancée: aucun test supplémentaire dans expired()
+        self.stop_requested = True
+        self.deadline = -float('inf')
+
+    def remaining_time(self) -> Optional[float]:
+        """Secondes restantes avant l'échéance (None sans limite de temps)"""
+        if self.time_limit is None and not self.stop_requested:
+            return None
+        return max(0.0, self.deadline - time.perf_counter())
+
+    @property
+    def stop_reason(self) -> str:
+        return self.reason or COMPLETED
+
+    def replace(self, **changes) -> 'Termination':
+        """Copie (redémarrée) avec certains critères remplacés"""
+        params = dict(time_limit=self.time_limit,
+                      max_evaluations=self.max_evaluations,
+                      target=self.target,
+                      patience=self.patience,
+                      stop_event=self.stop_event)
+        params.update(changes)
+        return Termination(**params)
+
+    def __getstate__(self):
+        # Un threading.Event ne se sérialise pas: le processus fils fournit le sien
+        state = self.__dict__.copy()
+        state['stop_event'] = None
+        return state
@@ -0,0 +1,227 @@
+"""
+Algorithme Génétique vectorisé (population NumPy)
+"""
+
+from typing import Any, Generator, Tuple
+
+import numpy as np
+
+from .base import Algorithm
+from .termination import Termination
+from src.problems.base import OptimizationProblem
+from src.problems.cache import unwrap
+from src.problems.knapsack import KnapsackProblem
+from src.problems.tsp import TSPProblem
+
+# Nombre maximal d'éléments traités d'un bloc lors de la réparation
+REPAIR_BLOCK = 1 << 22
+
+
+class VectorizedGeneticAlgorithm(Algorithm):
+    """
+    Algorithme Génétique vectorisé
+    - Population dans un tableau 2-D préalloué, double tampon par génération
+    - Sélection, croisement et mutation appliqués à toute la population
+    - Élitisme par argpartition
+    Mêmes paramètres et même format de résultats que GeneticAlgorithm.
+    Encodages: binaire (Knapsack) ou permutation (TSP).
+    """
+
+    def __init__(self, problem: OptimizationProblem,
+                 population_size: int = 50,
+                 generations: int = 100,
+                 crossover_rate: float = 0.8,
+                 mutation_rate: float = 0.1,
+                 elitism: int = 2,
+                 tournament_size: int = 3,
+                 seed: int = None,
+                 termination: Termination = None):
+        super().__init__(problem, "Vectorized Genetic Algorithm", seed, termination)
+        if isinstance(unwrap(problem), KnapsackProblem):
+            self.encoding = 'binary'
+        elif isinstance(unwrap(problem), TSPProblem):
+            self.encoding = 'permutation'
+        else:
+            raise ValueError("GA vectorisé implémenté pour Knapsack et TSP")
+        self.population_size = population_size
+        self.generations = generations
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.elitism = min(elitism, population_size)
+        self.tournament_size = tournament_size
+
+    def steps(self) -> Generator[Tuple[float, float], None, Tuple[Any, float]]:
+        size, elitism = self.population_size, self.elitism
+        n_children = size - elitism
+
+        # Double tampon: `population` est lue, `offspring` est écrite
+        dtype = np.uint8 if self.encoding == 'binary' else np.int32
+        population = np.empty((size, self.problem.n), dtype=dtype)
+        offspring = np.empty_like(population)
+
+        self._initialize(population)
+        fitness = self.problem.evaluate_batch(population)
+        next_fitness = np.empty_like(fitness)
+        stop, emit = self.termination.check, self.progress.emit
+        phase = self.profiler.phase
+        evaluations = size
+
+        for generation in range(self.generations):
+            self.convergence_history.append(float(fitness.max()))
+
+            # Élitisme
+            if elitism:
+                elite = np.argpartition(-fitness, elitism - 1)[:elitism]
+                offspring[:elitism] = population[elite]
+                next_fitness[:elitism] = fitness[elite]
+
+            if n_children:
+                # Sélection par tournoi (tous les parents d'un coup)
+                half = (n_children + 1) // 2
+                with phase('selection'):
+                    parents = self._tournament_selection(fitness, 2 * half)
+                    parents1 = population[parents[:half]]
+                    parents2 = population[parents[half:]]
+
+                # Croisement
+                with phase('crossover'):
+                    children = np.concatenate(self._crossover(parents1, parents2))
+                    children = children[:n_children]
+
+                # Mutation
+                with phase('mutation'):
+                    self._mutate(children)
+                    if self.encoding == 'binary':
+                        self._repair(children)
+
+                offspring[elitism:] = children
+                with phase('evaluation'):
+                    next_fitness[elitism:] = self.problem.evaluate_batch(children)
+
+            population, offspring = offspring, population
+            fitness, next_fitness = next_fitness, fitness
+            evaluations += n_children
+            best_value = float(fitness.max())
+            emit(best_value, evaluations)
+            if stop(best_value, evaluations):
+                break
+            yield best_value, best_value
+
+        # Retourner le meilleur
+        best_idx = int(np.argmax(fitness))
+        return population[best_idx].tolist(), float(fitness[best_idx])
+
+    def _initialize(self, population: np.ndarray):
+        """Population initiale aléatoire (faisable)"""
+        size, n = population.shape
+        if self.encoding == 'permutation':
+            population[:] = self.np_rng.permuted(
+                np.tile(np.arange(n, dtype=population.dtype), (size, 1)), axis=1)
+        else:
+            population[:] = 1
+            self._repair(population)
+
+    def _tournament_selection(self, fitness: np.ndarray, count: int) -> np.ndarray:
+        """Indices des vainqueurs de `count` tournois"""
+        contenders = self.np_rng.integers(0, len(fitness),
+                                          size=(count, self.tournament_size))
+        winners = np.argmax(fitness[contenders], axis=1)
+        return contenders[np.arange(count), winners]
+
+    def _crossover(self, parents1: np.ndarray, parents2: np.ndarray):
+        """Croisement uniforme (binaire) ou ordonné (permutation)"""
+        m = len(parents1)
+        crossed = self.np_rng.random(m) < self.crossover_rate
+        child1, child2 = parents1.copy(), parents2.copy()
+        if not crossed.any():
+            return child1, child2
+
+        p1, p2 = parents1[crossed], parents2[crossed]
+        if self.encoding == 'binary':
+            mask = self.np_rng.random(p1.shape) < 0.5
+            child1[crossed] = np.where(mask, p1, p2)
+            child2[crossed] = np.where(mask, p2, p1)
+        else:
+            cuts = np.sort(
+                self.np_rng.integers(0, p1.shape[1], size=(len(p1), 2)), axis=1)
+            child1[crossed] = self._order_crossover(p1, p2, cuts)
+            child2[crossed] = self._order_crossover(p2, p1, cuts)
+        return child1, child2
+
+    @staticmethod
+    def _order_crossover(p1: np.ndarray, p2: np.ndarray, cuts: np.ndarray) -> np.ndarray:
+        """
+        Croisement ordonné: l'enfant hérite du segment cuts de p1, les autres
+        villes sont placées dans l'ordre où elles apparaissent dans p2
+        """
+        m, n = p1.shape
+        rows = np.arange(m)[:, None]
+        cols = np.arange(n)
+        in_segment = (cols >= cuts[:, :1]) & (cols <= cuts[:, 1:])
+
+        # Villes déjà fournies par le segment de p1
+        inherited = np.zeros((m, n), dtype=bool)
+        inherited[rows, p1] = in_segment
+
+        # Villes restantes, dans l'ordre de p2
+        missing = ~inherited[rows, p2]
+        fill = np.take_along_axis(
+            p2, np.argsort(~missing, axis=1, kind='stable'), axis=1)
+
+        # Positions libres de l'enfant, de gauche à droite
+        slots = np.argsort(in_segment, axis=1, kind='stable')
+        n_free = n - in_segment.sum(axis=1, keepdims=True)
+
+        child = p1.copy()
+        child[rows, slots] = np.where(cols < n_free, fill, p1[rows, slots])
+        return child
+
+    def _mutate(self, children: np.ndarray):
+        """Mutation sur place: flip d'un bit ou inversion 2-opt d'un segment"""
+        mutated = np.nonzero(self.np_rng.random(len(children)) < self.mutation_rate)[0]
+        if not len(mutated):
+            return
+        n = children.shape[1]
+        if self.encoding == 'binary':
+            bits = self.np_rng.integers(0, n, size=len(mutated))
+            children[mutated, bits] ^= 1
+        else:
+            cuts = np.sort(self.np_rng.integers(0, n, size=(len(mutated), 2)), axis=1)
+            cols = np.arange(n)
+            i, j = cuts[:, :1], cuts[:, 1:]
+            index = np.where((cols >= i) & (cols <= j), i + j - cols, cols)
+            children[mutated] = np.take_along_axis(children[mutated], index, axis=1)
+
+    def _repair(self, population: np.ndarray):
+        """
+        Rend faisables les solutions binaires qui dépassent la capacité:
+        les objets pris sont parcourus dans un ordre aléatoire et chacun est
+        gardé s'il tient encore (un objet léger après un dépassement aussi)
+        """
+        problem = self.problem
+        infeasible = np.nonzero(population @ problem.weights_array > problem.capacity)[0]
+        n = population.shape[1]
+        block = max(1, REPAIR_BLOCK // max(n, 1))
+
+        for start in range(0, len(infeasible), block):
+            rows = infeasible[start:start + block]
+            x = population[rows].astype(bool)
+            keys = self.np_rng.random(x.shape)
+            keys[~x] = np.inf  # Objets non pris en dernier
+            order = np.argsort(keys, axis=1)
+            taken = np.take_along_axis(x, order, axis=1)
+            weights = problem.weights_array[order] * taken
+            load = np.cumsum(weights, axis=1)
+
+            # Avant le premier dépassement, tout tient; ensuite objet par objet
+            first = int(np.argmax(load > problem.capacity, axis=1).min())
+            last = int(taken.sum(axis=1).max())
+            keep = taken.copy()
+            remaining = problem.capacity - (load[:, first - 1] if first else 0)
+            for col in range(first, last):
+                fits = taken[:, col] & (weights[:, col] <= remaining)
+                keep[:, col] = fits
+                remaining = remaining - np.where(fits, weights[:, col], 0)
+            repaired = np.zeros_like(x)
+            np.put_along_axis(repaired, order, keep, axis=1)
+            population[rows] = repaired
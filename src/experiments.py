@@ -0,0 +1,389 @@
+"""
+Plans d'expériences: grille problèmes × algorithmes × paramètres × graines,
+exécutée en parallèle et enregistrée au fil de l'eau dans SQLite
+
+Usage:
+    python -m src.experiments plan.json --db data/results/experiments.db -j 8
+    python -m src.experiments plan.json --db data/results/experiments.db --summary
+
+Plan (JSON):
+    {
+      "name": "knapsack-20",
+      "problems": [{"id": "kp20", "type": "knapsack", "random": {"n": 20},
+                    "instances": 10}],
+      "algorithms": [
+        {"label": "Hill Climbing", "algorithm": "hill_climbing",
+         "params": {"max_iterations": 500}},
+        {"algorithm": "simulated_annealing", "grid": {"cooling_rate": [0.9, 0.95]}}
+      ],
+      "seeds": 3,
+      "termination": {"time_limit": 1.0}
+    }
+- problems: définitions de src/registry.py avec un 'id'; "instances": k
+  génère k instances aléatoires (graines random.seed + 0..k-1)
+- algorithms: 'grid' donne une variante par combinaison de paramètres
+- seeds: nombre de graines (0..n-1) ou liste de graines
+Une cellule = (instance, variante, graine); son identifiant est l'empreinte
+de sa définition. Chaque cellule terminée est enregistrée aussitôt: une
+relance ignore les cellules déjà résolues et retente celles en erreur.
+"""
+
+import argparse
+import copy
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import time
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                as_completed, wait)
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from src.registry import build_job, make_problem, to_jsonable, validate_job
+
+# Paquets envoyés en avance par processus (mémoire bornée)
+PENDING_PER_WORKER = 4
+
+# Instances gardées par processus de travail (cellules groupées par instance)
+PROBLEM_CACHE = 8
+
+# Champs du résultat de run() rangés dans leurs propres colonnes
+COLUMNS = ('best_value', 'execution_time', 'iterations', 'evaluations', 'stop_reason')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cells (
+    experiment TEXT NOT NULL,
+    cell_id TEXT NOT NULL,
+    problem_id TEXT NOT NULL,
+    label TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    params TEXT NOT NULL,
+    seed INTEGER,
+    best_value REAL,
+    execution_time REAL,
+    iterations INTEGER,
+    evaluations INTEGER,
+    stop_reason TEXT,
+    result TEXT,
+    error TEXT,
+    finished_at REAL NOT NULL,
+    PRIMARY KEY (experiment, cell_id)
+)
+"""
+
+
+def _problems(plan: dict) -> Iterator[tuple]:
+    """(id, définition) de chaque instance du plan"""
+    for index, entry in enumerate(plan.get('problems', ())):
+        entry = dict(entry)
+        problem_id = str(entry.pop('id', f"{entry.get('type')}-{index}"))
+        count = entry.pop('instances', None)
+        if count is None:
+            yield problem_id, entry
+            continue
+        if 'random' not in entry:
+            raise ValueError(f"{problem_id}: 'instances' exige une instance aléatoire ('random')")
+        base_seed = entry['random'].get('seed', 0)
+        for offset in range(count):
+            spec = copy.deepcopy(entry)
+            spec['random']['seed'] = base_seed + offset
+            yield f"{problem_id}-{offset}", spec
+
+
+def _variants(plan: dict) -> Iterator[tuple]:
+    """(étiquette, algorithme, paramètres) de chaque variante du plan"""
+    for entry in plan.get('algorithms', ()):
+        name = entry['algorithm']
+        label = entry.get('label', name)
+        params = dict(entry.get('params', {}))
+        grid = entry.get('grid', {})
+        keys = sorted(grid)
+        for values in itertools.product(*(grid[key] for key in keys)):
+            variant = {**params, **dict(zip(keys, values))}
+            suffix = ','.join(f"{key}={value}" for key, value in zip(keys, values))
+            yield (f"{label}[{suffix}]" if suffix else label), name, variant
+
+
+def expand(plan: dict) -> List[dict]:
+    """Cellules du plan, groupées par instance"""
+    seeds = plan.get('seeds', 1)
+    seeds = list(range(seeds)) if isinstance(seeds, int) else list(seeds)
+    termination = plan.get('termination') or {}
+    variants = list(_variants(plan))
+    labels = [label for label, _, _ in variants]
+    if len(set(labels)) != len(labels):
+        raise ValueError("étiquettes d'algorithmes en double dans le plan")
+
+    cells, problem_ids = [], set()
+    for problem_id, spec in _problems(plan):
+        if problem_id in problem_ids:
+            raise ValueError(f"identifiant d'instance en double: {problem_id}")
+        problem_ids.add(problem_id)
+        for label, name, params in variants:
+            for seed in seeds:
+                job = {'problem': spec, 'algorithm': name, 'params': params,
+                       'seed': seed, 'termination': termination}
+                validate_job(job)
+                cell_id = hashlib.sha1(json.dumps(job, sort_keys=True).encode()).hexdigest()
+                cells.append({'cell_id': cell_id, 'problem_id': problem_id,
+                              'label': label, 'job': job})
+    return cells
+
+
+class ResultStore:
+    """
+    Résultats des cellules dans une base SQLite
+    Écrite par le seul processus principal (WAL: lectures concurrentes possibles).
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(SCHEMA)
+        self.connection.commit()
+
+    def done(self, experiment: str) -> Set[str]:
+        """Cellules déjà résolues sans erreur"""
+        cursor = self.connection.execute(
+            'SELECT cell_id FROM cells WHERE experiment = ? AND error IS NULL', (experiment,))
+        return {cell_id for cell_id, in cursor}
+
+    def add(self, experiment: str, rows: List[dict]):
+        """Enregistre des cellules terminées (remplace une tentative en erreur)"""
+        fields = ('cell_id', 'problem_id', 'label', 'algorithm', 'params', 'seed',
+                  *COLUMNS, 'result', 'error', 'finished_at')
+        self.connection.executemany(
+            f"INSERT OR REPLACE INTO cells (experiment, {', '.join(fields)}) "
+            f"VALUES ({', '.join('?' * (len(fields) + 1))})",
+            [(experiment, *(row[field] for field in fields)) for row in rows])
+        self.connection.commit()
+
+    def rows(self, experiment: Optional[str] = None,
+             cells: Optional[Set[str]] = None) -> List[dict]:
+        """
+        Cellules enregistrées (params et result décodés); `cells` ne garde
+        que ces identifiants (celles d'un plan modifié depuis, par exemple)
+        """
+        query, args = 'SELECT * FROM cells', ()
+        if experiment is not None:
+            query, args = query + ' WHERE experiment = ?', (experiment,)
+        cursor = self.connection.execute(query + ' ORDER BY rowid', args)
+        names = [column[0] for column in cursor.description]
+        rows = []
+        for values in cursor:
+            row = dict(zip(names, values))
+            if cells is not None and row['cell_id'] not in cells:
+                continue
+            row['params'] = json.loads(row['params'])
+            row['result'] = json.loads(row['result']) if row['result'] else None
+            rows.append(row)
+        return rows
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@lru_cache(maxsize=PROBLEM_CACHE)
+def _problem(spec: str):
+    """Instance construite une fois par processus (clé: définition JSON)"""
+    return make_problem(json.loads(spec))
+
+
+def _run_cells(cells: List[dict], solutions: bool = False) -> List[dict]:
+    """Résout un paquet de cellules: lignes prêtes pour ResultStore.add"""
+    rows = []
+    for cell in cells:
+        job = cell['job']
+        row = {'cell_id': cell['cell_id'], 'problem_id': cell['problem_id'],
+               'label': cell['label'], 'algorithm': job['algorithm'],
+               'params': json.dumps(job['params'], sort_keys=True), 'seed': job['seed'],
+               'result': None, 'error': None, **dict.fromkeys(COLUMNS)}
+        try:
+            problem = _problem(json.dumps(job['problem'], sort_keys=True))
+            result = to_jsonable(build_job(job, problem).run())
+            if not solutions:
+                result.pop('solution', None)
+            for column in COLUMNS:
+                row[column] = result.pop(column, None)
+            row['result'] = json.dumps(result)
+        except Exception as exc:
+            row['error'] = f"{type(exc).__name__}: {exc}"
+        row['finished_at'] = time.time()
+        rows.append(row)
+    return rows
+
+
+def run_experiment(plan: dict, db_path: str, workers: Optional[int] = None,
+                   chunk_size: int = 1,
+                   log: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
+    """
+    Exécute les cellules restantes du plan sur `workers` processus (0: dans
+    le processus courant) et retourne {'total', 'skipped', 'solved', 'failed'}
+    Une interruption (KeyboardInterrupt) ne perd que les cellules en cours.
+    """
+    name = plan.get('name', 'experiment')
+    workers = os.cpu_count() if workers is None else workers
+    solutions = bool(plan.get('solutions', False))
+    log = log or (lambda message: print(message, file=sys.stderr))
+    cells = expand(plan)
+
+    with ResultStore(db_path) as store:
+        done = store.done(name)
+        todo = [cell for cell in cells if cell['cell_id'] not in done]
+        counts = {'total': len(cells), 'skipped': len(cells) - len(todo),
+                  'solved': 0, 'failed': 0}
+        chunks = [todo[i:i + max(1, chunk_size)]
+                  for i in range(0, len(todo), max(1, chunk_size))]
+        start_time = time.perf_counter()
+
+        def record(rows: List[dict]):
+            store.add(name, rows)
+            failed = sum(row['error'] is not None for row in rows)
+            counts['solved'] += len(rows) - failed
+            counts['failed'] += failed
+            finished = counts['solved'] + counts['failed']
+            log(f"{name}: {finished}/{len(todo)} cellules "
+                f"({counts['failed']} en erreur, {time.perf_counter() - start_time:.1f}s)")
+
+        if workers == 0:
+            for chunk in chunks:
+                record(_run_cells(chunk, solutions))
+            return counts
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending = set()
+            for chunk in chunks:
+                pending.add(executor.submit(_run_cells, chunk, solutions))
+                if len(pending) >= workers * PENDING_PER_WORKER:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record(future.result())
+            for future in as_completed(pending):
+                record(future.result())
+        finally:
+            # Sur interruption: les paquets non commencés sont abandonnés
+            executor.shutdown(wait=True, cancel_futures=True)
+    return counts
+
+
+def summarize(rows: List[dict]) -> dict:
+    """
+    Statistiques de compare_all depuis les cellules enregistrées:
+    - by_label: par variante, nombre d'exécutions et d'erreurs, moyenne et
+      écart-type (échantillon) de la valeur et du temps
+    - best_per_instance: meilleure cellule de chaque instance
+    - wins: instances où la variante a la meilleure valeur moyenne
+    """
+    solved = [row for row in rows if row['error'] is None]
+    by_label: Dict[str, dict] = {}
+    for row in rows:
+        stats = by_label.setdefault(row['label'], {'runs': 0, 'failed': 0,
+                                                   'values': [], 'times': []})
+        if row['error'] is not None:
+            stats['failed'] += 1
+            continue
+        stats['runs'] += 1
+        stats['values'].append(row['best_value'])
+        stats['times'].append(row['execution_time'])
+
+    def spread(values):
+        return statistics.stdev(values) if len(values) > 1 else None
+
+    for stats in by_label.values():
+        values, times = stats.pop('values'), stats.pop('times')
+        stats.update({'value_mean': statistics.fmean(values) if values else None,
+                      'value_std': spread(values),
+                      'time_mean': statistics.fmean(times) if times else None,
+                      'time_std': spread(times)})
+
+    best_per_instance, means = {}, {}
+    for row in solved:
+        best = best_per_instance.get(row['problem_id'])
+        if best is None or row['best_value'] > best['best_value']:
+            best_per_instance[row['problem_id']] = {
+                'label': row['label'], 'seed': row['seed'], 'best_value': row['best_value']}
+        means.setdefault(row['problem_id'], {}).setdefault(row['label'], []).append(
+            row['best_value'])
+
+    wins = dict.fromkeys(by_label, 0)
+    for by_variant in means.values():
+        averages = {label: statistics.fmean(values) for label, values in by_variant.items()}
+        top = max(averages.values())
+        for label, average in averages.items():
+            wins[label] += average == top
+    return {'by_label': by_label, 'best_per_instance': best_per_instance, 'wins': wins}
+
+
+def format_summary(summary: dict) -> str:
+    """Tableaux texte d'un résumé"""
+    def number(value):
+        return '-' if value is None else f"{value:.4f}"
+
+    width = max([len('variante'), *map(len, summary['by_label'])])
+    lines = [f"{'variante':<{width}} {'exéc.':>6} {'err.':>5} {'valeur moy.':>14} "
+             f"{'écart-type':>12} {'temps moy.':>11} {'écart-type':>11} {'gagnées':>8}"]
+    for label, stats in sorted(summary['by_label'].items()):
+        lines.append(f"{label:<{width}} {stats['runs']:>6} {stats['failed']:>5} "
+                     f"{number(stats['value_mean']):>14} {number(stats['value_std']):>12} "
+                     f"{number(stats['time_mean']):>11} {number(stats['time_std']):>11} "
+                     f"{summary['wins'][label]:>8}")
+    lines.append('')
+    lines.append('Meilleur par instance:')
+    for problem_id, best in summary['best_per_instance'].items():
+        lines.append(f"  {problem_id:<20} {best['label']:<{width}} {best['best_value']:.4f}")
+    return '\n'.join(lines)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m src.experiments',
+        description="Exécute un plan d'expériences et enregistre chaque cellule dans SQLite")
+    parser.add_argument('plan', help="plan d'expériences (JSON)")
+    parser.add_argument('--db', default='data/results/experiments.db',
+                        help="base SQLite des résultats (créée au besoin)")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help="processus de travail (0: dans le processus courant)")
+    parser.add_argument('--chunk-size', type=int, default=1,
+                        help="cellules par envoi à un processus (petites instances)")
+    parser.add_argument('--summary', action='store_true',
+                        help="affiche le résumé des cellules enregistrées sans rien exécuter")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    with open(args.plan) as f:
+        plan = json.load(f)
+    name = plan.get('name', 'experiment')
+    if not args.summary:
+        try:
+            counts = run_experiment(plan, args.db, args.workers, args.chunk_size)
+        except KeyboardInterrupt:
+            print("interrompu: relancer la même commande pour continuer", file=sys.stderr)
+            return 130
+        print(f"{counts['solved']} cellules résolues ({counts['failed']} en erreur), "
+              f"{counts['skipped']} déjà présentes sur {counts['total']}", file=sys.stderr)
+    cells = {cell['cell_id'] for cell in expand(plan)}
+    with ResultStore(args.db) as store:
+        print(format_summary(summarize(store.rows(name, cells))))
+    return 1 if not args.summary and counts['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,14 +3,22 @@ Classe abstraite pour définir un problème d'optimisation
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List
+import pickle
+import random
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.rng import make_rng
 
 
 class OptimizationProblem(ABC):
     """Classe de base pour tous les problèmes d'optimisation"""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, seed: Optional[int] = None):
         self.name = name
+        # Flux par défaut; les algorithmes passent le leur via `rng`
+        self.rng = make_rng(seed)
 
     @abstractmethod
     def evaluate(self, solution: Any) -> float:
@@ -23,14 +31,67 @@ class OptimizationProblem(ABC):
         pass
 
     @abstractmethod
-    def random_solution(self) -> Any:
+    def random_solution(self, rng: Optional[random.Random] = None) -> Any:
         """Génère une solution aléatoire valide"""
         pass
 
     @abstractmethod
-    def get_neighbor(self, solution: Any) -> Any:
+    def get_neighbor(self, solution: Any, rng: Optional[random.Random] = None) -> Any:
         """Génère une solution voisine"""
         pass
 
+    def evaluate_batch(self, solutions: Sequence[Any]) -> np.ndarray:
+        """
+        Évalue plusieurs solutions (tableau 2-D ou liste, une par ligne)
+        Les sous-classes à backend NumPy la redéfinissent en version vectorisée.
+        """
+        return np.array([self.evaluate(s) for s in solutions], dtype=np.float64)
+
+    def is_feasible_batch(self, solutions: Sequence[Any]) -> np.ndarray:
+        """Faisabilité de plusieurs solutions (tableau booléen)"""
+        return np.array([self.is_feasible(s) for s in solutions], dtype=bool)
+
+    # API de mouvements (optionnelle)
+    # Un mouvement est proposé, son delta évalué sans copier la solution,
+    # puis appliqué sur place seulement s'il est accepté.
+
+    def supports_moves(self) -> bool:
+        """Indique si le problème implémente l'API de mouvements"""
+        return False
+
+    def random_move(self, solution: Any, rng: Optional[random.Random] = None) -> Any:
+        """Propose un mouvement aléatoire (sans modifier la solution)"""
+        raise NotImplementedError
+
+    def move_delta(self, solution: Any, move: Any) -> float:
+        """Variation de evaluate() si le mouvement était appliqué"""
+        raise NotImplementedError
+
+    def apply_move(self, solution: Any, move: Any) -> Any:
+        """Applique le mouvement sur place et retourne la solution"""
+        raise NotImplementedError
+
+    def move_attributes(self, solution: Any, move: Any) -> Tuple[tuple, tuple]:
+        """
+        Attributs (ajoutés, retirés) par le mouvement, pour la mémoire tabou
+        Par défaut, le mouvement lui-même.
+        """
+        return (move,), (move,)
+
+    def copy_solution(self, solution: Any) -> Any:
+        """Copie une solution (utilisé pour mémoriser la meilleure)"""
+        return solution.copy()
+
+    def encode(self, values: List[Any]) -> Any:
+        """Solution dans la représentation du problème à partir d'une liste"""
+        return values
+
+    def solution_key(self, solution: Any) -> bytes:
+        """
+        Clé compacte et exacte d'une solution (cache d'évaluations)
+        Les sous-classes la redéfinissent avec un encodage plus dense.
+        """
+        return pickle.dumps(solution, pickle.HIGHEST_PROTOCOL)
+
     def __str__(self):
-        return f"Problem: {self.name}"
\ No newline at end of file
+        return f"Problem: {self.name}"
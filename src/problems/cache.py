@@ -0,0 +1,156 @@
+"""
+Cache LRU des évaluations (problèmes à évaluation coûteuse)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from .base import OptimizationProblem
+
+
+class CachedProblem(OptimizationProblem):
+    """
+    Enveloppe un problème et mémorise evaluate() par solution
+    - Clé: problem.solution_key(solution) (bits compactés pour Knapsack,
+      octets int32 pour TSP), comparée exactement
+    - Taille bornée, éviction du moins récemment utilisé
+    - Statistiques: hits, misses, evictions, hit_rate
+    Le reste (mouvements, voisinage, attributs comme n ou capacity) est
+    délégué au problème enveloppé: les solveurs propres à un type de
+    problème le reconnaissent avec unwrap(). Rentable seulement si evaluate() coûte
+    plus cher que le calcul de la clé.
+    """
+
+    def __init__(self, problem: OptimizationProblem, maxsize: int = 1 << 16):
+        super().__init__(f"{problem.name} (cached)")
+        self.problem = problem
+        self.rng = problem.rng
+        self.maxsize = maxsize
+        self._cache: 'OrderedDict[bytes, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getattr__(self, name: str):
+        # Appelé seulement si l'attribut manque: délégation au problème
+        if name == 'problem':
+            raise AttributeError(name)
+        return getattr(self.problem, name)
+
+    def __getstate__(self):
+        # Le cache et le verrou ne sont pas transmis aux processus
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: bytes) -> Optional[float]:
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _store(self, key: bytes, value: float):
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def evaluate(self, solution: Any) -> float:
+        key = self.problem.solution_key(solution)
+        value = self._lookup(key)
+        if value is None:
+            value = self.problem.evaluate(solution)
+            self._store(key, value)
+        return value
+
+    def evaluate_batch(self, solutions: Sequence[Any]) -> np.ndarray:
+        """Seules les solutions absentes du cache sont évaluées (en un lot)"""
+        keys = [self.problem.solution_key(s) for s in solutions]
+        values = np.empty(len(keys), dtype=np.float64)
+        missing = {}  # clé -> indices (doublons du lot évalués une fois)
+        for i, key in enumerate(keys):
+            value = self._lookup(key)
+            if value is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                values[i] = value
+        if missing:
+            first = [indices[0] for indices in missing.values()]
+            computed = self.problem.evaluate_batch([solutions[i] for i in first])
+            for (key, indices), value in zip(missing.items(), computed.tolist()):
+                values[indices] = value
+                self._store(key, value)
+        return values
+
+    def is_feasible(self, solution: Any) -> bool:
+        return self.problem.is_feasible(solution)
+
+    def is_feasible_batch(self, solutions: Sequence[Any]) -> np.ndarray:
+        return self.problem.is_feasible_batch(solutions)
+
+    def random_solution(self, rng=None) -> Any:
+        return self.problem.random_solution(rng)
+
+    def get_neighbor(self, solution: Any, rng=None) -> Any:
+        return self.problem.get_neighbor(solution, rng)
+
+    def supports_moves(self) -> bool:
+        return self.problem.supports_moves()
+
+    def random_move(self, solution: Any, rng=None) -> Any:
+        return self.problem.random_move(solution, rng)
+
+    def move_delta(self, solution: Any, move: Any) -> float:
+        return self.problem.move_delta(solution, move)
+
+    def apply_move(self, solution: Any, move: Any) -> Any:
+        return self.problem.apply_move(solution, move)
+
+    def move_attributes(self, solution: Any, move: Any):
+        return self.problem.move_attributes(solution, move)
+
+    def copy_solution(self, solution: Any) -> Any:
+        return self.problem.copy_solution(solution)
+
+    def solution_key(self, solution: Any) -> bytes:
+        return self.problem.solution_key(solution)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def cache_info(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'size': len(self._cache),
+                'maxsize': self.maxsize, 'hit_rate': self.hit_rate}
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __str__(self):
+        return f"{self.problem} (cached)"
+
+
+def unwrap(problem: OptimizationProblem) -> OptimizationProblem:
+    """Problème enveloppé par un CachedProblem (sinon le problème lui-même)"""
+    while isinstance(problem, CachedProblem):
+        problem = problem.problem
+    return problem
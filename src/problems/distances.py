@@ -0,0 +1,249 @@
+"""
+Matrices de distances pour le TSP (NumPy, cache disque optionnel)
+"""
+
+import hashlib
+import math
+import os
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+# Types de stockage disponibles ('int' = arrondi TSPLIB EUC_2D)
+DTYPES = {
+    'float64': np.float64,
+    'float32': np.float32,
+    'int': np.int32,
+}
+
+# Nombre de lignes calculées à la fois (borne la mémoire temporaire)
+BLOCK_ROWS = 512
+
+
+def _check_dtype(dtype: str):
+    if dtype not in DTYPES:
+        raise ValueError(f"dtype inconnu: {dtype} (choix: {', '.join(DTYPES)})")
+    return DTYPES[dtype]
+
+
+# Distances calculées depuis les coordonnées (types TSPLIB): 'euclidean'
+# (EUC_2D avec dtype 'int'), 'ceil' (CEIL_2D), 'att' (ATT) et 'geo' (GEO)
+METRICS = ('euclidean', 'ceil', 'att', 'geo')
+
+# Constantes de TSPLIB pour GEO (PI tronqué comme dans la référence)
+GEO_PI = 3.141592
+GEO_RADIUS = 6378.388
+
+
+def _check_metric(metric: str):
+    if metric not in METRICS:
+        raise ValueError(f"métrique inconnue: {metric} (choix: {', '.join(METRICS)})")
+
+
+def prepare_coords(coords, metric: str = 'euclidean') -> np.ndarray:
+    """
+    Coordonnées (n, 2) en float64; pour 'geo', (latitude, longitude) en
+    radians depuis le format DDD.MM (degrés.minutes) de TSPLIB
+    """
+    _check_metric(metric)
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    if metric == 'geo':
+        degrees = np.trunc(coords)
+        coords = GEO_PI * (degrees + 5.0 * (coords - degrees) / 3.0) / 180.0
+    return coords
+
+
+def pair_distances(a: np.ndarray, b: np.ndarray, metric: str = 'euclidean',
+                   rounded: bool = False) -> np.ndarray:
+    """
+    Distances entre les points a[..., :] et b[..., :] (coordonnées préparées,
+    diffusion NumPy); rounded: nint() de TSPLIB pour 'euclidean'
+    """
+    if metric == 'geo':
+        q1 = np.cos(a[..., 1] - b[..., 1])
+        q2 = np.cos(a[..., 0] - b[..., 0])
+        q3 = np.cos(a[..., 0] + b[..., 0])
+        cosine = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        return np.floor(GEO_RADIUS * np.arccos(cosine) + 1.0)
+    dx = a[..., 0] - b[..., 0]
+    dy = a[..., 1] - b[..., 1]
+    if metric == 'att':
+        r = np.sqrt((dx * dx + dy * dy) / 10.0)
+        t = np.floor(r + 0.5)
+        return t + (t < r)
+    d = np.hypot(dx, dy)
+    if metric == 'ceil':
+        return np.ceil(d)
+    return np.floor(d + 0.5) if rounded else d
+
+
+def scalar_distance(metric: str = 'euclidean', rounded: bool = False):
+    """Version scalaire (math) de pair_distances: f(xi, yi, xj, yj)"""
+    _check_metric(metric)
+    if metric == 'geo':
+        def geo(lat_i, lon_i, lat_j, lon_j):
+            q1 = math.cos(lon_i - lon_j)
+            q2 = math.cos(lat_i - lat_j)
+            q3 = math.cos(lat_i + lat_j)
+            cosine = min(1.0, max(-1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)))
+            return math.floor(GEO_RADIUS * math.acos(cosine) + 1.0)
+        return geo
+    if metric == 'att':
+        def att(xi, yi, xj, yj):
+            r = math.sqrt(((xi - xj) ** 2 + (yi - yj) ** 2) / 10.0)
+            t = math.floor(r + 0.5)
+            return t + 1 if t < r else t
+        return att
+    if metric == 'ceil':
+        return lambda xi, yi, xj, yj: math.ceil(math.hypot(xi - xj, yi - yj))
+    if rounded:
+        return lambda xi, yi, xj, yj: math.floor(math.hypot(xi - xj, yi - yj) + 0.5)
+    return lambda xi, yi, xj, yj: math.hypot(xi - xj, yi - yj)
+
+
+def fill_distances(coords: np.ndarray, out: np.ndarray,
+                   metric: str = 'euclidean') -> np.ndarray:
+    """Remplit `out` (n×n) par blocs de lignes, sans double boucle Python"""
+    rounded = np.issubdtype(out.dtype, np.integer)
+    for start in range(0, len(coords), BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, len(coords))
+        out[start:stop] = pair_distances(coords[start:stop, None, :],
+                                         coords[None, :, :], metric, rounded)
+        rows = np.arange(start, stop)
+        out[rows, rows] = 0  # GEO donne 1 entre une ville et elle-même
+    return out
+
+
+def distance_matrix(coords, dtype: str = 'float64',
+                    metric: str = 'euclidean') -> np.ndarray:
+    """Matrice des distances en mémoire"""
+    np_dtype = _check_dtype(dtype)
+    coords = prepare_coords(coords, metric)
+    n = len(coords)
+    return fill_distances(coords, np.empty((n, n), dtype=np_dtype), metric)
+
+
+def instance_key(coords, dtype: str, metric: str = 'euclidean') -> str:
+    """Empreinte des coordonnées (clé du fichier de cache)"""
+    coords = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 2)
+    digest = hashlib.sha1(coords.tobytes())
+    digest.update(dtype.encode())
+    if metric != 'euclidean':  # Clés existantes inchangées
+        digest.update(metric.encode())
+    return digest.hexdigest()
+
+
+def cached_distance_matrix(coords, dtype: str = 'float64',
+                           cache_dir: Optional[str] = None,
+                           metric: str = 'euclidean') -> np.ndarray:
+    """
+    Matrice mappée en mémoire depuis `cache_dir`
+
+    Le fichier .npy est construit au premier appel puis rouvert en lecture
+    seule: les exécutions suivantes démarrent sans recalcul et partagent les
+    pages entre processus.
+    """
+    np_dtype = _check_dtype(dtype)
+    key = instance_key(coords, dtype, metric)
+    coords = prepare_coords(coords, metric)
+    n = len(coords)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"tsp_{n}_{key}.npy")
+
+    if not os.path.exists(path):
+        # Écriture dans un fichier temporaire puis renommage atomique
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        out = np.lib.format.open_memmap(tmp_path, mode='w+',
+                                        dtype=np_dtype, shape=(n, n))
+        fill_distances(coords, out, metric)
+        out.flush()
+        del out
+        os.replace(tmp_path, path)
+
+    return np.load(path, mmap_mode='r')
+
+
+def matrix_bytes(n: int, dtype: str = 'float64') -> int:
+    """Taille mémoire d'une matrice n×n complète"""
+    return n * n * np.dtype(_check_dtype(dtype)).itemsize
+
+
+class MatrixDistances:
+    """Oracle de distances adossé à une matrice complète"""
+
+    def __init__(self, matrix: np.ndarray):
+        self.matrix = matrix
+        self.item = matrix.item  # Accès scalaire, même API que CoordinateDistances
+
+    def gather(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Distances des paires (a[k], b[k])"""
+        return self.matrix[a, b]
+
+    def __reduce__(self):
+        # Une matrice en cache disque est rouverte (pages partagées)
+        # au lieu d'être copiée dans le pickle
+        filename = getattr(self.matrix, 'filename', None)
+        if isinstance(self.matrix, np.memmap) and filename:
+            return _open_cached_matrix, (filename,)
+        return MatrixDistances, (np.asarray(self.matrix),)
+
+
+def _open_cached_matrix(path: str) -> MatrixDistances:
+    return MatrixDistances(np.load(path, mmap_mode='r'))
+
+
+class CoordinateDistances:
+    """
+    Oracle sans matrice: distances calculées à la demande
+
+    Ne garde que les coordonnées (O(n) mémoire) et un cache LRU borné
+    pour les paires de villes fréquemment consultées.
+    """
+
+    def __init__(self, coords, dtype: str = 'float64', cache_size: int = 1 << 16,
+                 metric: str = 'euclidean'):
+        _check_dtype(dtype)
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        self.dtype = dtype
+        self.cache_size = cache_size
+        self.metric = metric
+        self._rounded = dtype == 'int'
+        self._points = prepare_coords(self.coords, metric)
+        self._distance = scalar_distance(metric, self._rounded)
+        # Listes Python: l'accès scalaire y est plus rapide que sur un ndarray
+        self._xs = self._points[:, 0].tolist()
+        self._ys = self._points[:, 1].tolist()
+        self._pair = lru_cache(maxsize=cache_size)(self._compute)
+
+    def _compute(self, i: int, j: int) -> float:
+        if i == j:
+            return 0
+        return self._distance(self._xs[i], self._ys[i], self._xs[j], self._ys[j])
+
+    def item(self, i: int, j: int) -> float:
+        """Distance entre les villes i et j"""
+        if i > j:
+            i, j = j, i
+        return self._pair(i, j)
+
+    def gather(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Distances des paires (a[k], b[k]), vectorisé"""
+        return pair_distances(self._points[a], self._points[b],
+                              self.metric, self._rounded)
+
+    def rows(self, start: int, stop: int) -> np.ndarray:
+        """Lignes start:stop de la matrice des distances, calculées à la demande"""
+        block = pair_distances(self._points[start:stop, None, :],
+                               self._points[None, :, :], self.metric, self._rounded)
+        block[np.arange(stop - start), np.arange(start, stop)] = 0
+        return block
+
+    def cache_info(self):
+        """Statistiques du cache LRU (hits, misses, taille)"""
+        return self._pair.cache_info()
+
+    def __reduce__(self):
+        return CoordinateDistances, (self.coords, self.dtype, self.cache_size,
+                                     self.metric)
@@ -3,10 +3,141 @@ Problème du Sac à Dos (Knapsack Problem)
 """
 
 import random
-from typing import List
+from typing import List, Optional, Sequence
+
+import numpy as np
+
 from .base import OptimizationProblem
 
 
+class KnapsackSolution(list):
+    """
+    Solution 0-1 qui maintient son poids et sa valeur totaux
+
+    Reste une liste de bits, mais doit être modifiée via
+    KnapsackProblem.flip / apply_move pour que les totaux restent exacts.
+    """
+
+    __slots__ = ('weight', 'value')
+
+    def __init__(self, bits=(), weight: int = 0, value: int = 0):
+        super().__init__(bits)
+        self.weight = weight
+        self.value = value
+
+    def copy(self) -> 'KnapsackSolution':
+        return KnapsackSolution(self, self.weight, self.value)
+
+    def __reduce__(self):
+        return KnapsackSolution, (list(self), self.weight, self.value)
+
+
+class KnapsackArray(np.ndarray):
+    """
+    Solution 0-1 en tableau NumPy uint8 (1 octet par objet) avec ses totaux
+    Mêmes règles que KnapsackSolution: modifiée via KnapsackProblem.flip.
+    """
+
+    def __new__(cls, bits=(), weight: int = 0, value: int = 0):
+        solution = np.array(bits, dtype=np.uint8).view(cls)
+        solution.weight = weight
+        solution.value = value
+        return solution
+
+    def __array_finalize__(self, obj):
+        # Copies et vues héritent des totaux
+        self.weight = getattr(obj, 'weight', 0)
+        self.value = getattr(obj, 'value', 0)
+
+    def __iter__(self):
+        # Entiers Python: les sommes `poids * bit` ne débordent pas en uint8
+        return iter(self.tolist())
+
+    def __reduce__(self):
+        return KnapsackArray, (np.asarray(self), self.weight, self.value)
+
+
+class KnapsackBitset:
+    """
+    Solution 0-1 compactée à 1 bit par objet (n/8 octets) avec ses totaux
+    Se comporte comme une séquence de bits (len, indexation, itération);
+    np.asarray() la décompacte en uint8.
+    """
+
+    __slots__ = ('data', 'n', 'weight', 'value')
+
+    def __init__(self, bits=(), weight: int = 0, value: int = 0):
+        if isinstance(bits, KnapsackBitset):
+            self.data, self.n = bytearray(bits.data), bits.n
+        else:
+            bits = np.asarray(bits, dtype=np.uint8)
+            self.data = bytearray(np.packbits(bits, bitorder='little').tobytes())
+            self.n = len(bits)
+        self.weight = weight
+        self.value = value
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.tolist()[i]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("indice de bit hors limites")
+        return (self.data[i >> 3] >> (i & 7)) & 1
+
+    def __setitem__(self, i: int, bit: int):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("indice de bit hors limites")
+        if bit:
+            self.data[i >> 3] |= 1 << (i & 7)
+        else:
+            self.data[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+    def __array__(self, dtype=None, copy=None):
+        bits = np.unpackbits(np.frombuffer(self.data, dtype=np.uint8),
+                             count=self.n, bitorder='little')
+        return bits if dtype is None else bits.astype(dtype)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    __hash__ = None
+
+    def tolist(self) -> List[int]:
+        return self.__array__().tolist()
+
+    def copy(self) -> 'KnapsackBitset':
+        return KnapsackBitset(self, self.weight, self.value)
+
+    def __repr__(self):
+        return f"KnapsackBitset({self.tolist()})"
+
+
+def _numeric_array(numbers) -> np.ndarray:
+    """int64 si toutes les valeurs sont entières, sinon float64 (jamais tronqué)"""
+    array = np.asarray(numbers)
+    if array.dtype.kind in 'biu':
+        return array.astype(np.int64)
+    return array.astype(np.float64)
+
+
+# Représentations des solutions (paramètre `representation`)
+REPRESENTATIONS = {
+    'list': KnapsackSolution,   # liste Python, 8 octets par objet
+    'array': KnapsackArray,     # uint8, 1 octet par objet
+    'bitset': KnapsackBitset,   # 1 bit par objet
+}
+_TRACKED = tuple(REPRESENTATIONS.values())
+
+
 class KnapsackProblem(OptimizationProblem):
     """
     Problème du sac à dos 0-1
@@ -16,62 +147,172 @@ class KnapsackProblem(OptimizationProblem):
     où x[i] ∈ {0, 1}
     """
 
-    def __init__(self, weights: List[int], values: List[int], capacity: int):
-        super().__init__("Knapsack Problem")
+    def __init__(self, weights: List[int], values: List[int], capacity: int,
+                 seed: Optional[int] = None, representation: str = 'list'):
+        """
+        representation: type des solutions créées ('list', 'array' pour
+                        uint8 ou 'bitset' pour 1 bit par objet); evaluate
+                        et les mouvements acceptent les trois
+        """
+        if representation not in REPRESENTATIONS:
+            raise ValueError(f"représentation inconnue: {representation} "
+                             f"(choix: {', '.join(REPRESENTATIONS)})")
+        super().__init__("Knapsack Problem", seed)
+        self.representation = representation
+        self.solution_type = REPRESENTATIONS[representation]
         self.weights = weights
         self.values = values
         self.capacity = capacity
         self.n = len(weights)
         self.optimal_value = None  # Si connu
+        self.weights_array = _numeric_array(weights)
+        self.values_array = _numeric_array(values)
 
     def evaluate(self, solution: List[int]) -> float:
         """Retourne la valeur totale (ou -inf si invalide)"""
+        if isinstance(solution, _TRACKED):
+            if solution.weight > self.capacity:
+                return -float('inf')
+            return solution.value
+        if isinstance(solution, np.ndarray):
+            return float(self.evaluate_batch(solution)[0])
         if not self.is_feasible(solution):
             return -float('inf')
         return sum(v * s for v, s in zip(self.values, solution))
 
     def is_feasible(self, solution: List[int]) -> bool:
         """Vérifie la contrainte de capacité"""
+        if isinstance(solution, _TRACKED):
+            return solution.weight <= self.capacity
+        if isinstance(solution, np.ndarray):
+            return bool(solution @ self.weights_array <= self.capacity)
         total_weight = sum(w * s for w, s in zip(self.weights, solution))
         return total_weight <= self.capacity
 
-    def random_solution(self) -> List[int]:
-        """Génère une solution aléatoire faisable"""
-        solution = [0] * self.n
-        for i in random.sample(range(self.n), self.n):
+    def evaluate_batch(self, solutions: Sequence[List[int]]) -> np.ndarray:
+        """Produits matrice-vecteur sur la matrice (N, n) des solutions"""
+        if not isinstance(solutions, np.ndarray) and all(
+                isinstance(s, _TRACKED) for s in solutions):
+            # Totaux déjà maintenus: O(1) par solution
+            return np.array([self.evaluate(s) for s in solutions], dtype=np.float64)
+        x = self._as_matrix(solutions)
+        values = (x @ self.values_array).astype(np.float64)
+        values[x @ self.weights_array > self.capacity] = -np.inf
+        return values
+
+    def is_feasible_batch(self, solutions: Sequence[List[int]]) -> np.ndarray:
+        x = self._as_matrix(solutions)
+        return x @ self.weights_array <= self.capacity
+
+    def _as_matrix(self, solutions) -> np.ndarray:
+        """Matrice (N, n) des bits, quelle que soit la représentation"""
+        if not isinstance(solutions, np.ndarray) and any(
+                isinstance(s, KnapsackBitset) for s in solutions):
+            solutions = [np.asarray(s) for s in solutions]
+        return np.asarray(solutions).reshape(-1, self.n)
+
+    def make_solution(self, bits: List[int]) -> KnapsackSolution:
+        """Construit une solution (totaux calculés une seule fois)"""
+        if isinstance(bits, list):
+            weight = sum(w * s for w, s in zip(self.weights, bits))
+            value = sum(v * s for v, s in zip(self.values, bits))
+        else:
+            x = np.asarray(bits, dtype=np.int64)
+            weight = (x @ self.weights_array).item()
+            value = (x @ self.values_array).item()
+        return self.solution_type(bits, weight, value)
+
+    def can_flip(self, solution: KnapsackSolution, i: int) -> bool:
+        """O(1): le flip du bit i garde-t-il la solution faisable ?"""
+        return solution[i] or solution.weight + self.weights[i] <= self.capacity
+
+    def flip(self, solution: KnapsackSolution, i: int) -> KnapsackSolution:
+        """O(1): inverse le bit i sur place en mettant à jour les totaux"""
+        if solution[i]:
+            solution[i] = 0
+            solution.weight -= self.weights[i]
+            solution.value -= self.values[i]
+        else:
             solution[i] = 1
-            if not self.is_feasible(solution):
-                solution[i] = 0
+            solution.weight += self.weights[i]
+            solution.value += self.values[i]
         return solution
 
-    def get_neighbor(self, solution: List[int]) -> List[int]:
+    def _as_state(self, solution: List[int]) -> KnapsackSolution:
+        if isinstance(solution, _TRACKED):
+            return solution
+        return self.make_solution(solution)
+
+    def random_solution(self, rng: Optional[random.Random] = None) -> KnapsackSolution:
+        """Génère une solution aléatoire faisable"""
+        rng = rng or self.rng
+        solution = self.solution_type([0] * self.n)
+        for i in rng.sample(range(self.n), self.n):
+            if solution.weight + self.weights[i] <= self.capacity:
+                self.flip(solution, i)
+        return solution
+
+    def get_neighbor(self, solution: List[int],
+                     rng: Optional[random.Random] = None) -> KnapsackSolution:
         """Flip un bit aléatoire"""
-        neighbor = solution.copy()
-        i = random.randint(0, self.n - 1)
-        neighbor[i] = 1 - neighbor[i]
-        return neighbor if self.is_feasible(neighbor) else solution
+        state = self._as_state(solution)
+        i = (rng or self.rng).randrange(self.n)
+        if not self.can_flip(state, i):
+            return state
+        return self.flip(state.copy(), i)
 
-    def get_all_neighbors(self, solution: List[int]) -> List[List[int]]:
+    def get_all_neighbors(self, solution: List[int]) -> List[KnapsackSolution]:
         """Retourne tous les voisins valides"""
-        neighbors = []
-        for i in range(self.n):
-            neighbor = solution.copy()
-            neighbor[i] = 1 - neighbor[i]
-            if self.is_feasible(neighbor):
-                neighbors.append(neighbor)
-        return neighbors
+        state = self._as_state(solution)
+        return [self.flip(state.copy(), i)
+                for i in range(self.n) if self.can_flip(state, i)]
+
+    def supports_moves(self) -> bool:
+        return True
+
+    def random_move(self, solution: List[int],
+                    rng: Optional[random.Random] = None) -> int:
+        """Un mouvement est l'indice du bit à inverser"""
+        return (rng or self.rng).randrange(self.n)
+
+    def move_delta(self, solution: List[int], move: int) -> float:
+        """Delta O(1) (-inf si le flip viole la capacité)"""
+        state = self._as_state(solution)
+        if not self.can_flip(state, move):
+            return -float('inf')
+        return -self.values[move] if state[move] else self.values[move]
+
+    def apply_move(self, solution: KnapsackSolution, move: int) -> KnapsackSolution:
+        return self.flip(solution, move)
+
+    def move_attributes(self, solution: List[int], move: int):
+        """L'attribut d'un flip est l'indice du bit"""
+        return (move,), (move,)
+
+    def copy_solution(self, solution: List[int]) -> KnapsackSolution:
+        return self._as_state(solution).copy()
+
+    def solution_key(self, solution: List[int]) -> bytes:
+        """Bits compactés: n/8 octets"""
+        if isinstance(solution, KnapsackBitset):
+            return bytes(solution.data)
+        return np.packbits(np.asarray(solution, dtype=np.uint8),
+                           bitorder='little').tobytes()
+
+    def encode(self, bits: List[int]) -> KnapsackSolution:
+        return self.make_solution(bits)
 
     @classmethod
-    def generate_random(cls, n: int = 20, seed: int = None):
-        """Génère une instance aléatoire"""
-        if seed:
-            random.seed(seed)
+    def generate_random(cls, n: int = 20, seed: int = None, **kwargs):
+        """Génère une instance aléatoire (kwargs transmis au constructeur)"""
+        # Générateur local: la graine 0 est respectée, l'état global intact
+        rng = random.Random(seed) if seed is not None else random
 
-        weights = [random.randint(1, 50) for _ in range(n)]
-        values = [random.randint(1, 100) for _ in range(n)]
+        weights = [rng.randint(1, 50) for _ in range(n)]
+        values = [rng.randint(1, 100) for _ in range(n)]
         capacity = int(sum(weights) * 0.5)
 
-        return cls(weights, values, capacity)
+        return cls(weights, values, capacity, seed=seed, **kwargs)
 
     def __str__(self):
-        return f"Knapsack(n={self.n}, capacity={self.capacity})"
\ No newline at end of file
+        return f"Knapsack(n={self.n}, capacity={self.capacity})"
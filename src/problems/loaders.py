@@ -0,0 +1,376 @@
+"""
+Chargement d'instances de référence: TSPLIB (.tsp) et sac à dos (Pisinger)
+
+Le texte est lu par paquets de lignes converties d'un bloc par NumPy; avec
+`cache_dir`, chaque fichier n'est analysé qu'une fois puis rechargé depuis
+un .npz (clé = chemin, taille et date de modification du fichier).
+"""
+
+import hashlib
+import os
+import re
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .knapsack import KnapsackProblem
+from .tsp import TSPProblem
+
+# Lignes lues à la fois dans les sections numériques
+CHUNK_LINES = 1 << 16
+
+# Incrémenté quand le contenu des fichiers .npz change
+CACHE_VERSION = 1
+
+# Types de distance TSPLIB calculés depuis les coordonnées
+TSPLIB_METRICS = {
+    'EUC_2D': 'euclidean',
+    'CEIL_2D': 'ceil',
+    'ATT': 'att',
+    'GEO': 'geo',
+}
+
+# Début d'une ligne non numérique: mot-clé TSPLIB ou séparateur '-----'
+_KEYWORD = re.compile(r'^[ \t]*(?:[A-Za-z]|--)', re.M)
+
+
+class _Lines:
+    """Lignes d'un fichier par paquets, avec remise des lignes non consommées"""
+
+    def __init__(self, f):
+        self.f = f
+        self.pending: Deque[str] = deque()
+
+    def chunk(self, size: int = CHUNK_LINES) -> List[str]:
+        """Au plus `size` lignes (les lignes remises d'abord)"""
+        pending = self.pending
+        if not pending:
+            return list(islice(self.f, size))
+        if len(pending) <= size:
+            lines = list(pending)
+            pending.clear()
+            return lines
+        return [pending.popleft() for _ in range(size)]
+
+    def unread(self, lines: List[str]):
+        self.pending.extendleft(reversed(lines))
+
+    def __iter__(self):
+        """Lignes non vides une à une (en-têtes, mots-clés)"""
+        pending = self.pending
+        while True:
+            if not pending:
+                pending.extend(islice(self.f, CHUNK_LINES))
+                if not pending:
+                    return
+            line = pending.popleft()
+            if line.strip():
+                yield line
+
+
+def _read_numbers(lines: _Lines) -> np.ndarray:
+    """Nombres jusqu'à la prochaine ligne non numérique (ou la fin du fichier)"""
+    # Paquets croissants: une petite section ne relit pas CHUNK_LINES lignes
+    parts, size = [], 64
+    while True:
+        chunk = lines.chunk(size)
+        size = min(2 * size, CHUNK_LINES)
+        if not chunk:
+            break
+        text = ''.join(chunk)
+        match = _KEYWORD.search(text)
+        if match:
+            head = text[:match.start()]
+            lines.unread(chunk[head.count('\n'):])
+            text = head
+        if ',' in text:
+            text = text.replace(',', ' ')
+        parts.append(np.array(text.split(), dtype=np.float64))
+        if match:
+            break
+    return np.concatenate(parts) if parts else np.empty(0)
+
+
+def _integral(values: np.ndarray, dtype=np.int64) -> np.ndarray:
+    """Entiers si toutes les valeurs le sont, sinon float64"""
+    if np.all(values == np.round(values)) and np.abs(values).max(initial=0) < 2 ** 31:
+        return values.astype(dtype)
+    return values
+
+
+# Rangement des poids EXPLICIT: (triangle lu ligne par ligne, décalage de la
+# diagonale); les variantes _COL d'une matrice symétrique sont le triangle
+# opposé lu ligne par ligne
+_TRIANGLES = {
+    'UPPER_ROW': (np.triu_indices, 1),
+    'LOWER_ROW': (np.tril_indices, -1),
+    'UPPER_DIAG_ROW': (np.triu_indices, 0),
+    'LOWER_DIAG_ROW': (np.tril_indices, 0),
+    'UPPER_COL': (np.tril_indices, -1),
+    'LOWER_COL': (np.triu_indices, 1),
+    'UPPER_DIAG_COL': (np.tril_indices, 0),
+    'LOWER_DIAG_COL': (np.triu_indices, 0),
+}
+
+
+def _explicit_matrix(weights: np.ndarray, n: int, fmt: str) -> np.ndarray:
+    """Matrice n×n depuis la section EDGE_WEIGHT_SECTION"""
+    if fmt == 'FULL_MATRIX':
+        expected = n * n
+    elif fmt in _TRIANGLES:
+        indices, offset = _TRIANGLES[fmt]
+        rows, cols = indices(n, offset)
+        expected = len(rows)
+    else:
+        raise ValueError(f"EDGE_WEIGHT_FORMAT non géré: {fmt}")
+    if len(weights) < expected:
+        raise ValueError(f"EDGE_WEIGHT_SECTION incomplète: {len(weights)} "
+                         f"valeurs pour {expected} attendues")
+    weights = _integral(weights[:expected], np.int32)
+    if fmt == 'FULL_MATRIX':
+        return weights.reshape(n, n)
+    matrix = np.zeros((n, n), dtype=weights.dtype)
+    matrix[rows, cols] = weights
+    matrix[cols, rows] = weights
+    return matrix
+
+
+def _coordinates(numbers: np.ndarray, n: int, section: str) -> np.ndarray:
+    """Coordonnées (n, 2) d'une section 'i x y', dans l'ordre des numéros"""
+    if len(numbers) < 3 * n or len(numbers) % 3:
+        raise ValueError(f"{section}: {n} lignes 'i x y' attendues")
+    rows = numbers[:3 * n].reshape(n, 3)
+    order = np.argsort(rows[:, 0], kind='stable')
+    return np.ascontiguousarray(rows[order, 1:])
+
+
+def read_tsplib(path: str) -> Dict[str, object]:
+    """
+    Analyse un fichier TSPLIB (TYPE: TSP)
+    Retourne {'name', 'metric', 'coords', 'matrix'}: coords (n, 2) ou None,
+    matrix (n, n) pour EXPLICIT, sinon None
+    """
+    header = {}
+    coords = display = weights = None
+    with open(path) as f:
+        lines = _Lines(f)
+        for line in lines:
+            key, separator, value = line.partition(':')
+            key, value = key.strip().upper(), value.strip()
+            if key == 'EOF':
+                break
+            if key == 'NODE_COORD_SECTION':
+                coords = _read_numbers(lines)
+            elif key == 'DISPLAY_DATA_SECTION':
+                display = _read_numbers(lines)
+            elif key == 'EDGE_WEIGHT_SECTION':
+                weights = _read_numbers(lines)
+            elif key.endswith('_SECTION'):
+                _read_numbers(lines)  # FIXED_EDGES, TOUR...: ignorées
+            elif value:
+                header[key] = value.split()[0] if key != 'NAME' else value
+            elif not separator:
+                raise ValueError(f"{path}: ligne inattendue: {line.strip()!r}")
+            # 'COMMENT :' sans valeur: ignorée, la valeur par défaut s'applique
+
+    kind = header.get('TYPE', 'TSP')
+    if kind != 'TSP':
+        raise ValueError(f"{path}: TYPE {kind} non géré (TSP symétrique seulement)")
+    if 'DIMENSION' not in header:
+        raise ValueError(f"{path}: DIMENSION manquante")
+    n = int(header['DIMENSION'])
+    edge_type = header.get('EDGE_WEIGHT_TYPE', 'EUC_2D')
+    name = header.get('NAME', os.path.splitext(os.path.basename(path))[0])
+
+    if edge_type == 'EXPLICIT':
+        if weights is None:
+            raise ValueError(f"{path}: EDGE_WEIGHT_SECTION manquante")
+        matrix = _explicit_matrix(weights, n, header.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX'))
+        if display is not None:
+            display = _coordinates(display, n, 'DISPLAY_DATA_SECTION')
+        elif coords is not None:
+            display = _coordinates(coords, n, 'NODE_COORD_SECTION')
+        return {'name': name, 'metric': 'explicit', 'coords': display, 'matrix': matrix}
+
+    if edge_type not in TSPLIB_METRICS:
+        raise ValueError(f"{path}: EDGE_WEIGHT_TYPE {edge_type} non géré "
+                         f"(choix: EXPLICIT, {', '.join(TSPLIB_METRICS)})")
+    if coords is None:
+        raise ValueError(f"{path}: NODE_COORD_SECTION manquante")
+    return {'name': name, 'metric': TSPLIB_METRICS[edge_type],
+            'coords': _coordinates(coords, n, 'NODE_COORD_SECTION'), 'matrix': None}
+
+
+def _parse_knapsack_blocks(lines: _Lines, path: str) -> Iterator[dict]:
+    """Instances au format CSV de Pisinger (nom, n, c, z, time, puis i,p,w,x)"""
+    header = {}
+    for line in lines:
+        text = line.strip()
+        if text.startswith('--'):
+            continue
+        if not _KEYWORD.match(line):
+            # Lignes 'i,profit,poids,x' de l'instance en cours
+            if 'n' not in header or 'c' not in header:
+                raise ValueError(f"{path}: objets sans en-tête 'n' et 'c'")
+            lines.unread([line])
+            n = int(header['n'])
+            rows = _read_numbers(lines)
+            if len(rows) != 4 * n:
+                raise ValueError(f"{path}: instance {header['name']}: "
+                                 f"{n} lignes 'i,profit,poids,x' attendues")
+            rows = rows.reshape(n, 4)
+            z = header.get('z')
+            yield {'name': header['name'], 'values': _integral(rows[:, 1]),
+                   'weights': _integral(rows[:, 2]), 'capacity': int(header['c']),
+                   'optimal_value': int(float(z)) if z is not None else None}
+            header = {}
+            continue
+        key, _, value = text.partition(' ')
+        if key in ('n', 'c', 'z', 'time') and value:
+            header[key] = value.strip()
+        else:
+            header = {'name': text}
+
+
+def read_knapsack(path: str) -> List[dict]:
+    """
+    Analyse un fichier d'instances du sac à dos; formats reconnus:
+    - Pisinger (CSV, plusieurs instances): nom, 'n 100', 'c 995', 'z 1514',
+      'time 0.00', puis lignes 'i,profit,poids,x' et séparateur '-----'
+    - texte: 'n capacité' puis n lignes 'profit poids', suivies
+      éventuellement des n bits de la solution optimale
+    Retourne une liste de {'name', 'values', 'weights', 'capacity',
+    'optimal_value'} (optimal_value: None si inconnue)
+    """
+    base = os.path.splitext(os.path.basename(path))[0]
+    with open(path) as f:
+        lines = _Lines(f)
+        first = next(iter(lines), '')
+        if _KEYWORD.match(first):
+            lines.unread([first])
+            instances = list(_parse_knapsack_blocks(lines, path))
+            if not instances:
+                raise ValueError(f"{path}: aucune instance")
+            return instances
+        lines.unread([first])
+        numbers = _read_numbers(lines)
+
+    if len(numbers) < 2:
+        raise ValueError(f"{path}: en-tête 'n capacité' manquant")
+    n = int(numbers[0])
+    items = numbers[2:2 + 2 * n]
+    if len(items) < 2 * n:
+        raise ValueError(f"{path}: {n} lignes 'profit poids' attendues")
+    items = _integral(items).reshape(n, 2)
+    solution = numbers[2 + 2 * n:2 + 3 * n]
+    optimal = int(items[:, 0] @ solution.astype(np.int64)) if len(solution) == n else None
+    return [{'name': base, 'values': items[:, 0], 'weights': items[:, 1],
+             'capacity': int(numbers[1]), 'optimal_value': optimal}]
+
+
+def _cache_path(path: str, cache_dir: str, kind: str) -> str:
+    """Fichier .npz associé à `path` (invalidé si le fichier change)"""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}:{CACHE_VERSION}"
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{kind}_{name}_{digest[:16]}.npz")
+
+
+def _save_npz(path: str, arrays: Dict[str, np.ndarray]):
+    """Écriture dans un fichier temporaire puis renommage atomique"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _cached(path: str, cache_dir: Optional[str], kind: str, parse, pack, unpack):
+    if cache_dir is None:
+        return parse(path)
+    cache_path = _cache_path(path, cache_dir, kind)
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as data:
+            return unpack(data)
+    parsed = parse(path)
+    _save_npz(cache_path, pack(parsed))
+    return parsed
+
+
+def _pack_tsplib(instance: dict) -> Dict[str, np.ndarray]:
+    arrays = {'name': np.array(instance['name']), 'metric': np.array(instance['metric'])}
+    for key in ('coords', 'matrix'):
+        if instance[key] is not None:
+            arrays[key] = instance[key]
+    return arrays
+
+
+def _unpack_tsplib(data) -> dict:
+    return {'name': str(data['name']), 'metric': str(data['metric']),
+            'coords': data['coords'] if 'coords' in data else None,
+            'matrix': data['matrix'] if 'matrix' in data else None}
+
+
+def _pack_knapsack(instances: List[dict]) -> Dict[str, np.ndarray]:
+    optima = [instance['optimal_value'] for instance in instances]
+    return {
+        'names': np.array([instance['name'] for instance in instances]),
+        'sizes': np.array([len(instance['values']) for instance in instances]),
+        'values': np.concatenate([instance['values'] for instance in instances]),
+        'weights': np.concatenate([instance['weights'] for instance in instances]),
+        'capacities': np.array([instance['capacity'] for instance in instances]),
+        'optima': np.array([-1 if z is None else z for z in optima]),
+    }
+
+
+def _unpack_knapsack(data) -> List[dict]:
+    bounds = np.concatenate(([0], np.cumsum(data['sizes'])))
+    values, weights = data['values'], data['weights']
+    return [{'name': str(name), 'values': values[lo:hi], 'weights': weights[lo:hi],
+             'capacity': int(capacity), 'optimal_value': None if z < 0 else int(z)}
+            for name, lo, hi, capacity, z in zip(data['names'], bounds[:-1], bounds[1:],
+                                                 data['capacities'], data['optima'])]
+
+
+def load_tsplib(path: str, cache_dir: Optional[str] = None, **kwargs) -> TSPProblem:
+    """
+    TSPProblem depuis un fichier TSPLIB (EUC_2D, CEIL_2D, ATT, GEO ou EXPLICIT)
+    Distances entières comme dans TSPLIB (dtype 'int' par défaut); cache_dir
+    sert aussi au cache .npy mappé en mémoire de la matrice calculée; kwargs
+    transmis au constructeur (mode, neighborhood...)
+    """
+    instance = _cached(path, cache_dir, 'tsplib', read_tsplib,
+                       _pack_tsplib, _unpack_tsplib)
+    if instance['matrix'] is not None:
+        problem = TSPProblem(instance['coords'], matrix=instance['matrix'], **kwargs)
+    else:
+        kwargs.setdefault('dtype', 'int')
+        kwargs.setdefault('cache_dir', cache_dir)
+        problem = TSPProblem(instance['coords'], metric=instance['metric'], **kwargs)
+    problem.name = instance['name']
+    return problem
+
+
+def load_knapsack_instances(path: str, cache_dir: Optional[str] = None,
+                            **kwargs) -> List[KnapsackProblem]:
+    """KnapsackProblem de chaque instance du fichier (kwargs: representation, seed)"""
+    instances = _cached(path, cache_dir, 'knapsack', read_knapsack,
+                        _pack_knapsack, _unpack_knapsack)
+    problems = []
+    for instance in instances:
+        problem = KnapsackProblem(instance['weights'].tolist(),
+                                  instance['values'].tolist(),
+                                  instance['capacity'], **kwargs)
+        problem.name = instance['name']
+        problem.optimal_value = instance['optimal_value']
+        problems.append(problem)
+    return problems
+
+
+def load_knapsack(path: str, index: int = 0, cache_dir: Optional[str] = None,
+                  **kwargs) -> KnapsackProblem:
+    """Instance `index` d'un fichier du sac à dos"""
+    return load_knapsack_instances(path, cache_dir, **kwargs)[index]
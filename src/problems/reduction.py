@@ -0,0 +1,108 @@
+"""
+Réduction du problème du sac à dos (fixation de variables)
+"""
+
+from typing import List
+
+import numpy as np
+
+from .knapsack import KnapsackProblem
+
+
+class KnapsackReduction:
+    """
+    Prétraitement d'un KnapsackProblem avant tout algorithme
+
+    - Tri par ratio valeur/poids, objet critique s et borne LP de Dantzig
+    - Borne inférieure: préfixe glouton, complété par le meilleur objet
+      après s qui tient encore
+    - Coûts réduits: un objet j < s est fixé à 1 si le forcer à 0 ne peut
+      pas dépasser la borne inférieure (LP - v_j + r*w_j <= LB); un objet
+      j > s est fixé à 0 si LP + v_j - r*w_j <= LB (r = ratio de s)
+    - Les objets restants (le noyau, autour de s) forment `residual`, dont
+      les solutions sont remontées au problème d'origine par `lift`
+    """
+
+    def __init__(self, problem: KnapsackProblem):
+        self.problem = problem
+        weights, values = problem.weights_array, problem.values_array
+        capacity = problem.capacity
+        integral = all(isinstance(v, (int, np.integer)) for v in problem.values)
+
+        fixed = np.full(problem.n, -1, dtype=np.int8)  # -1 libre, 0 ou 1 fixé
+        # Objets triviaux: trop lourds ou sans valeur à 0, gratuits à 1
+        fixed[(weights > capacity) | (values <= 0)] = 0
+        fixed[(weights == 0) & (values > 0)] = 1
+        capacity -= weights[fixed == 1].sum().item()
+
+        # Tri par ratio décroissant des objets non triviaux
+        candidates = np.nonzero(fixed == -1)[0]
+        ratios = values[candidates] / weights[candidates]
+        order = candidates[np.argsort(-ratios, kind='stable')]
+        prefix_w = np.cumsum(weights[order])
+        prefix_v = np.cumsum(values[order])
+
+        # Objet critique: premier objet trié qui ne tient plus entièrement
+        s = int(np.searchsorted(prefix_w, capacity, side='right'))
+        self.split = int(order[s]) if s < len(order) else None
+        greedy_w = prefix_w[s - 1].item() if s else 0
+        greedy_v = prefix_v[s - 1] if s else 0
+
+        if self.split is None:
+            # Tout tient: la solution gloutonne est optimale
+            fixed[order] = 1
+        else:
+            r = values[self.split] / weights[self.split]
+            upper = greedy_v + (capacity - greedy_w) * r
+
+            # Meilleur objet après s qui tient dans la capacité restante
+            tail = order[s + 1:]
+            fits = tail[weights[tail] <= capacity - greedy_w]
+            extra = int(fits[np.argmax(values[fits])]) if len(fits) else None
+            lower = greedy_v + (values[extra] if extra is not None else 0)
+
+            head = order[:s]
+            bound_out = upper - values[head] + r * weights[head]
+            bound_in = upper + values[tail] - r * weights[tail]
+            if integral:
+                bound_out = np.floor(bound_out + 1e-9)
+                bound_in = np.floor(bound_in + 1e-9)
+            fixed[head[bound_out <= lower]] = 1
+            close = tail[bound_in <= lower]
+            # La solution qui atteint LB doit rester dans le résiduel
+            fixed[close[close != extra]] = 0
+
+        self.fixed = fixed
+        self.fixed_one = np.nonzero(fixed == 1)[0]
+        self.fixed_value = values[self.fixed_one].sum().item()
+        self.fixed_weight = weights[self.fixed_one].sum().item()
+
+        # Noyau trié par ratio: indices d'origine des objets libres
+        free = np.nonzero(fixed == -1)[0]
+        self.free = free[np.argsort(-values[free] / weights[free], kind='stable')]
+        self.residual = KnapsackProblem(
+            [problem.weights[i] for i in self.free],
+            [problem.values[i] for i in self.free],
+            problem.capacity - self.fixed_weight,
+            representation=problem.representation)
+
+    def lift(self, solution: List[int]) -> List[int]:
+        """Solution du problème résiduel -> solution du problème d'origine"""
+        lifted = np.zeros(self.problem.n, dtype=np.int64)
+        lifted[self.fixed_one] = 1
+        lifted[self.free] = np.asarray(solution, dtype=np.int64)
+        return lifted.tolist()
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Fraction des objets fixés"""
+        return 1 - len(self.free) / self.problem.n if self.problem.n else 1.0
+
+    def __str__(self):
+        return (f"KnapsackReduction(n={self.problem.n} -> {len(self.free)}, "
+                f"fixed_value={self.fixed_value})")
+
+
+def reduce_knapsack(problem: KnapsackProblem) -> KnapsackReduction:
+    """Réduit `problem`; résoudre `reduction.residual` puis `reduction.lift`"""
+    return KnapsackReduction(problem)
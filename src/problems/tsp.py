@@ -3,9 +3,86 @@ Problème du Voyageur de Commerce (TSP)
 """
 
 import random
-import math
-from typing import List, Tuple
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from .base import OptimizationProblem
+from .distances import (CoordinateDistances, MatrixDistances,
+                        cached_distance_matrix, distance_matrix, matrix_bytes)
+from .spatial import k_nearest_neighbors, matrix_nearest_neighbors, rows_nearest_neighbors
+
+# Longueur maximale des segments déplacés par Or-opt
+MAX_OR_OPT = 3
+
+# Au-delà, la matrice complète n'est pas allouée (mode 'auto')
+DEFAULT_MEMORY_BUDGET = 1 << 30
+
+
+def _edge(u: int, v: int) -> Tuple[int, int]:
+    return (u, v) if u < v else (v, u)
+
+
+class TSPTour(list):
+    """
+    Tour qui maintient la position de chaque ville (pos[ville] = indice)
+
+    Utilisé avec les listes de candidats; doit être modifié via
+    TSPProblem.apply_move pour que `pos` reste exact.
+    """
+
+    __slots__ = ('pos',)
+
+    def __init__(self, cities=(), pos: Optional[List[int]] = None):
+        super().__init__(cities)
+        if pos is None:
+            pos = [0] * len(self)
+            for idx, city in enumerate(self):
+                pos[city] = idx
+        self.pos = pos
+
+    def copy(self) -> 'TSPTour':
+        return TSPTour(self, self.pos.copy())
+
+    def __reduce__(self):
+        return TSPTour, (list(self), self.pos)
+
+
+class TSPArrayTour(array):
+    """
+    Tour compact array('i') (4 octets par ville) avec les positions `pos`
+    Équivalent de TSPTour pour la représentation 'array'.
+    """
+
+    __slots__ = ('pos',)
+
+    def __new__(cls, cities=(), pos=None):
+        return super().__new__(cls, 'i', cities)
+
+    def __init__(self, cities=(), pos: Optional[array] = None):
+        if pos is None:
+            pos = array('i', bytes(4 * len(self)))
+            for idx, city in enumerate(self):
+                pos[city] = idx
+        self.pos = pos
+
+    def copy(self) -> 'TSPArrayTour':
+        return TSPArrayTour(self, array('i', self.pos))
+
+    def __reduce_ex__(self, protocol):
+        # array définit __reduce_ex__: __reduce__ seul perdrait `pos`
+        return TSPArrayTour, (self.tolist(), self.pos)
+
+
+REPRESENTATIONS = ('list', 'array')
+_TRACKED = (TSPTour, TSPArrayTour)
+
+
+def _segment(tour, lo: int, hi: int):
+    """Copie des positions lo..hi-1 (une tranche NumPy n'est qu'une vue)"""
+    segment = tour[lo:hi]
+    return segment.copy() if isinstance(segment, np.ndarray) else segment
 
 
 class TSPProblem(OptimizationProblem):
@@ -15,32 +92,122 @@ class TSPProblem(OptimizationProblem):
     Minimiser: la distance totale du tour
     """
 
-    def __init__(self, cities: List[Tuple[float, float]]):
-        super().__init__("TSP")
+    def __init__(self, cities: Optional[List[Tuple[float, float]]],
+                 dtype: str = 'float64', cache_dir: Optional[str] = None,
+                 mode: str = 'auto', memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 lru_size: int = 1 << 16, neighborhood: str = 'random',
+                 k_neighbors: int = 8, or_opt_rate: float = 0.3,
+                 representation: str = 'list', metric: str = 'euclidean',
+                 matrix: Optional[np.ndarray] = None, seed: Optional[int] = None):
+        """
+        cities: coordonnées (liste ou tableau (n, 2)); facultatives avec `matrix`
+        dtype: stockage des distances ('float64', 'float32' ou 'int' pour
+               l'arrondi TSPLIB EUC_2D)
+        cache_dir: si fourni, la matrice est mise en cache sur disque
+                   (fichier mappé en mémoire, clé = empreinte des villes)
+        mode: 'matrix' (matrice n×n), 'lazy' (distances à la demande, sans
+              matrice) ou 'auto' (matrice si elle tient dans memory_budget)
+        lru_size: taille du cache des paires en mode 'lazy'
+        neighborhood: 'random' (2-opt uniforme) ou 'knn' (2-opt et Or-opt
+                      restreints aux k_neighbors plus proches voisins)
+        or_opt_rate: proportion de mouvements Or-opt en mode 'knn'
+        representation: type des tours créés ('list' ou 'array' pour
+                        array('i')); evaluate et les mouvements acceptent
+                        aussi les tableaux NumPy int32
+        metric: distance calculée depuis les coordonnées ('euclidean',
+                'ceil', 'att' ou 'geo', voir distances.METRICS)
+        matrix: matrice n×n explicite (EXPLICIT de TSPLIB), utilisée telle
+                quelle à la place des coordonnées (mode 'matrix')
+        seed: graine du flux aléatoire par défaut du problème
+        """
+        super().__init__("TSP", seed)
         self.cities = cities
-        self.n = len(cities)
-        self.distance_matrix = self._compute_distances()
+        self.metric = metric
+        self.cache_dir = cache_dir
 
-    def _compute_distances(self):
-        """Calcule la matrice des distances euclidiennes"""
-        n = self.n
-        dist = [[0.0] * n for _ in range(n)]
-        for i in range(n):
-            for j in range(i + 1, n):
-                d = math.sqrt(
-                    (self.cities[i][0] - self.cities[j][0]) ** 2 +
-                    (self.cities[i][1] - self.cities[j][1]) ** 2
-                )
-                dist[i][j] = dist[j][i] = d
-        return dist
+        if matrix is not None:
+            matrix = np.asarray(matrix)
+            if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+                raise ValueError("la matrice des distances doit être carrée")
+            self.n = len(matrix)
+            self.dtype = str(matrix.dtype)
+            mode = 'matrix'
+        else:
+            self.n = len(cities)
+            self.dtype = dtype
+
+        if mode == 'auto':
+            fits = matrix_bytes(self.n, dtype) <= memory_budget
+            mode = 'matrix' if fits else 'lazy'
+        if mode not in ('matrix', 'lazy'):
+            raise ValueError(f"mode inconnu: {mode}")
+        self.mode = mode
+
+        if mode == 'matrix':
+            self.distance_matrix = matrix if matrix is not None else self._compute_distances()
+            self.distances = MatrixDistances(self.distance_matrix)
+        else:
+            self.distance_matrix = None
+            self.distances = CoordinateDistances(cities, dtype, lru_size, metric)
+
+        if neighborhood not in ('random', 'knn'):
+            raise ValueError(f"voisinage inconnu: {neighborhood}")
+        self.neighborhood = neighborhood
+        if representation not in REPRESENTATIONS:
+            raise ValueError(f"représentation inconnue: {representation} "
+                             f"(choix: {', '.join(REPRESENTATIONS)})")
+        self.representation = representation
+        self.or_opt_rate = or_opt_rate
+        self.candidates = None  # candidates[ville] = k plus proches voisins
+        if neighborhood == 'knn' and self.n > 3:
+            # La grille est exacte pour les distances planes; sinon, la matrice
+            # (GEO sans matrice: lignes calculées par blocs, en O(n²) temps)
+            if matrix is not None or (metric == 'geo' and mode == 'matrix'):
+                neighbors = matrix_nearest_neighbors(self.distance_matrix, k_neighbors)
+            elif metric == 'geo':
+                neighbors = rows_nearest_neighbors(self.distances.rows, self.n, k_neighbors)
+            else:
+                neighbors = k_nearest_neighbors(cities, k_neighbors)
+            self.candidates = neighbors.tolist()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['distance_matrix'] = None  # Partagée avec self.distances
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.mode == 'matrix':
+            self.distance_matrix = self.distances.matrix
+
+    def _compute_distances(self) -> np.ndarray:
+        """Calcule la matrice des distances depuis les coordonnées"""
+        if self.cache_dir is not None:
+            return cached_distance_matrix(self.cities, self.dtype, self.cache_dir,
+                                          self.metric)
+        return distance_matrix(self.cities, self.dtype, self.metric)
+
+    def distance(self, i: int, j: int) -> float:
+        """Distance entre deux villes (quel que soit le mode)"""
+        return self.distances.item(i, j)
 
     def evaluate(self, solution: List[int]) -> float:
         """Retourne la distance totale (à minimiser, donc négative)"""
-        total_distance = 0
-        for i in range(len(solution)):
-            j = (i + 1) % len(solution)
-            total_distance += self.distance_matrix[solution[i]][solution[j]]
-        return -total_distance  # Négatif car on maximise
+        tour = np.asarray(solution)
+        total_distance = self.distances.gather(tour, np.roll(tour, -1)).sum()
+        return -float(total_distance)  # Négatif car on maximise
+
+    def evaluate_batch(self, solutions: Sequence[List[int]]) -> np.ndarray:
+        """Longueurs de N tours par accès groupés aux distances"""
+        tours = np.asarray(solutions).reshape(-1, self.n)
+        lengths = self.distances.gather(tours, np.roll(tours, -1, axis=1))
+        return -lengths.sum(axis=1, dtype=np.float64)
+
+    def is_feasible_batch(self, solutions: Sequence[List[int]]) -> np.ndarray:
+        tours = np.asarray(solutions)
+        if tours.ndim != 2 or tours.shape[1] != self.n:
+            return np.zeros(len(solutions), dtype=bool)
+        return np.all(np.sort(tours, axis=1) == np.arange(self.n), axis=1)
 
     def is_feasible(self, solution: List[int]) -> bool:
         """Vérifie que c'est une permutation valide"""
@@ -48,27 +215,186 @@ class TSPProblem(OptimizationProblem):
                 len(set(solution)) == self.n and
                 all(0 <= city < self.n for city in solution))
 
-    def random_solution(self) -> List[int]:
+    def random_solution(self, rng: Optional[random.Random] = None) -> List[int]:
         """Génère un tour aléatoire"""
         solution = list(range(self.n))
-        random.shuffle(solution)
-        return solution
+        (rng or self.rng).shuffle(solution)
+        return self.encode(solution)
 
-    def get_neighbor(self, solution: List[int]) -> List[int]:
+    def get_neighbor(self, solution: List[int],
+                     rng: Optional[random.Random] = None) -> List[int]:
         """2-opt: inverse un segment"""
-        neighbor = solution.copy()
-        i, j = sorted(random.sample(range(self.n), 2))
-        neighbor[i:j + 1] = reversed(neighbor[i:j + 1])
+        rng = rng or self.rng
+        if self.candidates is not None:
+            neighbor = self.copy_solution(solution)
+            return self.apply_move(neighbor, self.random_move(neighbor, rng))
+        neighbor = self.copy_solution(solution)
+        i, j = sorted(rng.sample(range(self.n), 2))
+        neighbor[i:j + 1] = neighbor[i:j + 1][::-1]
         return neighbor
 
+    def supports_moves(self) -> bool:
+        return True
+
+    def random_move(self, solution: List[int],
+                    rng: Optional[random.Random] = None) -> Tuple[int, ...]:
+        """
+        Mouvements: (i, j) = 2-opt, inverse les positions i..j (i <= j)
+                    (i, j, k, rev) = Or-opt, déplace les positions i..j
+                    après la position k (segment inversé si rev)
+        """
+        rng = rng or self.rng
+        if self.candidates is None:
+            i, j = sorted(rng.sample(range(self.n), 2))
+            return i, j
+        return self._candidate_move(solution, rng)
+
+    def _candidate_move(self, tour: List[int], rng: random.Random) -> Tuple[int, ...]:
+        """Mouvement qui relie une ville à l'un de ses k plus proches voisins"""
+        n = self.n
+        pos = tour.pos if isinstance(tour, _TRACKED) else self._positions(tour)
+        i = rng.randrange(n)
+        pc = pos[rng.choice(self.candidates[tour[i]])]
+
+        if rng.random() < self.or_opt_rate:
+            move = self._or_opt_move(i, pc, rng)
+            if move is not None:
+                return move
+
+        # 2-opt: crée l'arête (tour[i], c) en inversant le segment qui les sépare
+        lo = i + 1 if i + 1 < n else 0
+        if pc >= lo:
+            return lo, pc
+        return pc + 1, i
+
+    def _or_opt_move(self, i: int, pc: int, rng: random.Random):
+        """Or-opt: insère le segment commençant en i à côté de la ville en pc"""
+        n = self.n
+        j = i + rng.randrange(MAX_OR_OPT)
+        if j >= n or n < j - i + 4 or i <= pc <= j:
+            return None
+        # Après c (c relié au début du segment) ou avant c (segment inversé)
+        if rng.random() < 0.5:
+            k, rev = pc, False
+        else:
+            k, rev = (pc - 1) % n, True
+        if k == (i - 1) % n or i <= k <= j:
+            return None
+        return i, j, k, rev
+
+    def move_delta(self, solution: List[int], move: Tuple[int, ...]) -> float:
+        """Delta O(1): seules les arêtes aux bords des segments changent"""
+        if len(move) == 4:
+            return self._or_opt_delta(solution, move)
+        i, j = move
+        n = len(solution)
+        if i == 0 and j == n - 1:
+            return 0.0  # Inverser tout le tour ne change pas sa longueur
+        d = self.distances.item
+        a, b = solution[i - 1], solution[i]
+        c, e = solution[j], solution[(j + 1) % n]
+        # Négatif car evaluate() retourne -distance
+        return float(d(a, b) + d(c, e) - d(a, c) - d(b, e))
+
+    def _or_opt_delta(self, solution: List[int], move: Tuple[int, ...]) -> float:
+        i, j, k, rev = move
+        n = len(solution)
+        d = self.distances.item
+        p, a = solution[i - 1], solution[i]
+        b, nx = solution[j], solution[(j + 1) % n]
+        x, y = solution[k], solution[(k + 1) % n]
+        removed = d(p, a) + d(b, nx) + d(x, y)
+        if rev:
+            added = d(p, nx) + d(x, b) + d(a, y)
+        else:
+            added = d(p, nx) + d(x, a) + d(b, y)
+        return float(removed - added)
+
+    def apply_move(self, solution: List[int], move: Tuple[int, ...]) -> List[int]:
+        """Applique le mouvement sur place"""
+        if len(move) == 4:
+            i, j, k, rev = move
+            segment = _segment(solution, i, j + 1)
+            if rev:
+                segment = segment[::-1]
+            if k > j:
+                # Le bloc j+1..k recule, le segment se place derrière lui
+                middle = _segment(solution, j + 1, k + 1)
+                solution[i:i + len(middle)] = middle
+                solution[i + len(middle):k + 1] = segment
+                lo, hi = i, k
+            else:
+                middle = _segment(solution, k + 1, i)
+                solution[k + 1:k + 1 + len(segment)] = segment
+                solution[k + 1 + len(segment):j + 1] = middle
+                lo, hi = k + 1, j
+        else:
+            lo, hi = move
+            solution[lo:hi + 1] = solution[lo:hi + 1][::-1]
+
+        if isinstance(solution, _TRACKED):
+            pos = solution.pos
+            for idx in range(lo, hi + 1):
+                pos[solution[idx]] = idx
+        return solution
+
+    def move_attributes(self, solution: List[int], move: Tuple[int, ...]):
+        """Arêtes (ajoutées, retirées), chacune notée (min, max)"""
+        n = len(solution)
+        if len(move) == 4:
+            i, j, k, rev = move
+            p, a = solution[i - 1], solution[i]
+            b, nx = solution[j], solution[(j + 1) % n]
+            x, y = solution[k], solution[(k + 1) % n]
+            removed = ((p, a), (b, nx), (x, y))
+            if rev:
+                added = ((p, nx), (x, b), (a, y))
+            else:
+                added = ((p, nx), (x, a), (b, y))
+        else:
+            i, j = move
+            a, b = solution[i - 1], solution[i]
+            c, e = solution[j], solution[(j + 1) % n]
+            removed = ((a, b), (c, e))
+            added = ((a, c), (b, e))
+        return (tuple(_edge(u, v) for u, v in added),
+                tuple(_edge(u, v) for u, v in removed))
+
+    def copy_solution(self, solution: List[int]) -> List[int]:
+        if self.candidates is not None and not isinstance(solution, _TRACKED):
+            return self.encode(solution)
+        if isinstance(solution, array) and not isinstance(solution, TSPArrayTour):
+            return array(solution.typecode, solution)
+        return solution.copy()
+
+    def encode(self, cities: List[int]) -> List[int]:
+        """Tour de la représentation du problème (positions suivies en mode 'knn')"""
+        if self.representation == 'array':
+            if self.candidates is not None:
+                return TSPArrayTour(cities)
+            return array('i', cities)
+        if self.candidates is not None:
+            return TSPTour(cities)
+        return list(cities)
+
+    def solution_key(self, solution: List[int]) -> bytes:
+        """Octets du tour en int32"""
+        return np.asarray(solution, dtype=np.int32).tobytes()
+
+    def _positions(self, tour: List[int]) -> List[int]:
+        pos = [0] * len(tour)
+        for idx, city in enumerate(tour):
+            pos[city] = idx
+        return pos
+
     @classmethod
-    def generate_random(cls, n: int = 20, seed: int = None):
-        """Génère une instance aléatoire"""
-        if seed:
-            random.seed(seed)
-        cities = [(random.uniform(0, 100), random.uniform(0, 100))
+    def generate_random(cls, n: int = 20, seed: int = None, **kwargs):
+        """Génère une instance aléatoire (kwargs transmis au constructeur)"""
+        # Générateur local: la graine 0 est respectée, l'état global intact
+        rng = random.Random(seed) if seed is not None else random
+        cities = [(rng.uniform(0, 100), rng.uniform(0, 100))
                   for _ in range(n)]
-        return cls(cities)
+        return cls(cities, seed=seed, **kwargs)
 
     def __str__(self):
         return f"TSP(n={self.n} cities)"
@@ -0,0 +1,148 @@
+"""
+Registre des problèmes et algorithmes: construction depuis des définitions JSON
+"""
+
+from typing import Any, Dict, Optional, Type
+
+import numpy as np
+
+from src.algorithms.base import Algorithm
+from src.algorithms.branch_and_bound import BranchAndBound
+from src.algorithms.dynamic_programming import DynamicProgramming
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.hill_climbing import HillClimbing
+from src.algorithms.island_model import IslandGeneticAlgorithm
+from src.algorithms.simulated_annealing import SimulatedAnnealing
+from src.algorithms.tabu_search import TabuSearch
+from src.algorithms.termination import Termination
+from src.algorithms.vectorized_ga import VectorizedGeneticAlgorithm
+from src.problems.base import OptimizationProblem
+from src.problems.knapsack import KnapsackProblem
+from src.problems.loaders import load_knapsack, load_tsplib
+from src.problems.tsp import TSPProblem
+
+ALGORITHMS: Dict[str, Type[Algorithm]] = {
+    'hill_climbing': HillClimbing,
+    'simulated_annealing': SimulatedAnnealing,
+    'tabu_search': TabuSearch,
+    'genetic_algorithm': GeneticAlgorithm,
+    'vectorized_ga': VectorizedGeneticAlgorithm,
+    'island_ga': IslandGeneticAlgorithm,
+    'branch_and_bound': BranchAndBound,
+    'dynamic_programming': DynamicProgramming,
+}
+
+PROBLEMS: Dict[str, Type[OptimizationProblem]] = {
+    'knapsack': KnapsackProblem,
+    'tsp': TSPProblem,
+}
+
+# Données obligatoires de chaque type de problème (hors instance aléatoire)
+REQUIRED = {
+    'knapsack': ('weights', 'values', 'capacity'),
+    'tsp': ('cities',),
+}
+
+# Chargement depuis un fichier ({'type': ..., 'file': chemin})
+LOADERS = {
+    'knapsack': load_knapsack,
+    'tsp': load_tsplib,
+}
+
+TERMINATION_KEYS = ('time_limit', 'max_evaluations', 'target', 'patience')
+
+
+def _choice(kind: str, name: Any, choices: dict):
+    if name not in choices:
+        raise ValueError(f"{kind} inconnu: {name} "
+                         f"(choix: {', '.join(choices)})")
+    return choices[name]
+
+
+def make_problem(spec: dict) -> OptimizationProblem:
+    """
+    Problème depuis sa définition:
+        {'type': 'knapsack', 'weights': [...], 'values': [...], 'capacity': 50}
+        {'type': 'tsp', 'cities': [[x, y], ...]}
+        {'type': 'tsp', 'random': {'n': 100, 'seed': 1}}  (generate_random)
+        {'type': 'tsp', 'file': 'a280.tsp', 'cache_dir': '.cache'}  (loaders)
+        {'type': 'knapsack', 'file': 'knapPI_1_100_1000.csv', 'index': 3}
+    Les autres clés sont des paramètres du constructeur (representation, dtype...)
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("la définition du problème doit être un objet JSON")
+    options = dict(spec)
+    kind = options.pop('type', None)
+    problem_class = _choice('type de problème', kind, PROBLEMS)
+    if 'random' in options:
+        return problem_class.generate_random(**options.pop('random'), **options)
+    if 'file' in options:
+        return LOADERS[kind](options.pop('file'), **options)
+
+    missing = [key for key in REQUIRED[kind] if key not in options]
+    if missing:
+        raise ValueError(f"champs manquants pour {kind}: {', '.join(missing)}")
+    if kind == 'tsp':
+        options['cities'] = [tuple(city) for city in options['cities']]
+    return problem_class(**options)
+
+
+def make_termination(spec: Optional[dict] = None) -> Termination:
+    """Budget depuis {'time_limit': 2.0, 'max_evaluations': ..., ...}"""
+    spec = spec or {}
+    unknown = set(spec) - set(TERMINATION_KEYS)
+    if unknown:
+        raise ValueError(f"critères d'arrêt inconnus: {', '.join(sorted(unknown))}")
+    return Termination(**spec)
+
+
+def make_algorithm(name: str, problem: OptimizationProblem,
+                   params: Optional[dict] = None, seed: Optional[int] = None,
+                   termination: Optional[Termination] = None) -> Algorithm:
+    """Algorithme `name` du registre (paramètres du constructeur dans params)"""
+    algorithm_class = _choice('algorithme', name, ALGORITHMS)
+    return algorithm_class(problem, seed=seed, termination=termination,
+                           **(params or {}))
+
+
+def build_job(job: dict, problem: Optional[OptimizationProblem] = None,
+              **changes) -> Algorithm:
+    """
+    Algorithme d'une tâche {'problem', 'algorithm', 'params', 'seed',
+    'termination'}; `changes` modifie son budget (stop_event, time_limit...)
+    """
+    if problem is None:
+        problem = make_problem(job['problem'])
+    termination = make_termination(job.get('termination'))
+    if changes:
+        termination = termination.replace(**changes)
+    return make_algorithm(job['algorithm'], problem, job.get('params'),
+                          job.get('seed'), termination)
+
+
+def validate_job(job: dict):
+    """Vérifie la structure d'une tâche sans construire le problème"""
+    if not isinstance(job, dict):
+        raise ValueError("la tâche doit être un objet JSON")
+    problem = job.get('problem')
+    if not isinstance(problem, dict):
+        raise ValueError("champ 'problem' manquant")
+    _choice('type de problème', problem.get('type'), PROBLEMS)
+    _choice('algorithme', job.get('algorithm'), ALGORITHMS)
+    if not isinstance(job.get('params', {}), dict):
+        raise ValueError("'params' doit être un objet JSON")
+    make_termination(job.get('termination'))
+
+
+def to_jsonable(value: Any) -> Any:
+    """Résultat de run() en types JSON (scalaires NumPy, tableaux, solutions)"""
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (str, bool, int, float)) or value is None:
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    # Listes, tuples et représentations compactes des solutions
+    return [to_jsonable(item) for item in value]
@@ -0,0 +1,409 @@
+"""
+Service local de résolution: file de tâches, pool de processus, annulation
+
+Usage:
+    python -m src.service --port 8765 --processes 4
+
+    POST   /jobs               soumet une tâche (JSON), rend {'id', 'status'}
+    GET    /jobs               état de toutes les tâches
+    GET    /jobs/<id>          état d'une tâche
+    GET    /jobs/<id>/result   résultat (?wait=secondes pour l'attendre)
+    DELETE /jobs/<id>          annule la tâche
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from src.registry import build_job, make_problem, to_jsonable, validate_job
+
+QUEUED, RUNNING, DONE = 'queued', 'running', 'done'
+CANCELLED, EXPIRED, FAILED = 'cancelled', 'expired', 'failed'
+FINISHED = (DONE, CANCELLED, EXPIRED, FAILED)
+
+# Intervalle de vérification des échéances pendant result() (s)
+EXPIRY_POLL_INTERVAL = 0.1
+
+# État d'un processus de travail (fixé par _init_worker, gardé entre les tâches)
+_worker = {}
+
+
+def _init_worker(flags, problem_cache: int):
+    _worker['flags'] = flags
+    _worker['problems'] = OrderedDict()
+    _worker['problem_cache'] = problem_cache
+
+
+def _ping() -> int:
+    """Tâche vide: démarre un processus de travail à l'avance"""
+    return 0
+
+
+class _SlotFlag:
+    """Événement d'arrêt d'une tâche: un octet partagé par emplacement du pool"""
+
+    __slots__ = ('flags', 'slot')
+
+    def __init__(self, flags, slot: int):
+        self.flags = flags
+        self.slot = slot
+
+    def is_set(self) -> bool:
+        return self.flags[self.slot] != 0
+
+
+def _problem(spec: dict):
+    """Instance du problème, réutilisée par le processus si déjà construite"""
+    problems = _worker['problems']
+    key = hashlib.sha1(json.dumps(spec, sort_keys=True).encode()).digest()
+    problem = problems.get(key)
+    if problem is None:
+        problem = problems[key] = make_problem(spec)
+        while len(problems) > _worker['problem_cache']:
+            problems.popitem(last=False)
+    else:
+        problems.move_to_end(key)
+    return problem
+
+
+def _run_job(slot: int, job: dict, time_limit: Optional[float]) -> dict:
+    changes = {'stop_event': _SlotFlag(_worker['flags'], slot)}
+    if time_limit is not None:
+        own_limit = (job.get('termination') or {}).get('time_limit')
+        changes['time_limit'] = (time_limit if own_limit is None
+                                 else min(own_limit, time_limit))
+    algorithm = build_job(job, _problem(job['problem']), **changes)
+    return to_jsonable(algorithm.run())
+
+
+class _Job:
+    __slots__ = ('id', 'spec', 'status', 'submitted', 'started', 'ended',
+                 'deadline', 'slot', 'result', 'error', 'finished')
+
+    def __init__(self, job_id: str, spec: dict, deadline: Optional[float]):
+        self.id = job_id
+        self.spec = spec
+        self.status = QUEUED
+        self.submitted = time.time()
+        self.started = None
+        self.ended = None
+        self.deadline = deadline
+        self.slot = None
+        self.result = None
+        self.error = None
+        self.finished = threading.Event()
+
+    def describe(self) -> dict:
+        info = {
+            'id': self.id,
+            'status': self.status,
+            'algorithm': self.spec['algorithm'],
+            'submitted': self.submitted,
+            'started': self.started,
+            'ended': self.ended,
+            'deadline': self.deadline,
+        }
+        if self.result is not None:
+            info['best_value'] = self.result['best_value']
+            info['stop_reason'] = self.result['stop_reason']
+        if self.error is not None:
+            info['error'] = self.error
+        return info
+
+
+class SolverService:
+    """
+    Service de résolution local
+    - submit(job): met en file une tâche JSON {'problem', 'algorithm',
+      'params', 'seed', 'termination', 'deadline'} et rend son identifiant
+    - Au plus `processes` tâches en cours; les autres attendent (FIFO, au
+      plus `max_queue`)
+    - Les processus de travail sont démarrés une fois et gardent les
+      `problem_cache` dernières instances construites
+    - deadline (secondes depuis la soumission): une tâche encore en file à
+      l'échéance est 'expired'; en cours, le temps restant devient son
+      time_limit et elle rend sa meilleure solution
+    - cancel(): une tâche en file est retirée; en cours, elle s'arrête au
+      prochain check() et son meilleur résultat est gardé ('cancelled')
+    - Les `history` dernières tâches terminées restent consultables
+    """
+
+    def __init__(self, processes: int = None, max_queue: int = 1000,
+                 problem_cache: int = 8, history: int = 10000):
+        self.processes = processes or multiprocessing.cpu_count()
+        self.max_queue = max_queue
+        self.problem_cache = problem_cache
+        self.history = history
+        self._ctx = multiprocessing.get_context()
+        self._flags = self._ctx.RawArray('b', self.processes)
+        self._free_slots = list(range(self.processes))
+        self._executor = None
+        self._jobs: Dict[str, _Job] = {}
+        self._queue = deque()
+        self._finished = deque()
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def start(self) -> 'SolverService':
+        """Démarre les processus de travail (imports faits une fois)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._new_pool()
+                warm = [self._executor.submit(_ping) for _ in range(self.processes)]
+            else:
+                warm = []
+        for future in warm:
+            future.result()
+        return self
+
+    def close(self, cancel: bool = True):
+        """Arrête le service: file annulée, tâches en cours annulées si `cancel`"""
+        with self._lock:
+            for job in list(self._jobs.values()):
+                if job.status == QUEUED or (cancel and job.status == RUNNING):
+                    self._cancel(job)
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, job: dict) -> str:
+        """
+        Met une tâche en file et rend son identifiant
+        ValueError si la tâche est invalide, OverflowError si la file est pleine
+        """
+        validate_job(job)
+        deadline = job.get('deadline')
+        with self._lock:
+            if self._executor is None:
+                raise RuntimeError("service arrêté")
+            if len(self._queue) >= self.max_queue:
+                raise OverflowError("file d'attente pleine")
+            record = _Job(str(next(self._ids)), job,
+                          time.time() + deadline if deadline is not None else None)
+            self._jobs[record.id] = record
+            self._queue.append(record)
+            self._dispatch()
+        return record.id
+
+    def status(self, job_id: str) -> dict:
+        with self._lock:
+            self._expire()
+            return self._get(job_id).describe()
+
+    def jobs(self) -> List[dict]:
+        with self._lock:
+            self._expire()
+            return [job.describe() for job in self._jobs.values()]
+
+    def result(self, job_id: str, timeout: float = None) -> Optional[dict]:
+        """Résultat de run() (None si pas encore terminée après `timeout`)"""
+        end = time.time() + timeout if timeout is not None else float('inf')
+        with self._lock:
+            job = self._get(job_id)
+        while not job.finished.is_set():
+            remaining = end - time.time()
+            if remaining <= 0:
+                break
+            # Réveil périodique: une tâche en file expire sans libération de place
+            job.finished.wait(min(remaining, EXPIRY_POLL_INTERVAL))
+            with self._lock:
+                self._expire()
+        return job.result
+
+    def cancel(self, job_id: str) -> dict:
+        with self._lock:
+            job = self._get(job_id)
+            self._cancel(job)
+            return job.describe()
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = dict.fromkeys((QUEUED, RUNNING) + FINISHED, 0)
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return {'processes': self.processes, 'jobs': counts}
+
+    def _get(self, job_id: str) -> _Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
+
+    def _cancel(self, job: _Job):
+        if job.status == QUEUED:
+            self._queue.remove(job)
+            self._finish(job, CANCELLED)
+        elif job.status == RUNNING:
+            # Le résultat (meilleure solution) arrive par _on_done
+            self._flags[job.slot] = 1
+
+    def _expire(self):
+        """Tâches en file dont l'échéance est passée"""
+        now = time.time()
+        for job in [job for job in self._queue
+                    if job.deadline is not None and job.deadline <= now]:
+            self._queue.remove(job)
+            self._finish(job, EXPIRED)
+
+    def _dispatch(self):
+        """Envoie des tâches de la file tant qu'un emplacement est libre"""
+        self._expire()
+        while self._queue and self._free_slots and self._executor is not None:
+            job = self._queue.popleft()
+            job.slot = self._free_slots.pop()
+            self._flags[job.slot] = 0
+            job.status = RUNNING
+            job.started = time.time()
+            time_limit = (max(0.0, job.deadline - job.started)
+                          if job.deadline is not None else None)
+            executor = self._executor
+            try:
+                future = executor.submit(_run_job, job.slot, job.spec, time_limit)
+            except BrokenProcessPool:
+                executor = self._restart_pool(executor)
+                future = executor.submit(_run_job, job.slot, job.spec, time_limit)
+            future.add_done_callback(
+                lambda future, job=job, executor=executor: self._on_done(job, future, executor))
+
+    def _on_done(self, job: _Job, future, executor: ProcessPoolExecutor):
+        with self._lock:
+            self._free_slots.append(job.slot)
+            try:
+                job.result = future.result()
+            except BrokenProcessPool as exc:
+                job.error = f"processus de travail perdu: {exc}"
+                self._restart_pool(executor)
+            except Exception as exc:
+                job.error = f"{type(exc).__name__}: {exc}"
+            if job.error is not None:
+                self._finish(job, FAILED)
+            elif self._flags[job.slot]:
+                self._finish(job, CANCELLED)
+            else:
+                self._finish(job, DONE)
+            self._dispatch()
+
+    def _restart_pool(self, broken: ProcessPoolExecutor) -> Optional[ProcessPoolExecutor]:
+        """Un processus est mort (mémoire, signal): nouveau pool, mêmes drapeaux"""
+        if self._executor is broken:  # Une seule fois par pool cassé
+            broken.shutdown(wait=False)
+            self._executor = self._new_pool()
+        return self._executor
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=self._ctx,
+            initializer=_init_worker, initargs=(self._flags, self.problem_cache))
+
+    def _finish(self, job: _Job, status: str):
+        job.status = status
+        job.ended = time.time()
+        job.finished.set()
+        self._finished.append(job.id)
+        while len(self._finished) > self.history:
+            self._jobs.pop(self._finished.popleft(), None)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """API HTTP JSON du service (une requête par thread)"""
+
+    service: SolverService = None
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip('/') != '/jobs':
+            return self._send(404, {'error': 'not found'})
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            job_id = self.service.submit(json.loads(self.rfile.read(length)))
+        except (ValueError, TypeError) as exc:
+            return self._send(400, {'error': str(exc)})
+        except OverflowError as exc:
+            return self._send(503, {'error': str(exc)})
+        self._send(202, self.service.status(job_id))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        try:
+            if parts == ['health']:
+                return self._send(200, self.service.stats())
+            if parts == ['jobs']:
+                return self._send(200, self.service.jobs())
+            if len(parts) == 2 and parts[0] == 'jobs':
+                return self._send(200, self.service.status(parts[1]))
+            if len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'result':
+                wait = float(parse_qs(url.query).get('wait', ['0'])[0])
+                result = self.service.result(parts[1], timeout=wait)
+                if result is None:
+                    return self._send(202, self.service.status(parts[1]))
+                return self._send(200, result)
+        except KeyError:
+            return self._send(404, {'error': 'unknown job'})
+        self._send(404, {'error': 'not found'})
+
+    def do_DELETE(self):
+        parts = [part for part in urlparse(self.path).path.split('/') if part]
+        if len(parts) != 2 or parts[0] != 'jobs':
+            return self._send(404, {'error': 'not found'})
+        try:
+            self._send(200, self.service.cancel(parts[1]))
+        except KeyError:
+            self._send(404, {'error': 'unknown job'})
+
+    def _send(self, code: int, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Pas de journal par requête (tests de charge)
+
+
+def make_server(service: SolverService, host: str = '127.0.0.1',
+                port: int = 8765) -> ThreadingHTTPServer:
+    """Serveur HTTP du service (localhost par défaut)"""
+    handler = type('Handler', (_Handler,), {'service': service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Service local de résolution")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--max-queue', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    with SolverService(args.processes, max_queue=args.max_queue) as service:
+        server = make_server(service, args.host, args.port)
+        print(f"Service sur http://{args.host}:{server.server_port} "
+              f"({service.processes} processus)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""
+Télémétrie des exécutions: événements échantillonnés, export asynchrone
+"""
+
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+FORMATS = ('jsonl', 'prometheus')
+
+# Champs d'un événement qui ne sont pas exportés comme métriques Prometheus
+_NON_METRICS = ('source', 'run', 'seq', 'time')
+
+
+class TelemetryChannel:
+    """
+    Émetteur d'une exécution d'algorithme
+    Les solveurs appellent emit() une fois par itération de leur boucle
+    principale; seul un appel sur `sample_every` produit un événement.
+    """
+
+    __slots__ = ('sink', 'source', 'run', 'sample_every', 'countdown',
+                 'iteration', 'start')
+
+    def __init__(self, sink: 'Telemetry', source: str, run: int, sample_every: int):
+        self.sink = sink
+        self.source = source
+        self.run = run
+        self.sample_every = max(1, sample_every)
+        self.countdown = 1  # Le premier appel est toujours gardé
+        self.iteration = 0
+        self.start = time.perf_counter()
+
+    def emit(self, best_value: float, evaluations: int = 0, **fields):
+        """best_value, évaluations cumulées et champs propres (temperature...)"""
+        self.iteration += 1
+        self.countdown -= 1
+        if self.countdown > 0:
+            return
+        self.countdown = self.sample_every
+        self._record(best_value, evaluations, fields)
+
+    def close(self, best_value: float, evaluations: int = 0, **fields):
+        """Événement final, jamais écarté par l'échantillonnage"""
+        self._record(best_value, evaluations, dict(fields, final=True))
+
+    def _record(self, best_value, evaluations, fields):
+        elapsed = time.perf_counter() - self.start
+        event = {
+            'source': self.source,
+            'run': self.run,
+            'time': time.time(),
+            'elapsed': elapsed,
+            'iteration': self.iteration,
+            'best_value': float(best_value),
+            'evaluations': evaluations,
+            'evaluations_per_sec': evaluations / elapsed if elapsed > 0 else 0.0,
+        }
+        event.update(fields)
+        self.sink.record(event)
+
+
+class _NullChannel:
+    """Télémétrie désactivée"""
+
+    __slots__ = ()
+
+    def emit(self, best_value: float, evaluations: int = 0, **fields):
+        pass
+
+    def close(self, best_value: float, evaluations: int = 0, **fields):
+        pass
+
+
+NULL_CHANNEL = _NullChannel()
+
+
+class Telemetry:
+    """
+    Puits de télémétrie partagé par une ou plusieurs exécutions
+    - Tampon circulaire en mémoire (les plus anciens événements sont perdus
+      si l'export ne suit pas; ils sont comptés dans `dropped`)
+    - Export asynchrone par un thread toutes les `flush_interval` secondes:
+      'jsonl' (un événement par ligne, en ajout) ou 'prometheus' (fichier
+      texte pour le textfile collector, dernières valeurs de chaque exécution)
+    - Sans `path`, les événements restent seulement en mémoire (events())
+
+    Usage:
+        with Telemetry('runs.jsonl', sample_every=50) as telemetry:
+            SimulatedAnnealing(problem).run(telemetry=telemetry)
+    """
+
+    def __init__(self, path: Optional[str] = None, format: str = 'jsonl',
+                 capacity: int = 10000, sample_every: int = 100,
+                 flush_interval: float = 1.0):
+        if format not in FORMATS:
+            raise ValueError(f"format inconnu: {format} "
+                             f"(choix: {', '.join(FORMATS)})")
+        self.path = path
+        self.format = format
+        self.sample_every = sample_every
+        self.flush_interval = flush_interval
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self._seq = itertools.count()
+        self._runs = itertools.count()
+        self._written = -1  # Dernier numéro de séquence exporté
+        self._latest: Dict[tuple, dict] = {}
+        # Numérotation et ajout indissociables: le tampon reste trié par seq
+        self._record_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def channel(self, source: str) -> TelemetryChannel:
+        """Nouvel émetteur pour une exécution de `source`"""
+        if self.path is not None and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._flush_loop,
+                                            name='telemetry-flush', daemon=True)
+            self._thread.start()
+        return TelemetryChannel(self, source, next(self._runs), self.sample_every)
+
+    def record(self, event: dict):
+        with self._record_lock:
+            event['seq'] = next(self._seq)
+            self.buffer.append(event)
+
+    def events(self) -> List[dict]:
+        """Copie des événements encore présents dans le tampon"""
+        return list(self.buffer)
+
+    def flush(self):
+        """Exporte les événements pas encore écrits"""
+        with self._flush_lock:
+            pending = [e for e in list(self.buffer) if e['seq'] > self._written]
+            if not pending:
+                return
+            self.dropped += pending[0]['seq'] - self._written - 1
+            self._written = pending[-1]['seq']
+            if self.path is None:
+                return
+            if self.format == 'jsonl':
+                with open(self.path, 'a') as f:
+                    f.writelines(json.dumps(_finite(event)) + '\n' for event in pending)
+            else:
+                for event in pending:
+                    self._latest[event['source'], event['run']] = event
+                self._write_prometheus()
+
+    def _write_prometheus(self):
+        """Une jauge par champ numérique, remplacée atomiquement"""
+        metrics: Dict[str, List[str]] = {}
+        for (source, run), event in self._latest.items():
+            labels = f'source="{_escape(source)}",run="{run}"'
+            for field, value in event.items():
+                if (field in _NON_METRICS or isinstance(value, bool)
+                        or not isinstance(value, (int, float))):
+                    continue
+                metrics.setdefault(f'solver_{field}', []).append(
+                    f'solver_{field}{{{labels}}} {_format(value)}')
+
+        lines = []
+        for name, samples in metrics.items():
+            lines.append(f'# TYPE {name} gauge')
+            lines.extend(samples)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.path)
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Arrête le thread d'export et écrit les derniers événements"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _finite(event: dict) -> dict:
+    """Valeurs non finies (meilleure valeur pas encore connue) exportées en null"""
+    return {field: None if isinstance(value, float) and not math.isfinite(value) else value
+            for field, value in event.items()}
+
+
+def _format(value: float) -> str:
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
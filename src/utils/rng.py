@@ -0,0 +1,36 @@
+"""
+Flux aléatoires indépendants (random.Random et numpy.random.Generator)
+"""
+
+import random
+from typing import List, Optional
+
+import numpy as np
+
+
+def seed_sequence(seed: Optional[int] = None) -> np.random.SeedSequence:
+    """
+    SeedSequence racine d'un flux
+
+    Sans graine, elle est tirée du module random: random.seed() rend donc
+    toujours les exécutions reproductibles.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    return np.random.SeedSequence(seed)
+
+
+def python_rng(sequence: np.random.SeedSequence) -> random.Random:
+    """random.Random initialisé depuis une SeedSequence"""
+    return random.Random(int.from_bytes(sequence.generate_state(4).tobytes(), 'little'))
+
+
+def make_rng(seed: Optional[int] = None) -> random.Random:
+    """Générateur Python indépendant du module random global"""
+    return python_rng(seed_sequence(seed))
+
+
+def spawn_seeds(sequence: np.random.SeedSequence, n: int) -> List[int]:
+    """Graines de n flux enfants indépendants (ex: un par processus)"""
+    return [int(child.generate_state(1, np.uint64)[0]) for child in sequence.spawn(n)]
+
@@ -0,0 +1,155 @@
+"""
+Instrumentation des algorithmes: compteurs d'appels et temps par phase
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+# Méthodes du problème dont les appels sont comptés
+COUNTED_METHODS = ('evaluate', 'is_feasible', 'random_solution', 'get_neighbor',
+                   'random_move', 'move_delta', 'apply_move',
+                   'evaluate_batch', 'is_feasible_batch')
+
+
+class _Phase:
+    """Chronomètre réutilisable d'une phase (perf_counter_ns)"""
+
+    __slots__ = ('totals', 'name', 'start')
+
+    def __init__(self, totals: Dict[str, int], name: str):
+        self.totals = totals
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc):
+        self.totals[self.name] += time.perf_counter_ns() - self.start
+
+
+class _NullPhase:
+    """Phase inactive: aucun appel d'horloge"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _CountedCall:
+    """
+    Méthode du problème qui compte ses appels
+    Les appels imbriqués (evaluate_batch -> evaluate) ne sont comptés qu'une fois.
+    """
+
+    __slots__ = ('profiler', 'name', 'method')
+
+    def __init__(self, profiler: 'Profiler', name: str, method):
+        self.profiler = profiler
+        self.name = name
+        self.method = method
+
+    def __call__(self, *args, **kwargs):
+        profiler = self.profiler
+        if profiler.depth:
+            return self.method(*args, **kwargs)
+        profiler.calls[self.name] += 1
+        if self.name == 'evaluate_batch':
+            profiler.calls['evaluate_batch_rows'] += len(args[0])
+        profiler.depth += 1
+        try:
+            return self.method(*args, **kwargs)
+        finally:
+            profiler.depth -= 1
+
+
+class Profiler:
+    """
+    Profilage d'une exécution
+    - calls: nombre d'appels de chaque méthode du problème
+    - phases: temps cumulé (ns) de chaque phase nommée d'un solveur
+    - count(): compteurs libres (mouvements acceptés...)
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.calls: Dict[str, int] = dict.fromkeys(
+            COUNTED_METHODS + ('evaluate_batch_rows', 'moves_accepted'), 0)
+        self.phases: Dict[str, int] = {}
+        self._timers: Dict[str, _Phase] = {}
+        self.depth = 0
+
+    def phase(self, name: str) -> _Phase:
+        """Contexte `with profiler.phase('selection'):` (non réentrant par nom)"""
+        timer = self._timers.get(name)
+        if timer is None:
+            self.phases[name] = 0
+            timer = self._timers[name] = _Phase(self.phases, name)
+        return timer
+
+    def count(self, name: str, n: int = 1):
+        self.calls[name] = self.calls.get(name, 0) + n
+
+    @contextmanager
+    def instrument(self, problem):
+        """Remplace temporairement les méthodes comptées de l'instance `problem`"""
+        saved = {}
+        for name in COUNTED_METHODS:
+            if name in vars(problem):
+                saved[name] = vars(problem)[name]
+            setattr(problem, name, _CountedCall(self, name, getattr(problem, name)))
+        try:
+            yield problem
+        finally:
+            for name in COUNTED_METHODS:
+                if name in saved:
+                    setattr(problem, name, saved[name])
+                else:
+                    delattr(problem, name)
+
+    @property
+    def evaluations(self) -> int:
+        """Solutions évaluées (complètement ou par delta de mouvement)"""
+        calls = self.calls
+        return calls['evaluate'] + calls['evaluate_batch_rows'] + calls['move_delta']
+
+    def report(self) -> dict:
+        calls = self.calls
+        proposed = calls['move_delta'] + calls['get_neighbor']
+        accepted = calls['apply_move'] + calls['moves_accepted']
+        return {
+            'evaluations': self.evaluations,
+            'calls': dict(calls),
+            'phases_ms': {name: ns / 1e6 for name, ns in self.phases.items()},
+            'moves_proposed': proposed,
+            'moves_accepted': accepted,
+            'moves_rejected': max(0, proposed - accepted),
+        }
+
+
+class NullProfiler:
+    """Profilage désactivé: coût quasi nul dans les boucles des solveurs"""
+
+    enabled = False
+
+    def phase(self, name: str) -> _NullPhase:
+        return _NULL_PHASE
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+    @contextmanager
+    def instrument(self, problem):
+        yield problem
+
+
+NULL_PROFILER = NullProfiler()
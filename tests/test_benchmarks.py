@@ -0,0 +1,37 @@
+"""
+Tests de la suite de benchmarks (mesures et comparaison)
+"""
+
+from benchmarks.compare import compare
+from benchmarks.suite import measure, scaling_curves
+from src.registry import make_problem
+
+
+def _record(size, rate, time=1.0):
+    return {'instance': f"knapsack-{size}", 'problem': 'knapsack', 'size': size,
+            'algorithm': 'dynamic_programming', 'evaluations_per_sec': 0.0,
+            'work_per_sec': rate, 'execution_time': time, 'time_to_target': time,
+            'peak_memory': None, 'target': 1.0, 'best_value': 1.0}
+
+
+def _report(results):
+    return {'environment': {}, 'config': {}, 'results': results}
+
+
+def test_exact_solvers_report_work_units():
+    problem = make_problem({'type': 'knapsack', 'random': {'n': 100, 'seed': 1}})
+    for name, unit in (('dynamic_programming', 'cells'),
+                       ('branch_and_bound', 'nodes_explored')):
+        record = measure(name, problem, target=0, repeats=1, memory=False)
+        assert record['work_unit'] == unit
+        assert record['work_per_sec'] > 0
+
+
+def test_scaling_exponent_uses_work_rate():
+    curves = scaling_curves([_record(100, 1e6), _record(1000, 1e5)])
+    assert abs(curves['knapsack']['dynamic_programming']['exponent'] - 1.0) < 1e-9
+
+
+def test_work_rate_regression_is_reported():
+    comparison = compare(_report([_record(100, 1e6)]), _report([_record(100, 5e5)]))
+    assert [r['metric'] for r in comparison['regressions']] == ['work_per_sec']
@@ -0,0 +1,41 @@
+"""
+Tests du Branch & Bound pour le sac à dos
+"""
+
+import itertools
+
+import pytest
+
+from src.algorithms.branch_and_bound import STRATEGIES, BranchAndBound
+from src.problems.knapsack import KnapsackProblem
+
+
+def _brute_force(problem):
+    return max(problem.evaluate(list(bits))
+               for bits in itertools.product((0, 1), repeat=problem.n))
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+@pytest.mark.parametrize('seed', range(5))
+def test_branch_and_bound_matches_brute_force(strategy, seed):
+    problem = KnapsackProblem.generate_random(12, seed=seed)
+    result = BranchAndBound(problem, strategy=strategy).run()
+    assert result['best_value'] == _brute_force(problem)
+    assert problem.evaluate(result['solution']) == result['best_value']
+    assert result['optimal'] and result['gap'] == 0
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_strategies_agree(seed):
+    problem = KnapsackProblem.generate_random(60, seed=seed)
+    values = {BranchAndBound(problem, strategy=s).run()['best_value'] for s in STRATEGIES}
+    assert len(values) == 1
+
+
+def test_node_limit_reports_gap():
+    problem = KnapsackProblem.generate_random(200, seed=1)
+    result = BranchAndBound(problem, max_nodes=1).run()
+    assert not result['optimal']
+    assert result['upper_bound'] > result['best_value']
+    assert result['gap'] == pytest.approx(
+        (result['upper_bound'] - result['best_value']) / result['best_value'])
@@ -0,0 +1,28 @@
+"""
+Tests du cache des évaluations
+"""
+
+import pytest
+
+from src.algorithms.branch_and_bound import BranchAndBound
+from src.algorithms.dynamic_programming import DynamicProgramming
+from src.algorithms.vectorized_ga import VectorizedGeneticAlgorithm
+from src.problems.cache import CachedProblem
+from src.problems.knapsack import KnapsackProblem
+from src.problems.tsp import TSPProblem
+
+
+@pytest.mark.parametrize('algorithm', [BranchAndBound, DynamicProgramming])
+def test_exact_solvers_accept_cached_knapsack(algorithm):
+    problem = KnapsackProblem.generate_random(30, seed=4)
+    expected = algorithm(problem).run()['best_value']
+    assert algorithm(CachedProblem(problem)).run()['best_value'] == expected
+
+
+@pytest.mark.parametrize('problem', [KnapsackProblem.generate_random(30, seed=4),
+                                     TSPProblem.generate_random(15, seed=4)])
+def test_vectorized_ga_accepts_cached_problem(problem):
+    cached = CachedProblem(problem)
+    result = VectorizedGeneticAlgorithm(cached, generations=5, seed=0).run()
+    assert result['best_value'] == problem.evaluate(result['solution'])
+    assert cached.hits + cached.misses > 0
@@ -0,0 +1,74 @@
+"""
+Tests de la résolution par lots (python -m src)
+"""
+
+import json
+
+from src.__main__ import _done_ids, main
+
+
+def _write_instances(path, count=3):
+    with open(path, 'w') as f:
+        for i in range(count):
+            problem = {'id': f"k{i}", 'type': 'knapsack',
+                       'random': {'n': 10, 'seed': i}}
+            f.write(json.dumps(problem) + '\n')
+
+
+def _ids(path):
+    with open(path) as f:
+        return [json.loads(line)['id'] for line in f if line.strip()]
+
+
+def test_done_ids_empty_output(tmp_path):
+    output = tmp_path / 'out.jsonl'
+    output.write_text('')
+    assert _done_ids(str(output)) == set()
+
+
+def test_done_ids_truncated_last_line(tmp_path):
+    output = tmp_path / 'out.jsonl'
+    output.write_text('{"id": "a", "best_value": 1}\n{"id": "b", "best_')
+    assert _done_ids(str(output)) == {'a'}
+    # Les résultats suivants commencent sur une nouvelle ligne
+    assert output.read_text().endswith('\n')
+
+
+def test_done_ids_retries_errors(tmp_path):
+    output = tmp_path / 'out.jsonl'
+    output.write_text('{"id": "a", "best_value": 1}\n{"id": "b", "error": "x"}\n')
+    assert _done_ids(str(output)) == {'a'}
+
+
+def test_resume_from_empty_output(tmp_path):
+    instances, output = tmp_path / 'in.jsonl', tmp_path / 'out.jsonl'
+    _write_instances(instances)
+    output.write_text('')
+    assert main([str(instances), '-o', str(output), '--resume', '-j', '0',
+                 '-a', 'dynamic_programming']) == 0
+    assert sorted(_ids(output)) == ['k0', 'k1', 'k2']
+
+
+def test_resume_skips_solved_instances(tmp_path):
+    instances, output = tmp_path / 'in.jsonl', tmp_path / 'out.jsonl'
+    _write_instances(instances)
+    args = [str(instances), '-o', str(output), '-j', '0', '-a', 'dynamic_programming']
+    assert main(args) == 0
+    # Interruption simulée: dernière ligne tronquée, à résoudre de nouveau
+    lines = output.read_text().splitlines(keepends=True)
+    output.write_text(''.join(lines[:2]) + lines[2][:10])
+    assert main(args + ['--resume']) == 0
+    ids = _ids_valid(output)
+    assert sorted(ids) == ['k0', 'k1', 'k2']
+
+
+def _ids_valid(path):
+    """Identifiants des lignes JSON valides (la ligne tronquée est ignorée)"""
+    ids = []
+    with open(path) as f:
+        for line in f:
+            try:
+                ids.append(json.loads(line)['id'])
+            except ValueError:
+                continue
+    return ids
@@ -0,0 +1,52 @@
+"""
+Tests des distances du TSP: matrice (float64, float32, int) et oracle paresseux
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.problems.distances import CoordinateDistances, distance_matrix
+from src.problems.tsp import TSPProblem
+
+
+def _tours(n, count=20):
+    rng = random.Random(0)
+    return [rng.sample(range(n), n) for _ in range(count)]
+
+
+def test_lazy_oracle_matches_matrix():
+    problem = TSPProblem.generate_random(80, seed=2, mode='matrix')
+    lazy = TSPProblem.generate_random(80, seed=2, mode='lazy')
+    assert isinstance(lazy.distances, CoordinateDistances)
+    for tour in _tours(80):
+        assert lazy.evaluate(tour) == pytest.approx(problem.evaluate(tour), rel=1e-12)
+    a, b = np.arange(80), np.roll(np.arange(80), 7)
+    assert np.allclose(lazy.distances.gather(a, b), problem.distance_matrix[a, b])
+    assert lazy.distances.item(3, 11) == pytest.approx(problem.distance_matrix[3, 11])
+
+
+def test_float32_matrix_matches_float64():
+    exact = TSPProblem.generate_random(80, seed=2, dtype='float64')
+    single = TSPProblem.generate_random(80, seed=2, dtype='float32')
+    assert single.distance_matrix.dtype == np.float32
+    for tour in _tours(80):
+        assert single.evaluate(tour) == pytest.approx(exact.evaluate(tour), rel=1e-5)
+
+
+@pytest.mark.parametrize('mode', ['matrix', 'lazy'])
+def test_int_distances_are_rounded_float64(mode):
+    exact = TSPProblem.generate_random(80, seed=2, dtype='float64')
+    rounded = TSPProblem.generate_random(80, seed=2, dtype='int', mode=mode)
+    nint = np.floor(exact.distance_matrix + 0.5)
+    for tour in _tours(80):
+        expected = -nint[tour, np.roll(tour, -1)].sum()
+        assert rounded.evaluate(tour) == expected
+
+
+def test_distance_matrix_is_symmetric_with_zero_diagonal():
+    coords = np.random.default_rng(0).uniform(0, 100, (50, 2))
+    matrix = distance_matrix(coords)
+    assert np.array_equal(matrix, matrix.T)
+    assert (np.diag(matrix) == 0).all()
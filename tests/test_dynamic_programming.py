@@ -0,0 +1,78 @@
+"""
+Tests de la programmation dynamique pour le sac à dos
+"""
+
+import itertools
+import threading
+
+import pytest
+
+from src.algorithms.branch_and_bound import BranchAndBound
+from src.algorithms.dynamic_programming import RECONSTRUCTIONS, DynamicProgramming
+from src.algorithms.termination import Termination
+from src.problems.knapsack import KnapsackProblem
+
+
+def _brute_force(problem):
+    return max(problem.evaluate(list(bits))
+               for bits in itertools.product((0, 1), repeat=problem.n))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_dynamic_programming_matches_brute_force(seed):
+    problem = KnapsackProblem.generate_random(12, seed=seed)
+    assert DynamicProgramming(problem).run()['best_value'] == _brute_force(problem)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_reconstructions_agree_with_branch_and_bound(seed):
+    problem = KnapsackProblem.generate_random(60, seed=seed)
+    optimum = BranchAndBound(problem).run()['best_value']
+    for reconstruction in RECONSTRUCTIONS:
+        # Petit budget: 'divide' découpe vraiment la table
+        result = DynamicProgramming(problem, reconstruction, table_budget=256).run()
+        assert result['best_value'] == optimum
+        assert problem.evaluate(result['solution']) == optimum
+        assert result['optimal']
+
+
+def test_rejects_fractional_weights():
+    problem = KnapsackProblem([1.5, 2], [3, 4], 3)
+    with pytest.raises(ValueError):
+        DynamicProgramming(problem).run()
+
+
+@pytest.mark.parametrize('criterion', [{'max_evaluations': 10}, {'patience': 5}])
+def test_rejects_unsupported_criteria(criterion):
+    problem = KnapsackProblem.generate_random(20, seed=0)
+    with pytest.raises(ValueError, match=next(iter(criterion))):
+        DynamicProgramming(problem, termination=Termination(**criterion))
+
+
+def test_stop_event_interrupts_with_greedy_solution():
+    problem = KnapsackProblem.generate_random(200, seed=0)
+    stop_event = threading.Event()
+    stop_event.set()
+    algorithm = DynamicProgramming(problem, termination=Termination(stop_event=stop_event))
+    result = algorithm.run()
+    assert result['stop_reason'] == 'stopped' and not result['optimal']
+    assert result['best_value'] == algorithm.greedy_value
+
+
+def test_request_stop_interrupts():
+    problem = KnapsackProblem.generate_random(200, seed=0)
+    algorithm = DynamicProgramming(problem)
+    stream = algorithm.iterate()
+    next(iter(stream))
+    stream.cancel()
+    result = stream.finish()
+    assert result['stop_reason'] == 'stopped' and not result['optimal']
+
+
+def test_target_reached_by_greedy_solution():
+    problem = KnapsackProblem.generate_random(200, seed=0)
+    optimum = DynamicProgramming(problem).run()['best_value']
+    result = DynamicProgramming(problem, termination=Termination(target=0.5 * optimum)).run()
+    assert result['stop_reason'] == 'target' and result['best_value'] >= 0.5 * optimum
+    result = DynamicProgramming(problem, termination=Termination(target=optimum)).run()
+    assert result['stop_reason'] == 'completed' and result['best_value'] == optimum
@@ -0,0 +1,46 @@
+"""
+Tests des plans d'expériences (reprise depuis SQLite)
+"""
+
+from src.experiments import ResultStore, expand, run_experiment
+
+PLAN = {
+    'name': 'resume',
+    'problems': [{'id': 'kp', 'type': 'knapsack', 'random': {'n': 15}, 'instances': 2}],
+    'algorithms': [
+        {'algorithm': 'hill_climbing', 'params': {'max_iterations': 50}},
+        {'label': 'broken', 'algorithm': 'hill_climbing', 'params': {'no_such_param': 1}},
+    ],
+    'seeds': 2,
+}
+
+
+def _quiet(message):
+    pass
+
+
+def test_resume_skips_stored_cells(tmp_path):
+    db_path = str(tmp_path / 'results.db')
+    first = run_experiment(PLAN, db_path, workers=1, log=_quiet)
+    assert first == {'total': 8, 'skipped': 0, 'solved': 4, 'failed': 4}
+    with ResultStore(db_path) as store:
+        solved = {row['cell_id']: row['finished_at']
+                  for row in store.rows('resume') if row['error'] is None}
+
+    # Relance: les cellules résolues sont ignorées, celles en erreur retentées
+    second = run_experiment(PLAN, db_path, workers=0, log=_quiet)
+    assert second == {'total': 8, 'skipped': 4, 'solved': 0, 'failed': 4}
+    with ResultStore(db_path) as store:
+        rows = store.rows('resume')
+        assert len(rows) == 8
+        assert {row['cell_id']: row['finished_at']
+                for row in rows if row['error'] is None} == solved
+
+    # Plan étendu: seules les nouvelles graines sont exécutées
+    extended = dict(PLAN, seeds=3, algorithms=PLAN['algorithms'][:1])
+    third = run_experiment(extended, db_path, workers=0, log=_quiet)
+    assert third == {'total': 6, 'skipped': 4, 'solved': 2, 'failed': 0}
+    with ResultStore(db_path) as store:
+        assert store.done('resume') == {cell['cell_id'] for cell in expand(extended)}
+        # Autre expérience: rien n'est considéré comme déjà résolu
+        assert store.done('other') == set()
@@ -0,0 +1,16 @@
+"""
+Tests de l'algorithme génétique
+"""
+
+import math
+
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.problems.knapsack import KnapsackProblem
+
+
+def test_mutation_keeps_knapsack_feasible():
+    problem = KnapsackProblem.generate_random(50, seed=1)
+    ga = GeneticAlgorithm(problem, mutation_rate=1.0, seed=0)
+    population = [problem.random_solution(ga.rng) for _ in range(200)]
+    for individual in population:
+        assert not math.isinf(problem.evaluate(ga._mutate(individual)))
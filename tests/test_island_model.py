@@ -0,0 +1,48 @@
+"""
+Tests de l'algorithme génétique en îles
+"""
+
+import pytest
+
+from src.algorithms.island_model import IslandGeneticAlgorithm
+from src.problems.tsp import TSPProblem
+
+INTERVAL = 5
+
+
+def _run(migration_size=2, seed=3, **params):
+    problem = TSPProblem.generate_random(30, seed=1)
+    algorithm = IslandGeneticAlgorithm(problem, islands=2, population_size=20,
+                                       generations=20, migration_interval=INTERVAL,
+                                       migration_size=migration_size, seed=seed, **params)
+    return problem, algorithm, algorithm.run()
+
+
+def test_two_islands_migrate():
+    _, algorithm, _ = _run()
+    first, second = algorithm.island_histories
+    assert len(first) == len(second) == 20
+    # Îles indépendantes: populations initiales différentes
+    assert first[0] != second[0]
+    # Anneau de 2 îles: après chaque migration, les deux meilleurs coïncident
+    for boundary in range(INTERVAL, 20, INTERVAL):
+        assert first[boundary] == second[boundary]
+
+
+def test_islands_without_migration_stay_apart():
+    _, algorithm, _ = _run(migration_size=0)
+    first, second = algorithm.island_histories
+    assert any(first[b] != second[b] for b in range(INTERVAL, 20, INTERVAL))
+
+
+def test_same_seed_same_result():
+    _, _, first = _run(seed=11)
+    _, _, second = _run(seed=11)
+    assert first['solution'] == second['solution']
+    assert first['best_value'] == second['best_value']
+
+
+def test_best_value_matches_evaluate():
+    problem, algorithm, result = _run(topology='complete')
+    assert result['best_value'] == pytest.approx(problem.evaluate(result['solution']))
+    assert result['best_value'] >= max(algorithm.convergence_history)
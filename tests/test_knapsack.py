@@ -0,0 +1,67 @@
+"""
+Tests du problème du sac à dos: flips incrémentaux
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.problems.knapsack import REPRESENTATIONS, KnapsackProblem
+
+
+@pytest.mark.parametrize('representation', sorted(REPRESENTATIONS))
+def test_knapsack_flip_delta(representation):
+    problem = KnapsackProblem.generate_random(40, seed=2, representation=representation)
+    rng = random.Random(1)
+    solution = problem.random_solution(rng)
+    value = problem.evaluate(solution)
+    for _ in range(3000):
+        move = problem.random_move(solution, rng)
+        delta = problem.move_delta(solution, move)
+        if delta == -float('inf'):
+            continue  # Flip infaisable: jamais appliqué par les solveurs
+        problem.apply_move(solution, move)
+        new_value = problem.evaluate(solution)
+        assert value + delta == new_value
+        # Totaux suivis identiques aux totaux recalculés
+        fresh = problem.make_solution(list(solution))
+        assert (solution.weight, solution.value) == (fresh.weight, fresh.value)
+        assert solution.weight <= problem.capacity
+        value = new_value
+
+
+def test_knapsack_infeasible_flip_delta():
+    problem = KnapsackProblem([5, 5], [1, 1], 5)
+    solution = problem.make_solution([1, 0])
+    assert problem.move_delta(solution, 1) == -float('inf')
+    assert problem.move_delta(solution, 0) == -1
+
+
+def test_fractional_instance_paths_agree():
+    problem = KnapsackProblem([1.5, 2.5, 1.0], [1.2, 3.7, 2.9], 3.0)
+    solutions = [[1, 1, 0], [0, 1, 0], [1, 0, 1], [0, 0, 0]]
+    expected = [-float('inf'), 3.7, 1.2 + 2.9, 0]
+    assert [problem.evaluate(s) for s in solutions] == pytest.approx(expected)
+    assert [problem.evaluate(np.array(s)) for s in solutions] == pytest.approx(expected)
+    assert problem.evaluate_batch(np.array(solutions)).tolist() == pytest.approx(expected)
+    for representation in REPRESENTATIONS:
+        tracked = KnapsackProblem(problem.weights, problem.values, problem.capacity,
+                                  representation=representation)
+        assert [tracked.evaluate(tracked.make_solution(s)) for s in solutions] == \
+            pytest.approx(expected)
+
+
+def test_fractional_values_exact_solvers():
+    from src.algorithms.branch_and_bound import BranchAndBound
+    from src.algorithms.dynamic_programming import DynamicProgramming
+    from src.problems.reduction import reduce_knapsack
+
+    problem = KnapsackProblem([3, 4, 2, 5], [2.5, 3.25, 1.75, 4.5], 9)
+    optimum = DynamicProgramming(problem).run()['best_value']
+    assert optimum == pytest.approx(3.25 + 4.5)
+    assert BranchAndBound(problem).run()['best_value'] == pytest.approx(optimum)
+    reduction = reduce_knapsack(problem)
+    lifted = reduction.lift(DynamicProgramming(reduction.residual).run()['solution']
+                            if reduction.residual.n else [])
+    assert problem.evaluate(lifted) == pytest.approx(optimum)
@@ -0,0 +1,178 @@
+"""
+Tests des chargeurs d'instances (TSPLIB, sac à dos)
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.problems.distances import distance_matrix
+from src.problems.loaders import (_TRIANGLES, load_knapsack, load_knapsack_instances,
+                                  load_tsplib, read_knapsack, read_tsplib)
+from src.problems.tsp import TSPProblem
+
+
+def _numbers(values, per_line=5):
+    values = [str(v) for v in values]
+    return ''.join(' '.join(values[i:i + per_line]) + '\n'
+                   for i in range(0, len(values), per_line))
+
+
+def _write_coords(path, coords, edge_type='EUC_2D'):
+    with open(path, 'w') as f:
+        f.write(f"NAME : sample\nCOMMENT : test\nTYPE : TSP\n"
+                f"DIMENSION : {len(coords)}\nEDGE_WEIGHT_TYPE : {edge_type}\n"
+                "NODE_COORD_SECTION\n")
+        for i, (x, y) in enumerate(coords):
+            f.write(f"{i + 1} {x} {y}\n")
+        f.write("EOF\n")
+
+
+def _explicit_weights(matrix, fmt):
+    """Section EDGE_WEIGHT_SECTION de `matrix` (symétrique) au format `fmt`"""
+    n = len(matrix)
+    if fmt == 'FULL_MATRIX':
+        return matrix.ravel()
+    if fmt.endswith('_COL'):
+        # Triangle nommé lu colonne par colonne
+        indices, offset = {'UPPER': (np.triu_indices, 1), 'LOWER': (np.tril_indices, -1),
+                           'UPPER_DIAG': (np.triu_indices, 0),
+                           'LOWER_DIAG': (np.tril_indices, 0)}[fmt[:-4]]
+        rows, cols = indices(n, offset)
+        order = np.lexsort((rows, cols))
+        return matrix[rows[order], cols[order]]
+    indices, offset = {'UPPER_ROW': (np.triu_indices, 1), 'LOWER_ROW': (np.tril_indices, -1),
+                       'UPPER_DIAG_ROW': (np.triu_indices, 0),
+                       'LOWER_DIAG_ROW': (np.tril_indices, 0)}[fmt]
+    rows, cols = indices(n, offset)
+    return matrix[rows, cols]
+
+
+def _pisinger(path, count, n=5, seed=0):
+    rng = np.random.default_rng(seed)
+    expected = []
+    with open(path, 'w') as f:
+        for k in range(count):
+            values, weights = rng.integers(1, 100, n), rng.integers(1, 100, n)
+            expected.append((values, weights))
+            f.write(f"knapPI_1_{n}_{k}\nn {n}\nc 100\nz 0\ntime 0.00\n")
+            for i in range(n):
+                f.write(f"{i + 1},{values[i]},{weights[i]},0\n")
+            f.write("-----\n\n")
+    return expected
+
+
+@pytest.mark.parametrize('edge_type, metric', [('EUC_2D', 'euclidean'), ('CEIL_2D', 'ceil'),
+                                               ('ATT', 'att'), ('GEO', 'geo')])
+def test_tsplib_coordinates_round_trip(tmp_path, edge_type, metric):
+    rng = np.random.default_rng(1)
+    coords = np.round(rng.uniform(-80, 80, (30, 2)), 2)
+    path = tmp_path / 'sample.tsp'
+    _write_coords(path, coords, edge_type)
+
+    instance = read_tsplib(str(path))
+    assert instance['name'] == 'sample' and instance['metric'] == metric
+    assert np.array_equal(instance['coords'], coords)
+    problem = load_tsplib(str(path))
+    assert np.array_equal(problem.distance_matrix, distance_matrix(coords, 'int', metric))
+
+
+@pytest.mark.parametrize('empty', ['COMMENT:', 'COMMENT :', 'NAME :'])
+def test_tsplib_empty_header_value(tmp_path, empty):
+    coords = [(0, 0), (3, 4), (6, 0)]
+    path = tmp_path / 'empty.tsp'
+    _write_coords(path, coords)
+    text = path.read_text().replace("NAME : sample\nCOMMENT : test\n", f"{empty}\n")
+    path.write_text(text)
+    instance = read_tsplib(str(path))
+    # Valeur vide ignorée: NAME reprend le nom du fichier
+    assert instance['name'] == 'empty'
+    assert np.array_equal(instance['coords'], coords)
+
+    path.write_text(text.replace(f"DIMENSION : {len(coords)}", "DIMENSION :"))
+    with pytest.raises(ValueError, match='DIMENSION manquante'):
+        read_tsplib(str(path))
+    path.write_text(text.replace(empty, "NO SEPARATOR"))
+    with pytest.raises(ValueError, match='ligne inattendue'):
+        read_tsplib(str(path))
+
+
+@pytest.mark.parametrize('fmt', ['FULL_MATRIX', *_TRIANGLES])
+def test_tsplib_explicit_round_trip(tmp_path, fmt):
+    rng = np.random.default_rng(0)
+    n = 7
+    matrix = np.triu(rng.integers(1, 100, (n, n)), 1)
+    matrix = matrix + matrix.T
+    path = tmp_path / 'explicit.tsp'
+    with open(path, 'w') as f:
+        f.write(f"NAME : explicit\nTYPE : TSP\nDIMENSION : {n}\n"
+                f"EDGE_WEIGHT_TYPE : EXPLICIT\nEDGE_WEIGHT_FORMAT : {fmt}\n"
+                "EDGE_WEIGHT_SECTION\n" + _numbers(_explicit_weights(matrix, fmt)) +
+                "DISPLAY_DATA_SECTION\n" +
+                ''.join(f"{i + 1} {i} {2 * i}\n" for i in range(n)) + "EOF\n")
+    problem = load_tsplib(str(path))
+    assert np.array_equal(problem.distance_matrix, matrix)
+    assert problem.cities.shape == (n, 2)
+
+
+def test_tsplib_cache_round_trip(tmp_path):
+    coords = np.random.default_rng(2).integers(0, 1000, (50, 2))
+    path = tmp_path / 'cached.tsp'
+    _write_coords(path, coords)
+    cache_dir = tmp_path / 'cache'
+    first = load_tsplib(str(path), cache_dir=str(cache_dir))
+    assert any(name.endswith('.npz') for name in os.listdir(cache_dir))
+    second = load_tsplib(str(path), cache_dir=str(cache_dir))
+    assert second.name == first.name == 'sample'
+    assert np.array_equal(second.cities, first.cities)
+    tour = list(range(50))
+    assert second.evaluate(tour) == first.evaluate(tour)
+
+
+def test_knapsack_text_round_trip(tmp_path):
+    path = tmp_path / 'kp.txt'
+    path.write_text("4 10\n10 5\n40 4\n30 6\n50 3\n0 1 0 1\n")
+    problem = load_knapsack(str(path))
+    assert (problem.n, problem.capacity) == (4, 10)
+    assert problem.values == [10, 40, 30, 50] and problem.weights == [5, 4, 6, 3]
+    assert problem.optimal_value == 90 and problem.name == 'kp'
+
+
+def test_knapsack_pisinger_cache_round_trip(tmp_path):
+    path = tmp_path / 'pi.csv'
+    expected = _pisinger(path, 3)
+    cache_dir = str(tmp_path / 'cache')
+    for _ in range(2):  # Analyse puis rechargement depuis le cache
+        problems = load_knapsack_instances(str(path), cache_dir=cache_dir)
+        assert [p.name for p in problems] == [f"knapPI_1_5_{k}" for k in range(3)]
+        for problem, (values, weights) in zip(problems, expected):
+            assert problem.values == values.tolist()
+            assert problem.weights == weights.tolist()
+            assert problem.capacity == 100 and problem.optimal_value == 0
+
+
+def test_read_many_knapsack_instances(tmp_path):
+    path = tmp_path / 'many.csv'
+    expected = _pisinger(path, 500)
+    instances = read_knapsack(str(path))
+    assert [i['name'] for i in instances] == [f"knapPI_1_5_{k}" for k in range(500)]
+    for instance, (values, weights) in zip(instances, expected):
+        assert instance['values'].tolist() == values.tolist()
+        assert instance['weights'].tolist() == weights.tolist()
+
+
+def test_lazy_geo_candidates_match_matrix():
+    # Villes près du pôle et de part et d'autre de l'antiméridien
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(80, 89.5, 300)
+    lon = np.where(rng.random(300) < 0.5, rng.uniform(170, 179.5, 300),
+                   rng.uniform(-179.5, -170, 300))
+    coords = np.column_stack([lat, lon])
+    options = dict(metric='geo', neighborhood='knn', dtype='int', seed=0)
+    lazy = TSPProblem(coords, mode='lazy', **options)
+    full = TSPProblem(coords, mode='matrix', **options)
+    matrix = full.distance_matrix
+    for city in range(300):
+        assert (sorted(matrix[city, lazy.candidates[city]]) ==
+                sorted(matrix[city, full.candidates[city]]))
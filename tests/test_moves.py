@@ -0,0 +1,54 @@
+"""
+Tests des mouvements du TSP: le delta O(1) doit égaler l'écart des évaluations complètes
+"""
+
+import random
+
+import pytest
+
+from src.problems.tsp import TSPProblem
+
+
+def _check_moves(problem, steps=1000, seed=1):
+    rng = random.Random(seed)
+    solution = problem.random_solution(rng)
+    value = problem.evaluate(solution)
+    for _ in range(steps):
+        move = problem.random_move(solution, rng)
+        delta = problem.move_delta(solution, move)
+        problem.apply_move(solution, move)
+        new_value = problem.evaluate(solution)
+        assert value + delta == pytest.approx(new_value), move
+        assert problem.is_feasible(solution)
+        value = new_value
+    return solution
+
+
+@pytest.mark.parametrize('mode', ['matrix', 'lazy'])
+@pytest.mark.parametrize('representation', ['list', 'array'])
+@pytest.mark.parametrize('n', [5, 12, 60])
+def test_tsp_two_opt_delta(mode, representation, n):
+    problem = TSPProblem.generate_random(n, seed=n, mode=mode,
+                                         representation=representation)
+    _check_moves(problem)
+
+
+@pytest.mark.parametrize('mode', ['matrix', 'lazy'])
+@pytest.mark.parametrize('representation', ['list', 'array'])
+@pytest.mark.parametrize('or_opt_rate', [0.0, 1.0])
+def test_tsp_candidate_moves_delta(mode, representation, or_opt_rate):
+    # or_opt_rate=1: Or-opt dès qu'il est possible (2-opt sinon)
+    problem = TSPProblem.generate_random(60, seed=3, mode=mode, neighborhood='knn',
+                                         representation=representation,
+                                         or_opt_rate=or_opt_rate)
+    tour = _check_moves(problem, steps=3000)
+    if hasattr(tour, 'pos'):
+        assert all(tour[tour.pos[city]] == city for city in range(problem.n))
+
+
+def test_tsp_or_opt_moves_are_proposed():
+    problem = TSPProblem.generate_random(60, seed=3, neighborhood='knn', or_opt_rate=1.0)
+    rng = random.Random(0)
+    tour = problem.random_solution(rng)
+    moves = [problem.random_move(tour, rng) for _ in range(200)]
+    assert any(len(move) == 4 for move in moves)
@@ -0,0 +1,32 @@
+"""
+Tests du portefeuille d'algorithmes
+"""
+
+import multiprocessing
+import time
+
+from src.algorithms.portfolio import SharedTermination
+from src.algorithms.termination import EVENT_POLL_INTERVAL
+
+
+def test_shared_target_stops_other_solvers():
+    incumbent = multiprocessing.Value('d', -float('inf'))
+    stop_event = multiprocessing.Event()
+    first = SharedTermination(incumbent, 10.0, stop_event=stop_event)
+    second = SharedTermination(incumbent, 10.0, stop_event=stop_event)
+
+    assert not second.check(3.0)
+    assert first.check(12.0)
+    assert incumbent.value == 12.0 and stop_event.is_set()
+    # Le second solveur voit la valeur partagée à sa prochaine consultation
+    time.sleep(EVENT_POLL_INTERVAL)
+    assert second.check(4.0)
+    assert second.stop_reason == 'target'
+
+
+def test_improvements_are_published_during_run():
+    incumbent = multiprocessing.Value('d', -float('inf'))
+    termination = SharedTermination(incumbent)
+    termination.check(5.0)
+    assert incumbent.value == 5.0
+    assert termination.replace(max_evaluations=10).incumbent is incumbent
@@ -0,0 +1,19 @@
+"""
+Tests du profilage des solveurs (run(profile=True))
+"""
+
+import pytest
+
+from src.algorithms.hill_climbing import HillClimbing
+from src.problems.tsp import TSPProblem
+
+
+@pytest.mark.parametrize('representation', ['list', 'array'])
+def test_hill_climbing_profile_counts_accepted_moves(representation):
+    problem = TSPProblem.generate_random(50, seed=1, representation=representation)
+    algorithm = HillClimbing(problem, seed=0)
+    profile = algorithm.run(profile=True)['profile']
+    history = algorithm.convergence_history
+    improvements = sum(1 for a, b in zip(history, history[1:]) if b > a)
+    assert profile['moves_accepted'] == improvements > 0
+    assert profile['phases_ms']['neighbors'] > 0
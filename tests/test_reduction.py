@@ -0,0 +1,30 @@
+"""
+Tests de la réduction du sac à dos (fixation de variables)
+"""
+
+import pytest
+
+from src.algorithms.dynamic_programming import DynamicProgramming
+from src.problems.knapsack import KnapsackProblem
+from src.problems.reduction import reduce_knapsack
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_reduction_keeps_optimum(seed):
+    problem = KnapsackProblem.generate_random(60, seed=seed)
+    optimum = DynamicProgramming(problem).run()['best_value']
+    reduction = reduce_knapsack(problem)
+    if reduction.residual.n:
+        residual = DynamicProgramming(reduction.residual).run()
+        solution = reduction.lift(residual['solution'])
+        assert residual['best_value'] + reduction.fixed_value == optimum
+    else:
+        solution = reduction.lift([])
+    assert problem.evaluate(solution) == optimum
+
+
+def test_everything_fits():
+    problem = KnapsackProblem([1, 2, 3], [4, 5, 6], 10)
+    reduction = reduce_knapsack(problem)
+    assert reduction.residual.n == 0 and reduction.reduction_ratio == 1.0
+    assert reduction.lift([]) == [1, 1, 1]
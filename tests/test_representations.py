@@ -0,0 +1,69 @@
+"""
+Tests des représentations compactes des solutions
+"""
+
+import pickle
+import random
+from array import array
+
+import numpy as np
+import pytest
+
+from src.problems.knapsack import KnapsackArray, KnapsackBitset, KnapsackProblem
+from src.problems.tsp import TSPArrayTour, TSPProblem
+
+
+@pytest.mark.parametrize('representation, solution_type',
+                         [('array', KnapsackArray), ('bitset', KnapsackBitset)])
+def test_knapsack_compact_solution(representation, solution_type):
+    problem = KnapsackProblem.generate_random(37, seed=3, representation=representation)
+    reference = KnapsackProblem(problem.weights, problem.values, problem.capacity)
+    solution = problem.random_solution(random.Random(0))
+    assert isinstance(solution, solution_type)
+
+    # Aller-retour liste <-> représentation compacte
+    bits = list(solution)
+    rebuilt = problem.make_solution(bits)
+    assert isinstance(rebuilt, solution_type) and list(rebuilt) == bits
+    assert (rebuilt.weight, rebuilt.value) == (solution.weight, solution.value)
+    assert np.array_equal(np.asarray(solution), bits)
+
+    copy = pickle.loads(pickle.dumps(solution))
+    assert isinstance(copy, solution_type) and list(copy) == bits
+    assert (copy.weight, copy.value) == (solution.weight, solution.value)
+
+    rng = random.Random(1)
+    for _ in range(200):
+        move = problem.random_move(solution, rng)
+        if problem.move_delta(solution, move) > -float('inf'):
+            solution = problem.apply_move(solution, move)
+        assert problem.evaluate(solution) == reference.evaluate(list(solution))
+    assert list(copy) == bits  # Copie indépendante
+    assert problem.evaluate(pickle.loads(pickle.dumps(solution))) == problem.evaluate(solution)
+
+
+@pytest.mark.parametrize('neighborhood, tour_type', [('random', array), ('knn', TSPArrayTour)])
+def test_tsp_array_tour(neighborhood, tour_type):
+    problem = TSPProblem.generate_random(25, seed=4, representation='array',
+                                         neighborhood=neighborhood)
+    reference = TSPProblem(problem.cities)
+    tour = problem.random_solution(random.Random(0))
+    assert type(tour) is tour_type
+    assert problem.encode(list(tour)) == tour
+
+    copy = pickle.loads(pickle.dumps(tour))
+    assert type(copy) is tour_type and copy == tour
+    if tour_type is TSPArrayTour:
+        assert copy.pos == tour.pos
+
+    rng = random.Random(1)
+    for _ in range(200):
+        move = problem.random_move(tour, rng)
+        expected = problem.evaluate(tour) + problem.move_delta(tour, move)
+        tour = problem.apply_move(tour, move)
+        assert sorted(tour) == list(range(25))
+        if tour_type is TSPArrayTour:
+            assert all(tour[tour.pos[city]] == city for city in range(25))
+        assert problem.evaluate(tour) == pytest.approx(expected)
+        assert problem.evaluate(tour) == pytest.approx(reference.evaluate(list(tour)))
+    assert copy != tour and sorted(copy) == list(range(25))
@@ -0,0 +1,56 @@
+"""
+Tests des flux aléatoires par algorithme
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.simulated_annealing import SimulatedAnnealing
+from src.algorithms.tabu_search import TabuSearch
+from src.problems.knapsack import KnapsackProblem
+from src.utils.rng import make_rng, seed_sequence, spawn_seeds
+
+ALGORITHMS = [SimulatedAnnealing, TabuSearch, GeneticAlgorithm]
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_same_seed_same_result(algorithm):
+    problem = KnapsackProblem.generate_random(40, seed=1)
+    runs = []
+    for _ in range(2):
+        # Le module random global ne doit pas influencer une exécution graine fixée
+        random.seed(len(runs))
+        result = algorithm(problem, seed=7).run()
+        runs.append((list(result['solution']), result['best_value']))
+    assert runs[0] == runs[1]
+
+
+def test_runs_leave_global_random_untouched():
+    problem = KnapsackProblem.generate_random(40, seed=1)
+    random.seed(0)
+    expected = random.random()
+    random.seed(0)
+    SimulatedAnnealing(problem, seed=3).run()
+    assert random.random() == expected
+
+
+def test_spawned_streams_are_independent():
+    seeds = spawn_seeds(seed_sequence(42), 4)
+    assert seeds == spawn_seeds(seed_sequence(42), 4)
+    assert len(set(seeds)) == 4
+    draws = [[make_rng(seed).random() for _ in range(5)] for seed in seeds]
+    assert len({tuple(d) for d in draws}) == 4
+    # Enfants distincts du flux parent
+    assert make_rng(42).random() not in {d[0] for d in draws}
+    assert np.random.default_rng(seeds[0]).random() != np.random.default_rng(seeds[1]).random()
+
+
+def test_algorithm_spawn_seeds_follow_seed():
+    problem = KnapsackProblem.generate_random(10, seed=1)
+    assert (SimulatedAnnealing(problem, seed=5).spawn_seeds(3) ==
+            SimulatedAnnealing(problem, seed=5).spawn_seeds(3))
+    assert (SimulatedAnnealing(problem, seed=5).spawn_seeds(3) !=
+            SimulatedAnnealing(problem, seed=6).spawn_seeds(3))
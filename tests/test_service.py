@@ -0,0 +1,142 @@
+"""
+Tests du service de résolution (un processus de travail)
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.service import SolverService, make_server
+
+PROBLEM = {'type': 'knapsack', 'random': {'n': 30, 'seed': 0}}
+
+# Tâche courte et tâche qui ne s'arrête que sur annulation (ou time_limit)
+QUICK = {'problem': PROBLEM, 'algorithm': 'hill_climbing', 'seed': 0,
+         'params': {'max_iterations': 100}}
+LONG = {'problem': PROBLEM, 'algorithm': 'simulated_annealing', 'seed': 0,
+        'params': {'cooling_rate': 0.99999, 'min_temp': 1e-9},
+        'termination': {'time_limit': 30}}
+
+
+@pytest.fixture
+def service():
+    with SolverService(processes=1) as service:
+        yield service
+
+
+def _wait_status(service, job_id, status, timeout=10.0):
+    end = time.time() + timeout
+    while service.status(job_id)['status'] != status:
+        assert time.time() < end, service.status(job_id)
+        time.sleep(0.01)
+
+
+def test_done(service):
+    job_id = service.submit(QUICK)
+    result = service.result(job_id, timeout=10)
+    assert result is not None and result['stop_reason'] == 'completed'
+    info = service.status(job_id)
+    assert info['status'] == 'done' and info['best_value'] == result['best_value']
+
+
+def test_cancel_running_job_keeps_best_solution(service):
+    job_id = service.submit(LONG)
+    _wait_status(service, job_id, 'running')
+    service.cancel(job_id)
+    result = service.result(job_id, timeout=10)
+    assert result['stop_reason'] == 'stopped'
+    assert service.status(job_id)['status'] == 'cancelled'
+
+
+def test_cancel_queued_job(service):
+    running = service.submit(LONG)
+    queued = service.submit(QUICK)
+    assert service.cancel(queued)['status'] == 'cancelled'
+    assert service.result(queued, timeout=0) is None
+    service.cancel(running)
+
+
+def test_queued_job_expires_at_deadline(service):
+    running = service.submit(LONG)
+    queued = service.submit(dict(QUICK, deadline=0.05))
+    assert service.result(queued, timeout=5) is None
+    assert service.status(queued)['status'] == 'expired'
+    service.cancel(running)
+    assert service.result(running, timeout=10) is not None
+
+
+def test_bad_params_fail(service):
+    job_id = service.submit(dict(QUICK, params={'no_such_param': 1}))
+    assert service.result(job_id, timeout=10) is None
+    info = service.status(job_id)
+    assert info['status'] == 'failed' and 'TypeError' in info['error']
+
+
+def test_invalid_job_rejected_at_submit(service):
+    with pytest.raises(ValueError):
+        service.submit(dict(QUICK, algorithm='unknown'))
+
+
+def test_pool_restarts_after_worker_death(service):
+    job_id = service.submit(LONG)
+    _wait_status(service, job_id, 'running')
+    for pid in list(service._executor._processes):
+        os.kill(pid, signal.SIGKILL)
+    service.result(job_id, timeout=10)
+    info = service.status(job_id)
+    assert info['status'] == 'failed' and 'processus de travail perdu' in info['error']
+
+    job_id = service.submit(QUICK)
+    assert service.result(job_id, timeout=10) is not None
+    assert service.status(job_id)['status'] == 'done'
+
+
+def test_stats(service):
+    running = service.submit(LONG)
+    _wait_status(service, running, 'running')
+    queued = service.submit(QUICK)
+    failed = service.submit(dict(QUICK, params={'no_such_param': 1}))
+    assert service.stats() == {
+        'processes': 1,
+        'jobs': {'queued': 2, 'running': 1, 'done': 0, 'cancelled': 0,
+                 'expired': 0, 'failed': 0}}
+
+    service.cancel(running)
+    for job_id in (running, queued, failed):
+        service.result(job_id, timeout=10)
+    assert service.stats()['jobs'] == {'queued': 0, 'running': 0, 'done': 1,
+                                       'cancelled': 1, 'expired': 0, 'failed': 1}
+
+
+def test_http_round_trip(service):
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        request = urllib.request.Request(
+            f"{base}/jobs", data=json.dumps(QUICK).encode(), method='POST',
+            headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=10) as response:
+            assert response.status == 202
+            job_id = json.load(response)['id']
+        with urllib.request.urlopen(f"{base}/jobs/{job_id}/result?wait=10",
+                                    timeout=20) as response:
+            assert response.status == 200
+            result = json.load(response)
+        assert result['best_value'] == service.result(job_id)['best_value']
+        with urllib.request.urlopen(f"{base}/health", timeout=10) as response:
+            assert json.load(response)['jobs']['done'] == 1
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{base}/jobs/999", timeout=10)
+        assert error.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,38 @@
+"""
+Tests des k plus proches voisins (grille et matrice)
+"""
+
+import numpy as np
+import pytest
+
+from src.problems.distances import distance_matrix
+from src.problems.spatial import k_nearest_neighbors, matrix_nearest_neighbors
+from src.problems.tsp import TSPProblem
+
+
+def _brute_force(coords, k):
+    matrix = distance_matrix(coords)
+    np.fill_diagonal(matrix, np.inf)
+    return np.argsort(matrix, axis=1, kind='stable')[:, :k]
+
+
+@pytest.mark.parametrize('n, k', [(5, 8), (50, 4), (300, 8)])
+def test_grid_matches_brute_force(n, k):
+    coords = np.random.default_rng(n).uniform(0, 1000, (n, 2))
+    expected = _brute_force(coords, min(k, n - 1))
+    assert np.array_equal(k_nearest_neighbors(coords, k), expected)
+    assert np.array_equal(matrix_nearest_neighbors(distance_matrix(coords), k), expected)
+
+
+def test_clustered_points():
+    # Grappes denses et points isolés: l'anneau de la grille doit s'élargir
+    rng = np.random.default_rng(1)
+    coords = np.vstack([rng.normal(0, 1, (100, 2)), rng.normal(500, 1, (100, 2)),
+                        rng.uniform(-1000, 1000, (10, 2))])
+    assert np.array_equal(k_nearest_neighbors(coords, 6), _brute_force(coords, 6))
+
+
+def test_tsp_candidates_are_nearest_cities():
+    problem = TSPProblem.generate_random(120, seed=4, neighborhood='knn', k_neighbors=5)
+    expected = _brute_force(problem.cities, 5)
+    assert np.array_equal(np.array(problem.candidates), expected)
@@ -0,0 +1,79 @@
+"""
+Tests de l'exécution pas à pas (SolverStream)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.algorithms.simulated_annealing import SimulatedAnnealing
+from src.problems.knapsack import KnapsackProblem
+
+
+def _annealing(**params):
+    problem = KnapsackProblem.generate_random(30, seed=0)
+    params.setdefault('iterations_per_temp', 10)
+    return SimulatedAnnealing(problem, seed=0, **params)
+
+
+def test_snapshots_in_order_and_result_matches_run():
+    stream = _annealing().iterate()
+    snapshots = list(stream)
+    assert [s.iteration for s in snapshots] == list(range(1, len(snapshots) + 1))
+    best = [s.best_value for s in snapshots]
+    assert best == sorted(best)
+    elapsed = [s.elapsed for s in snapshots]
+    assert elapsed == sorted(elapsed)
+    evaluations = [s.evaluations for s in snapshots]
+    assert evaluations == sorted(evaluations)
+
+    result = _annealing().run()
+    assert snapshots[-1].best_value == result['best_value']
+    assert stream.result['solution'] == result['solution']
+    assert stream.result['stop_reason'] == result['stop_reason'] == 'completed'
+
+
+def test_every_keeps_one_snapshot_out_of_n():
+    all_snapshots = list(_annealing().iterate())
+    stream = _annealing().iterate(every=3)
+    snapshots = list(stream)
+    assert [s.iteration for s in snapshots] == list(range(3, len(all_snapshots) + 1, 3))
+    assert [s.best_value for s in snapshots] == [s.best_value for s in all_snapshots[2::3]]
+    assert stream.done and stream.result['best_value'] == all_snapshots[-1].best_value
+
+
+def test_cancel_stops_at_next_step():
+    stream = _annealing(cooling_rate=0.9999, min_temp=1e-9).iterate()
+    first = next(stream)
+    stream.cancel()
+    assert list(stream) == []
+    assert stream.done
+    assert stream.result['stop_reason'] == 'stopped'
+    assert stream.result['best_value'] >= first.best_value
+
+
+def test_async_iteration_matches_sync():
+    async def collect():
+        return [s.best_value async for s in _annealing().iterate()]
+
+    assert asyncio.run(collect()) == [s.best_value for s in _annealing().iterate()]
+
+
+def test_cancelled_task_stops_execution():
+    # Sans arrêt, le recuit tournerait plusieurs minutes
+    stream = _annealing(cooling_rate=0.99999, min_temp=1e-9).iterate()
+
+    async def cancel_task():
+        task = asyncio.create_task(stream.afinish())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_task())
+    deadline = time.perf_counter() + 5.0
+    while not stream.done and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert stream.done
+    assert stream.result['stop_reason'] == 'stopped'
@@ -0,0 +1,38 @@
+"""
+Tests de la recherche tabou
+"""
+
+from src.algorithms.tabu_search import TabuSearch
+from src.problems.base import OptimizationProblem
+
+
+class IntegerLine(OptimizationProblem):
+    """Entier x dans [-5, 0] (solution [x]), maximum en -2; sans mouvements"""
+
+    def __init__(self, seed=None):
+        super().__init__("IntegerLine", seed)
+
+    def evaluate(self, solution):
+        return -abs(solution[0] + 2)
+
+    def is_feasible(self, solution):
+        return -5 <= solution[0] <= 0
+
+    def random_solution(self, rng=None):
+        return [(rng or self.rng).randint(-5, 0)]
+
+    def get_neighbor(self, solution, rng=None):
+        step = (rng or self.rng).choice((-1, 1))
+        return [min(0, max(-5, solution[0] + step))]
+
+
+def test_tabu_keys_are_exact_solutions():
+    # hash(-1) == hash(-2): des clés par hachage rendraient ces solutions
+    # taboues ensemble
+    assert hash((-1,)) == hash((-2,))
+    problem = IntegerLine(seed=0)
+    search = TabuSearch(problem, max_iterations=20, tabu_tenure=3, seed=0)
+    result = search.run()
+    assert result['best_value'] == 0
+    assert problem.solution_key([-1]) != problem.solution_key([-2])
+    assert set(search.tabu_until) <= {problem.solution_key([x]) for x in range(-5, 1)}
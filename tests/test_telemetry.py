@@ -0,0 +1,86 @@
+"""
+Tests de la télémétrie
+"""
+
+import json
+import os
+import threading
+
+from src.utils.logger import Telemetry
+
+
+def test_concurrent_record_keeps_sequence_order():
+    telemetry = Telemetry(capacity=100000)
+
+    def emit(source):
+        channel = telemetry.channel(source)
+        for i in range(2000):
+            channel.close(i, i)
+
+    threads = [threading.Thread(target=emit, args=(f"s{k}",)) for k in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seqs = [event['seq'] for event in telemetry.events()]
+    assert seqs == sorted(seqs) == list(range(8000))
+
+
+def test_dropped_counts_evicted_events():
+    telemetry = Telemetry(capacity=10)
+    channel = telemetry.channel('s')
+    for i in range(25):
+        channel.close(i)
+    telemetry.flush()
+    assert telemetry.dropped == 15
+    for i in range(5):
+        channel.close(i)
+    telemetry.flush()
+    assert telemetry.dropped == 15
+
+
+def test_jsonl_export_is_valid_json(tmp_path):
+    path = tmp_path / 'runs.jsonl'
+    with Telemetry(str(path)) as telemetry:
+        telemetry.channel('s').close(float('-inf'), 0)
+    text = path.read_text()
+    assert 'Infinity' not in text
+    event = json.loads(text)
+    assert event['best_value'] is None
+
+
+def test_prometheus_export_keeps_latest_values(tmp_path):
+    path = tmp_path / 'solver.prom'
+    telemetry = Telemetry(str(path), format='prometheus', sample_every=1)
+    annealing = telemetry.channel('SA "fast"')
+    genetic = telemetry.channel('GA')
+    annealing.emit(float('-inf'), 10, temperature=5.0)
+    annealing.emit(3.0, 20, temperature=2.5)
+    genetic.close(7.0, 40)
+    telemetry.channel('HC').emit(float('-inf'))
+    telemetry.flush()
+    telemetry.flush()
+
+    lines = path.read_text().splitlines()
+    assert os.listdir(tmp_path) == ['solver.prom']
+    samples = {}
+    current_type = None
+    for line in lines:
+        if line.startswith('# TYPE '):
+            _, _, current_type, kind = line.split()
+            assert kind == 'gauge'
+            continue
+        name_labels, value = line.rsplit(' ', 1)
+        assert name_labels.startswith(current_type + '{')
+        samples[name_labels] = float(value)
+
+    sa = 'source="SA \\"fast\\"",run="0"'
+    assert samples[f'solver_best_value{{{sa}}}'] == 3.0
+    assert samples[f'solver_evaluations{{{sa}}}'] == 20
+    assert samples[f'solver_temperature{{{sa}}}'] == 2.5
+    assert samples['solver_best_value{source="GA",run="1"}'] == 7.0
+    assert 'solver_best_value{source="HC",run="2"} -Inf' in lines
+    # Champs non numériques ou d'identification exclus (final, seq, time)
+    names = {key.split('{')[0] for key in samples}
+    assert not names & {'solver_final', 'solver_seq', 'solver_time', 'solver_run'}
+    assert 'solver_temperature{source="GA",run="1"}' not in samples
@@ -0,0 +1,56 @@
+"""
+Tests des critères d'arrêt sur le recuit simulé
+"""
+
+import threading
+
+import pytest
+
+from src.algorithms.simulated_annealing import SimulatedAnnealing
+from src.algorithms.termination import Termination
+from src.problems.knapsack import KnapsackProblem
+
+
+def _set_event():
+    event = threading.Event()
+    event.set()
+    return event
+
+
+# Critères, paramètres du recuit, raison attendue
+CASES = [
+    ({}, dict(initial_temp=10.0, cooling_rate=0.5), 'completed'),
+    ({'target': 1.0}, {}, 'target'),
+    ({'max_evaluations': 50}, {}, 'evaluations'),
+    ({'patience': 5}, dict(cooling_rate=0.9999, min_temp=1e-9), 'stagnation'),
+    ({'time_limit': 0.0}, {}, 'deadline'),
+    ({'stop_event': _set_event()}, {}, 'stopped'),
+]
+
+
+@pytest.mark.parametrize('criteria, params, reason', CASES,
+                         ids=[case[2] for case in CASES])
+def test_stop_reason(criteria, params, reason):
+    problem = KnapsackProblem.generate_random(30, seed=0)
+    algorithm = SimulatedAnnealing(problem, iterations_per_temp=10, seed=0,
+                                   termination=Termination(**criteria), **params)
+    result = algorithm.run()
+    assert result['stop_reason'] == reason
+    assert problem.evaluate(result['solution']) == result['best_value']
+    if reason == 'target':
+        assert result['best_value'] >= criteria['target']
+    elif reason == 'evaluations':
+        # Dépassement d'au plus une itération
+        assert 50 <= algorithm.termination.evaluations <= 50 + 10 + 1
+
+
+def test_request_stop():
+    problem = KnapsackProblem.generate_random(30, seed=0)
+    algorithm = SimulatedAnnealing(problem, cooling_rate=0.9999, min_temp=1e-9,
+                                   iterations_per_temp=10, seed=0)
+    stream = algorithm.iterate()
+    next(stream)
+    stream.cancel()
+    result = stream.finish()
+    assert result['stop_reason'] == 'stopped'
+    assert algorithm.termination.iterations <= 2
@@ -0,0 +1,58 @@
+"""
+Tests de l'algorithme génétique vectorisé
+"""
+
+import numpy as np
+import pytest
+
+from src.algorithms.vectorized_ga import VectorizedGeneticAlgorithm
+from src.problems.knapsack import KnapsackProblem
+from src.problems.tsp import TSPProblem
+
+PROBLEMS = [KnapsackProblem.generate_random(40, seed=3),
+            TSPProblem.generate_random(25, seed=3)]
+
+
+@pytest.mark.parametrize('problem', PROBLEMS)
+def test_same_seed_same_result(problem):
+    first = VectorizedGeneticAlgorithm(problem, generations=20, seed=5).run()
+    second = VectorizedGeneticAlgorithm(problem, generations=20, seed=5).run()
+    assert first['solution'] == second['solution']
+    assert first['best_value'] == second['best_value']
+
+
+@pytest.mark.parametrize('problem', PROBLEMS)
+def test_best_value_matches_evaluate(problem):
+    result = VectorizedGeneticAlgorithm(problem, generations=20, seed=0).run()
+    assert result['best_value'] == pytest.approx(problem.evaluate(result['solution']))
+    assert problem.is_feasible(result['solution'])
+
+
+def test_order_crossover_gives_permutations():
+    rng = np.random.default_rng(0)
+    n, m = 30, 200
+    p1 = rng.permuted(np.tile(np.arange(n), (m, 1)), axis=1)
+    p2 = rng.permuted(np.tile(np.arange(n), (m, 1)), axis=1)
+    cuts = np.sort(rng.integers(0, n, size=(m, 2)), axis=1)
+    child = VectorizedGeneticAlgorithm._order_crossover(p1, p2, cuts)
+    assert (np.sort(child, axis=1) == np.arange(n)).all()
+    for row in range(m):
+        i, j = cuts[row]
+        assert (child[row, i:j + 1] == p1[row, i:j + 1]).all()
+
+
+def test_repair_gives_feasible_greedy_fill():
+    problem = KnapsackProblem.generate_random(40, seed=7)
+    ga = VectorizedGeneticAlgorithm(problem, seed=0)
+    population = np.random.default_rng(1).integers(0, 2, size=(300, 40)).astype(np.uint8)
+    original = population.copy()
+    ga._repair(population)
+
+    weights = problem.weights_array
+    loads = population @ weights
+    assert (loads <= problem.capacity).all()
+    assert (population <= original).all()  # Seuls des objets retirés
+    for row in np.nonzero((original @ weights) > problem.capacity)[0]:
+        # Aucun objet retiré ne tiendrait encore
+        dropped = np.nonzero(original[row] & ~population[row])[0]
+        assert (weights[dropped] > problem.capacity - loads[row]).all()